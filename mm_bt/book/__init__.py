@@ -1,11 +1,13 @@
-"""Order book interface and reference implementation."""
+"""Order book interface and implementations."""
 
 from __future__ import annotations
 
 from mm_bt.book.api import Book
+from mm_bt.book.book_array import BookArray
 from mm_bt.book.book_py import BookPy
 
 __all__ = [
     "Book",
+    "BookArray",
     "BookPy",
 ]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Protocol
 
+from mm_bt.core.errors import SchemaError
 from mm_bt.core.types import Lots, Side, Ticks
 from mm_bt.evlog.types import L2Batch
 
@@ -25,3 +27,24 @@ class Book(Protocol):
     ) -> tuple[tuple[Ticks, ...], tuple[Lots, ...]]:
         """Return price/size levels up to depth for a side."""
 
+
+def validate_l2_columns(
+    prices: Sequence[int], amounts: Sequence[int], sides: Sequence[int]
+) -> None:
+    """Validate columnar L2 updates once per batch instead of per update."""
+    n = len(prices)
+    if len(amounts) != n or len(sides) != n:
+        raise SchemaError("L2 column length mismatch")
+    if n == 0:
+        return
+    low = min(prices)
+    if low <= 0:
+        raise SchemaError(f"non-positive price: {low}")
+    low = min(amounts)
+    if low < 0:
+        raise SchemaError(f"negative amount: {low}")
+    low = min(sides)
+    high = max(sides)
+    if low < Side.BID or high > Side.ASK:
+        bad = low if low < Side.BID else high
+        raise SchemaError(f"unknown side: {bad}")
@@ -0,0 +1,248 @@
+"""Array-indexed L2 book (price ladder + occupancy bitmap).
+
+Sizes live in a contiguous `array('q')` per side indexed by
+`price - anchor`; a parallel `array('Q')` of 64-bit words marks occupied
+levels, so best-price discovery scans whole words instead of levels. Each
+side also keeps a word hint bounding where its best level can be (no bid
+bits above the bid hint, no ask bits below the ask hint); inserts tighten
+it and scans restart from it, so a refresh after a delete usually touches
+one word. The ladder starts at `capacity` ticks around the first price and
+is re-anchored (doubling capacity) when an update falls outside it; prices
+that would need more than `_MAX_CAPACITY` ticks are rejected rather than
+dropped.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from mm_bt.book.api import validate_l2_columns
+from mm_bt.core.errors import SchemaError
+from mm_bt.core.types import Lots, SIDE_ASK, SIDE_BID, Side, Ticks
+from mm_bt.evlog.types import L2Batch, L2Update
+
+_WORD_BITS = 64
+_DEFAULT_CAPACITY = 4096
+_MAX_CAPACITY = 1 << 24
+
+
+def _zeros(typecode: str, n: int) -> array:
+    return array(typecode, [0]) * n
+
+
+def _lowest_set(word: int) -> int:
+    return (word & -word).bit_length() - 1
+
+
+def _highest_set(word: int) -> int:
+    return word.bit_length() - 1
+
+
+class BookArray:
+    def __init__(
+        self,
+        *,
+        reject_crossed: bool = True,
+        capacity: int = _DEFAULT_CAPACITY,
+    ) -> None:
+        if capacity < _WORD_BITS or capacity & (capacity - 1):
+            raise SchemaError("capacity must be a power of two >= 64")
+        if capacity > _MAX_CAPACITY:
+            raise SchemaError("capacity too large")
+        self._reject_crossed = reject_crossed
+        self._initial_capacity = capacity
+        self.reset()
+
+    def reset(self) -> None:
+        capacity = self._initial_capacity
+        self._anchor: int | None = None
+        self._capacity = capacity
+        self._bid_sizes = _zeros("q", capacity)
+        self._ask_sizes = _zeros("q", capacity)
+        self._bid_bits = _zeros("Q", capacity // _WORD_BITS)
+        self._ask_bits = _zeros("Q", capacity // _WORD_BITS)
+        self._bid_hint = -1
+        self._ask_hint = capacity // _WORD_BITS
+
+    def apply_l2_batch(self, batch: L2Batch) -> None:
+        if batch.resets_book:
+            self.reset()
+        for update in batch.updates:
+            self._apply_update(update)
+        if self._reject_crossed:
+            self._check_crossed()
+
+    def apply_l2_batch_arrays(
+        self,
+        prices: Sequence[int],
+        amounts: Sequence[int],
+        sides: Sequence[int],
+        resets: bool,
+    ) -> None:
+        """Apply a batch given as parallel int columns (sides: 0=bid, 1=ask)."""
+        validate_l2_columns(prices, amounts, sides)
+        if resets:
+            self.reset()
+        apply_level = self._apply_level
+        for price, amount, side in zip(prices, amounts, sides):
+            apply_level(side, price, amount)
+        if self._reject_crossed:
+            self._check_crossed()
+
+    def _apply_update(self, update: L2Update) -> None:
+        price = int(update.price_ticks)
+        amount = int(update.amount_lots)
+        if price <= 0:
+            raise SchemaError(f"non-positive price: {price}")
+        if amount < 0:
+            raise SchemaError(f"negative amount: {amount}")
+
+        if update.side == SIDE_BID:
+            self._apply_level(False, price, amount)
+        elif update.side == SIDE_ASK:
+            self._apply_level(True, price, amount)
+        else:
+            raise SchemaError(f"unknown side: {update.side}")
+
+    def _apply_level(self, is_ask: int, price: int, amount: int) -> None:
+        if self._anchor is None:
+            self._anchor = price - self._capacity // 2
+        idx = price - self._anchor
+        if idx < 0 or idx >= self._capacity:
+            if amount == 0:
+                # Nothing can be stored outside the ladder, so nothing to delete.
+                return
+            self._grow(price)
+            idx = price - self._anchor
+        word = idx >> 6
+        if is_ask:
+            self._ask_sizes[idx] = amount
+            if amount:
+                self._ask_bits[word] |= 1 << (idx & 63)
+                if word < self._ask_hint:
+                    self._ask_hint = word
+            else:
+                self._ask_bits[word] &= ~(1 << (idx & 63))
+        else:
+            self._bid_sizes[idx] = amount
+            if amount:
+                self._bid_bits[word] |= 1 << (idx & 63)
+                if word > self._bid_hint:
+                    self._bid_hint = word
+            else:
+                self._bid_bits[word] &= ~(1 << (idx & 63))
+
+    def _grow(self, price: int) -> None:
+        anchor = self._anchor
+        capacity = self._capacity
+        lo = min(anchor, price)
+        hi = max(anchor + capacity - 1, price)
+        need = hi - lo + 1
+        new_capacity = capacity * 2
+        while new_capacity < need + 2 * _WORD_BITS:
+            new_capacity *= 2
+        if new_capacity > _MAX_CAPACITY:
+            raise SchemaError(f"price outside book ladder range: {price}")
+        # Keep the old ladder word-aligned inside the new one so the bitmaps
+        # can be copied by slice.
+        shift = anchor - lo + (new_capacity - need) // 2
+        shift += -shift % _WORD_BITS
+        word_shift = shift // _WORD_BITS
+        words = capacity // _WORD_BITS
+
+        for name, typecode, start, length, size in (
+            ("_bid_sizes", "q", shift, capacity, new_capacity),
+            ("_ask_sizes", "q", shift, capacity, new_capacity),
+            ("_bid_bits", "Q", word_shift, words, new_capacity // _WORD_BITS),
+            ("_ask_bits", "Q", word_shift, words, new_capacity // _WORD_BITS),
+        ):
+            grown = _zeros(typecode, size)
+            grown[start : start + length] = getattr(self, name)
+            setattr(self, name, grown)
+        self._anchor = anchor - shift
+        self._capacity = new_capacity
+        self._bid_hint += word_shift
+        self._ask_hint += word_shift
+
+    def _best_bid_idx(self) -> int | None:
+        bits = self._bid_bits
+        w = self._bid_hint
+        while w >= 0 and not bits[w]:
+            w -= 1
+        self._bid_hint = w
+        if w < 0:
+            return None
+        return w * _WORD_BITS + _highest_set(bits[w])
+
+    def _best_ask_idx(self) -> int | None:
+        bits = self._ask_bits
+        n = len(bits)
+        w = self._ask_hint
+        while w < n and not bits[w]:
+            w += 1
+        self._ask_hint = w
+        if w >= n:
+            return None
+        return w * _WORD_BITS + _lowest_set(bits[w])
+
+    def _check_crossed(self) -> None:
+        bid_idx = self._best_bid_idx()
+        ask_idx = self._best_ask_idx()
+        if bid_idx is None or ask_idx is None:
+            return
+        if bid_idx >= ask_idx:
+            raise SchemaError("crossed book")
+
+    def best_bid_ask(
+        self,
+    ) -> tuple[Ticks | None, Lots | None, Ticks | None, Lots | None]:
+        bid_idx = self._best_bid_idx()
+        if bid_idx is None:
+            bid_px = None
+            bid_qty = None
+        else:
+            bid_px = Ticks(self._anchor + bid_idx)
+            bid_qty = Lots(self._bid_sizes[bid_idx])
+
+        ask_idx = self._best_ask_idx()
+        if ask_idx is None:
+            ask_px = None
+            ask_qty = None
+        else:
+            ask_px = Ticks(self._anchor + ask_idx)
+            ask_qty = Lots(self._ask_sizes[ask_idx])
+
+        return bid_px, bid_qty, ask_px, ask_qty
+
+    def levels(
+        self, side: Side, depth: int
+    ) -> tuple[tuple[Ticks, ...], tuple[Lots, ...]]:
+        if depth <= 0:
+            return (), ()
+        if side == SIDE_BID:
+            sizes = self._bid_sizes
+            bits = self._bid_bits
+            words = range(self._bid_hint, -1, -1)
+            next_set = _highest_set
+        elif side == SIDE_ASK:
+            sizes = self._ask_sizes
+            bits = self._ask_bits
+            words = range(self._ask_hint, len(bits))
+            next_set = _lowest_set
+        else:
+            raise SchemaError(f"unknown side: {side}")
+
+        out_prices: list[Ticks] = []
+        out_sizes: list[Lots] = []
+        for w in words:
+            word = bits[w]
+            while word:
+                bit = next_set(word)
+                word ^= 1 << bit
+                idx = w * _WORD_BITS + bit
+                out_prices.append(Ticks(self._anchor + idx))
+                out_sizes.append(Lots(sizes[idx]))
+                if len(out_prices) >= depth:
+                    return tuple(out_prices), tuple(out_sizes)
+        return tuple(out_prices), tuple(out_sizes)
@@ -3,28 +3,25 @@
 Applies incremental level updates. `batch.resets_book` clears the full book
 before applying the batch; otherwise updates only touch referenced levels and
 explicit deletes (amount==0) remove that price level.
+
+Each side keeps a sorted key list ordered so the best level is the last
+element: bid keys are prices, ask keys are negated prices. Updates at or next
+to the top of book therefore append/pop at the tail instead of shifting the
+whole list. Deeper inserts/deletes shift only the keys above the touched
+level (a pointer memmove), which stays cheap at L2 depths; BookArray covers
+very deep or wide books without a sorted index at all.
 """
 
 from __future__ import annotations
 
 import bisect
+from collections.abc import Sequence
+from typing import cast
 
+from mm_bt.book.api import validate_l2_columns
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Lots, Side, Ticks
-from mm_bt.evlog.types import L2Batch, L2Update
-
-
-def _insert_price(prices: list[int], price: int) -> None:
-    idx = bisect.bisect_left(prices, price)
-    if idx < len(prices) and prices[idx] == price:
-        return
-    prices.insert(idx, price)
-
-
-def _remove_price(prices: list[int], price: int) -> None:
-    idx = bisect.bisect_left(prices, price)
-    if idx < len(prices) and prices[idx] == price:
-        prices.pop(idx)
+from mm_bt.core.types import Lots, SIDE_ASK, SIDE_BID, Side, Ticks
+from mm_bt.evlog.types import L2Batch
 
 
 class BookPy:
@@ -35,95 +32,141 @@ class BookPy:
     def reset(self) -> None:
         self._bids: dict[int, int] = {}
         self._asks: dict[int, int] = {}
-        self._bid_prices: list[int] = []
-        self._ask_prices: list[int] = []
+        self._bid_keys: list[int] = []
+        self._ask_keys: list[int] = []
+        self._top_dirty = False
+        self._top: tuple[
+            Ticks | None, Lots | None, Ticks | None, Lots | None
+        ] | None = None
+        # Indexed by Side value: (levels, sorted keys, key sign).
+        self._sides = (
+            (self._bids, self._bid_keys, 1),
+            (self._asks, self._ask_keys, -1),
+        )
 
     def apply_l2_batch(self, batch: L2Batch) -> None:
         if batch.resets_book:
             self.reset()
+        self._top = None
+        # Per-update validation and dispatch are inlined; locals are bound
+        # once per batch.
+        apply_level = self._apply_level
+        bid_side, ask_side = self._sides
         for update in batch.updates:
-            self._apply_update(update)
-        if self._reject_crossed:
+            price = update.price_ticks
+            amount = update.amount_lots
+            if price <= 0:
+                raise SchemaError(f"non-positive price: {price}")
+            if amount < 0:
+                raise SchemaError(f"negative amount: {amount}")
+            side = update.side
+            # Explicit comparisons: indexing _sides would take -1/-2 silently.
+            if side == SIDE_BID:
+                levels, keys, sign = bid_side
+            elif side == SIDE_ASK:
+                levels, keys, sign = ask_side
+            else:
+                raise SchemaError(f"unknown side: {side}")
+            apply_level(levels, keys, price, sign * price, amount)
+        if self._reject_crossed and self._top_dirty:
             self._check_crossed()
 
-    def _apply_update(self, update: L2Update) -> None:
-        price = int(update.price_ticks)
-        amount = int(update.amount_lots)
-        if price <= 0:
-            raise SchemaError(f"non-positive price: {price}")
-        if amount < 0:
-            raise SchemaError(f"negative amount: {amount}")
-
-        if update.side == Side.BID:
-            self._apply_level(self._bids, self._bid_prices, price, amount)
-        elif update.side == Side.ASK:
-            self._apply_level(self._asks, self._ask_prices, price, amount)
-        else:
-            raise SchemaError(f"unknown side: {update.side}")
+    def apply_l2_batch_arrays(
+        self,
+        prices: Sequence[int],
+        amounts: Sequence[int],
+        sides: Sequence[int],
+        resets: bool,
+    ) -> None:
+        """Apply a batch given as parallel int columns (sides: 0=bid, 1=ask)."""
+        validate_l2_columns(prices, amounts, sides)
+        if resets:
+            self.reset()
+        self._top = None
+        apply_level = self._apply_level
+        by_side = self._sides
+        for price, amount, side in zip(prices, amounts, sides):
+            levels, keys, sign = by_side[side]
+            apply_level(levels, keys, price, sign * price, amount)
+        if self._reject_crossed and self._top_dirty:
+            self._check_crossed()
 
-    @staticmethod
     def _apply_level(
+        self,
         levels: dict[int, int],
-        prices: list[int],
+        keys: list[int],
         price: int,
+        key: int,
         amount: int,
     ) -> None:
+        # The dict is authoritative for membership; the sorted key list is
+        # only touched when a level appears or disappears. Only tail changes
+        # move the best price, so only they mark the top dirty.
         if amount == 0:
-            if price in levels:
-                del levels[price]
-                _remove_price(prices, price)
+            if levels.pop(price, None) is not None:
+                if keys[-1] == key:
+                    keys.pop()
+                    self._top_dirty = True
+                else:
+                    del keys[bisect.bisect_left(keys, key)]
             return
+        if price not in levels:
+            if not keys or key > keys[-1]:
+                keys.append(key)
+                self._top_dirty = True
+            else:
+                bisect.insort(keys, key)
         levels[price] = amount
-        _insert_price(prices, price)
 
     def _check_crossed(self) -> None:
-        if not self._bid_prices or not self._ask_prices:
-            return
-        if self._bid_prices[-1] >= self._ask_prices[0]:
+        bid_keys = self._bid_keys
+        ask_keys = self._ask_keys
+        if bid_keys and ask_keys and bid_keys[-1] >= -ask_keys[-1]:
             raise SchemaError("crossed book")
+        # Cleared only after a passing check, so a crossed book keeps failing.
+        self._top_dirty = False
 
     def best_bid_ask(
         self,
     ) -> tuple[Ticks | None, Lots | None, Ticks | None, Lots | None]:
-        if not self._bid_prices:
-            bid_px = None
-            bid_qty = None
-        else:
-            bid_px_val = self._bid_prices[-1]
-            bid_px = Ticks(bid_px_val)
-            bid_qty = Lots(self._bids[bid_px_val])
-
-        if not self._ask_prices:
-            ask_px = None
-            ask_qty = None
-        else:
-            ask_px_val = self._ask_prices[0]
-            ask_px = Ticks(ask_px_val)
-            ask_qty = Lots(self._asks[ask_px_val])
-
-        return bid_px, bid_qty, ask_px, ask_qty
+        # Cached until the next apply/reset; strategies poll this far more
+        # often than the book changes.
+        if self._top is not None:
+            return self._top
+        # Ticks/Lots are NewTypes over int, so stored ints are returned as-is
+        # instead of being re-wrapped on every call.
+        bid_px: int | None = None
+        bid_qty: int | None = None
+        ask_px: int | None = None
+        ask_qty: int | None = None
+        if self._bid_keys:
+            bid_px = self._bid_keys[-1]
+            bid_qty = self._bids[bid_px]
+        if self._ask_keys:
+            ask_px = -self._ask_keys[-1]
+            ask_qty = self._asks[ask_px]
+        self._top = cast(
+            "tuple[Ticks | None, Lots | None, Ticks | None, Lots | None]",
+            (bid_px, bid_qty, ask_px, ask_qty),
+        )
+        return self._top
 
     def levels(
         self, side: Side, depth: int
     ) -> tuple[tuple[Ticks, ...], tuple[Lots, ...]]:
         if depth <= 0:
             return (), ()
+        # The best `depth` keys are a reversed tail slice, sized up front.
         if side == Side.BID:
-            prices = self._bid_prices
             levels = self._bids
-            ordered = reversed(prices)
+            prices = tuple(self._bid_keys[: -depth - 1 : -1])
         elif side == Side.ASK:
-            prices = self._ask_prices
             levels = self._asks
-            ordered = iter(prices)
+            prices = tuple([-key for key in self._ask_keys[: -depth - 1 : -1]])
         else:
             raise SchemaError(f"unknown side: {side}")
 
-        out_prices: list[Ticks] = []
-        out_sizes: list[Lots] = []
-        for price in ordered:
-            out_prices.append(Ticks(price))
-            out_sizes.append(Lots(levels[price]))
-            if len(out_prices) >= depth:
-                break
-        return tuple(out_prices), tuple(out_sizes)
+        return cast(
+            "tuple[tuple[Ticks, ...], tuple[Lots, ...]]",
+            (prices, tuple(map(levels.__getitem__, prices))),
+        )
@@ -3,18 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 
+from typing import TYPE_CHECKING
+
 from mm_bt.core.config import FailurePolicy, QuarantineAction
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.fixedpoint import Quantizer
-from mm_bt.ingest.compiler import compile_l2_csv
-from mm_bt.io.infer_increments import infer_l2_increments
-from mm_bt.io.instrument_meta import (
-    StaticJsonProvider,
-    TardisInstrumentMetaApiProvider,
-)
-from mm_bt.io.tardis_locator import TardisLocator
+
+# Compiler, IO and Decimal-heavy modules are imported where used so `--help`
+# and argument errors stay fast.
+if TYPE_CHECKING:
+    from mm_bt.core.fixedpoint import Quantizer
+    from mm_bt.io.instrument_meta import TardisInstrumentMetaApiProvider
 
 
 def _parse_args(argv: list[str] | None) -> argparse.Namespace:
@@ -55,12 +56,37 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
         "--quarantine-out",
         help="path to quarantine jsonl output",
     )
+    parser.add_argument(
+        "--strict-determinism",
+        action="store_true",
+        help="re-hash every input independently instead of trusting stat",
+    )
+    parser.add_argument(
+        "--reuse-existing",
+        action="store_true",
+        help="keep intact outputs of an identical earlier compile",
+    )
     return parser.parse_args(argv)
 
 
+@functools.lru_cache(maxsize=4)
+def _tardis_provider(
+    api_key: str | None, cache_path: str | None
+) -> TardisInstrumentMetaApiProvider:
+    # One provider per (key, cache) per process: the disk cache is loaded once
+    # and the provider memoizes resolved metadata across compiles.
+    from mm_bt.io.instrument_meta import TardisInstrumentMetaApiProvider
+
+    return TardisInstrumentMetaApiProvider(api_key=api_key, cache_path=cache_path)
+
+
 def _resolve_quantizer(
     args: argparse.Namespace, l2_paths: list[str]
 ) -> Quantizer:
+    from mm_bt.core.fixedpoint import Quantizer
+    from mm_bt.io.infer_increments import infer_l2_increments
+    from mm_bt.io.instrument_meta import StaticJsonProvider
+
     if args.instrument_meta is not None:
         if args.price_increment or args.amount_increment:
             raise SchemaError("cannot mix instrument meta with increments")
@@ -78,9 +104,9 @@ def _resolve_quantizer(
         )
 
     if args.exchange and args.symbol and args.date:
-        provider = TardisInstrumentMetaApiProvider(
-            api_key=args.tardis_api_key or os.getenv("TARDIS_API_KEY"),
-            cache_path=args.instrument_meta_cache,
+        provider = _tardis_provider(
+            args.tardis_api_key or os.getenv("TARDIS_API_KEY"),
+            args.instrument_meta_cache,
         )
         try:
             meta = provider.get(args.exchange, args.symbol, args.date)
@@ -102,6 +128,8 @@ def _resolve_l2_paths(args: argparse.Namespace) -> list[str]:
             raise SchemaError(
                 "exchange/symbol/date required for tardis locator"
             )
+        from mm_bt.io.tardis_locator import TardisLocator
+
         locator = TardisLocator(args.tardis_root)
         paths = locator.find(
             exchange=args.exchange,
@@ -122,6 +150,9 @@ def _output_prefix(args: argparse.Namespace) -> str | None:
 
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
+
+    from mm_bt.ingest.compiler import compile_l2_csv
+
     l2_paths = _resolve_l2_paths(args)
     quantizer = _resolve_quantizer(args, l2_paths)
     result = compile_l2_csv(
@@ -132,6 +163,8 @@ def main(argv: list[str] | None = None) -> int:
         quarantine_action=QuarantineAction(args.quarantine_action),
         quarantine_path=args.quarantine_out,
         output_prefix=_output_prefix(args),
+        strict_determinism=args.strict_determinism,
+        reuse_existing=args.reuse_existing,
     )
     print(
         f"evlog={result.evlog_path} index={result.index_path} "
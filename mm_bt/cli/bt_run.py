@@ -6,13 +6,9 @@ import argparse
 
 from mm_bt.core.errors import SchemaError
 from mm_bt.core.types import Lots, QuoteAtoms
-from mm_bt.sim.exchange import RunConfig, run_backtest
-from mm_bt.sim.fees import FixedBpsFeeModel
-from mm_bt.sim.tape import TapeWriter
-from mm_bt.strategy.dummy import (
-    AlternatingMarketOrderStrategy,
-    RandomMarketOrderStrategy,
-)
+
+# The sim stack and strategies are imported inside the functions that use
+# them so `--help` and argument errors return without loading them.
 
 
 def _parse_args(argv: list[str] | None) -> argparse.Namespace:
@@ -75,6 +71,11 @@ def _parse_float(value: str, field: str) -> float:
 
 
 def _resolve_strategy(args: argparse.Namespace):
+    from mm_bt.strategy.dummy import (
+        AlternatingMarketOrderStrategy,
+        RandomMarketOrderStrategy,
+    )
+
     if args.strategy == "dummy":
         qty = _parse_int(args.qty_lots, "qty-lots")
         return AlternatingMarketOrderStrategy(Lots(qty))
@@ -102,6 +103,10 @@ def main(argv: list[str] | None = None) -> int:
     sr_benchmark = _parse_float(args.sr_benchmark, "sr-benchmark")
     dsr_trials = _parse_int(args.dsr_trials, "dsr-trials")
 
+    from mm_bt.sim.exchange import RunConfig, run_backtest
+    from mm_bt.sim.fees import FixedBpsFeeModel
+    from mm_bt.sim.tape import TapeWriter
+
     strategy = _resolve_strategy(args)
     config = RunConfig(
         initial_cash=QuoteAtoms(initial_cash),
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import argparse
 import os
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date as Date
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.io.tardis_download import (
-    DownloadNotFound,
-    build_download_plan,
-    download_tardis_csv_gz,
-)
+
+# The download module is imported where used so `--help` stays fast.
+if TYPE_CHECKING:
+    from mm_bt.io.tardis_download import DownloadPlan
 
 
 def _parse_args(argv: list[str] | None) -> argparse.Namespace:
@@ -67,6 +69,12 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
         action="store_true",
         help="skip incremental_book_L2 header validation",
     )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="number of downloads to run in parallel",
+    )
     p.add_argument(
         "--dry-run",
         action="store_true",
@@ -110,46 +118,56 @@ def _expand_jobs(args: argparse.Namespace) -> list[_Job]:
     return jobs
 
 
+def _report(plans: list[DownloadPlan], results: Iterable[Path | None]) -> None:
+    for plan, path in zip(plans, results):
+        if path is None:
+            print(
+                f"missing {plan.exchange} {plan.data_type} "
+                f"{plan.date} {plan.symbol}"
+            )
+            continue
+        print(str(path))
+
+
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
+
+    from mm_bt.io.tardis_download import build_download_plan, iter_downloads
+
+    if args.concurrency < 1:
+        raise SchemaError("--concurrency must be >= 1")
     jobs = _expand_jobs(args)
     validate_header = not args.no_validate_header
 
-    for job in jobs:
-        plan = build_download_plan(
+    plans = [
+        build_download_plan(
             root=args.out_root,
             exchange=job.exchange,
             data_type=args.data_type,
             date=job.date,
             symbol=job.symbol,
         )
-        if args.dry_run:
+        for job in jobs
+    ]
+    if args.dry_run:
+        for plan in plans:
             print(
                 f"{plan.exchange} {plan.data_type} {plan.date} "
                 f"{plan.symbol} -> {plan.target_path}"
             )
-            continue
-
-        try:
-            path = download_tardis_csv_gz(
-                root=args.out_root,
-                exchange=job.exchange,
-                data_type=args.data_type,
-                date=job.date,
-                symbol=job.symbol,
-                api_key=args.api_key or os.getenv("TARDIS_API_KEY"),
-                if_exists=args.if_exists,
-                validate_header=validate_header,
-            )
-        except DownloadNotFound as exc:
-            if args.on_missing == "skip":
-                print(
-                    f"missing {plan.exchange} {plan.data_type} "
-                    f"{plan.date} {plan.symbol}"
-                )
-                continue
-            raise
-        print(str(path))
+        return 0
+
+    _report(
+        plans,
+        iter_downloads(
+            plans,
+            api_key=args.api_key or os.getenv("TARDIS_API_KEY"),
+            if_exists=args.if_exists,
+            validate_header=validate_header,
+            skip_missing=args.on_missing == "skip",
+            concurrency=args.concurrency,
+        ),
+    )
     return 0
 
 
@@ -14,6 +14,7 @@ from mm_bt.core.errors import (
 )
 from mm_bt.core.fixedpoint import Quantizer
 from mm_bt.core.hashing import (
+    HashingReader,
     hash_bytes,
     hash_file,
     hash_json,
@@ -22,12 +23,16 @@ from mm_bt.core.hashing import (
     hash_text_bytes,
     hash_text_u64,
     stable_json_dumps,
+    stable_json_dumps_bytes,
+    stable_json_dumps_signed,
 )
 from mm_bt.core.time import OrderingKey, compare_ordering_key
 from mm_bt.core.types import (
     Bps,
     Lots,
     QuoteAtoms,
+    SIDE_ASK,
+    SIDE_BID,
     Side,
     Symbol,
     Ticks,
@@ -42,6 +47,7 @@ __all__ = [
     "DECIMAL_CTX",
     "DeterminismError",
     "FailurePolicy",
+    "HashingReader",
     "Lots",
     "OrderingError",
     "OrderingKey",
@@ -50,6 +56,8 @@ __all__ = [
     "QuarantineAction",
     "QuarantineError",
     "QuoteAtoms",
+    "SIDE_ASK",
+    "SIDE_BID",
     "SchemaError",
     "Side",
     "Symbol",
@@ -67,4 +75,6 @@ __all__ = [
     "parse_decimal",
     "parse_side",
     "stable_json_dumps",
+    "stable_json_dumps_bytes",
+    "stable_json_dumps_signed",
 ]
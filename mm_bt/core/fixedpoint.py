@@ -2,30 +2,76 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, localcontext
+from dataclasses import dataclass, field
+from decimal import Decimal
 
 from mm_bt.core.decimal_ctx import DECIMAL_CTX, parse_decimal
 from mm_bt.core.errors import QuantizationError
 from mm_bt.core.types import Lots, QuoteAtoms, Ticks
 
 
+# DECIMAL_CTX is passed explicitly to the context-sensitive Decimal methods
+# (comparisons are exact) instead of entering localcontext() per value.
+
+
 def _normalize_increment(increment: Decimal) -> Decimal:
-    with localcontext(DECIMAL_CTX):
-        if not increment.is_finite():
-            raise QuantizationError("increment must be finite")
-        if increment <= 0:
-            raise QuantizationError("increment must be positive")
-        return increment.normalize()
+    if not increment.is_finite():
+        raise QuantizationError("increment must be finite")
+    if increment <= 0:
+        raise QuantizationError("increment must be positive")
+    return increment.normalize(DECIMAL_CTX)
 
 
 def _scaled_int(value: Decimal, scale: int) -> int:
-    scaled = value.scaleb(scale)
-    if scaled != scaled.to_integral_value():
+    scaled = value.scaleb(scale, DECIMAL_CTX)
+    if scaled != scaled.to_integral_value(context=DECIMAL_CTX):
         raise QuantizationError("value has more precision than increment")
     return int(scaled)
 
 
+def _fast_params(increment: Decimal) -> tuple[int, int] | None:
+    # (scale, scaled increment) for increments with a fractional or unit
+    # exponent; increments like 1E+1 use the Decimal path only.
+    scale = -increment.as_tuple().exponent
+    if scale < 0:
+        return None
+    return scale, int(increment.scaleb(scale, DECIMAL_CTX))
+
+
+# Plain unsigned decimals up to this many significant digits stay well inside
+# DECIMAL_CTX precision, so integer arithmetic matches the Decimal path.
+_FAST_MAX_DIGITS = 18
+
+
+def _quantize_fast(
+    value: str, params: tuple[int, int] | None, allow_zero: bool
+) -> int | None:
+    """Quantize a plain `digits[.digits]` string with int ops only.
+
+    Returns None for anything else (signs, exponents, too much precision,
+    non-multiples, ...) so the caller falls back to the Decimal path and its
+    error reporting.
+    """
+    if params is None:
+        return None
+    text = value.strip()
+    if not text.isascii():
+        return None
+    ipart, _, frac = text.partition(".")
+    if not ipart.isdigit() or (frac and not frac.isdigit()):
+        return None
+    scale, step = params
+    frac = frac.rstrip("0")
+    if len(frac) > scale or len(ipart) + len(frac) > _FAST_MAX_DIGITS:
+        return None
+    scaled = int(ipart + frac + "0" * (scale - len(frac)))
+    if scaled == 0:
+        return 0 if allow_zero else None
+    if scaled % step:
+        return None
+    return scaled // step
+
+
 def _quantize_decimal(
     value: Decimal,
     increment: Decimal,
@@ -33,31 +79,36 @@ def _quantize_decimal(
     allow_zero: bool,
     field: str,
 ) -> int:
-    with localcontext(DECIMAL_CTX):
-        inc = increment
-        if not value.is_finite():
-            raise QuantizationError(f"{field} must be finite")
-        if value == 0:
-            if allow_zero:
-                return 0
-            raise QuantizationError(f"{field} must be positive")
-        if value < 0:
-            raise QuantizationError(f"{field} must be non-negative")
-
-        scale = -inc.as_tuple().exponent
-        scaled_value = _scaled_int(value.normalize(), scale)
-        scaled_inc = _scaled_int(inc, scale)
-        if scaled_inc == 0:
-            raise QuantizationError("increment underflow")
-        if scaled_value % scaled_inc != 0:
-            raise QuantizationError(f"{field} not a multiple of increment")
-        return scaled_value // scaled_inc
+    inc = increment
+    if not value.is_finite():
+        raise QuantizationError(f"{field} must be finite")
+    if value == 0:
+        if allow_zero:
+            return 0
+        raise QuantizationError(f"{field} must be positive")
+    if value < 0:
+        raise QuantizationError(f"{field} must be non-negative")
+
+    scale = -inc.as_tuple().exponent
+    scaled_value = _scaled_int(value.normalize(DECIMAL_CTX), scale)
+    scaled_inc = _scaled_int(inc, scale)
+    if scaled_inc == 0:
+        raise QuantizationError("increment underflow")
+    if scaled_value % scaled_inc != 0:
+        raise QuantizationError(f"{field} not a multiple of increment")
+    return scaled_value // scaled_inc
 
 
 @dataclass(frozen=True, slots=True)
 class Quantizer:
     price_increment: Decimal
     amount_increment: Decimal
+    _price_fast: tuple[int, int] | None = field(
+        init=False, repr=False, compare=False
+    )
+    _amount_fast: tuple[int, int] | None = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         object.__setattr__(
@@ -70,6 +121,12 @@ class Quantizer:
             "amount_increment",
             _normalize_increment(self.amount_increment),
         )
+        object.__setattr__(
+            self, "_price_fast", _fast_params(self.price_increment)
+        )
+        object.__setattr__(
+            self, "_amount_fast", _fast_params(self.amount_increment)
+        )
 
     @classmethod
     def from_strings(cls, price_increment: str, amount_increment: str) -> "Quantizer":
@@ -79,6 +136,9 @@ class Quantizer:
         )
 
     def quantize_price(self, value: str) -> Ticks:
+        ticks = _quantize_fast(value, self._price_fast, False)
+        if ticks is not None:
+            return Ticks(ticks)
         try:
             dec = parse_decimal(value)
         except ValueError as exc:
@@ -92,6 +152,9 @@ class Quantizer:
         return Ticks(ticks)
 
     def quantize_amount(self, value: str) -> Lots:
+        lots = _quantize_fast(value, self._amount_fast, True)
+        if lots is not None:
+            return Lots(lots)
         try:
             dec = parse_decimal(value)
         except ValueError as exc:
@@ -1,28 +1,69 @@
-"""Stable content hashing utilities."""
+"""Stable content hashing utilities.
+
+The string-keyed hashes are memoized: callers re-hash the same small
+payloads (schema versions, symbols, configs) far more often than they see
+new ones. `hash_file` is not cached since file contents can change.
+"""
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import io
 import json
+import mmap
+import os
 from pathlib import Path
+from typing import BinaryIO
 
 
 def hash_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+@functools.lru_cache(maxsize=4096)
 def hash_text(text: str) -> str:
     return hash_bytes(text.encode("utf-8"))
 
 
+@functools.lru_cache(maxsize=4096)
 def hash_text_bytes(text: str) -> bytes:
     return hashlib.sha256(text.encode("utf-8")).digest()
 
 
+# json.dumps builds a fresh JSONEncoder whenever options are passed; reuse one.
+_STABLE_JSON = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=True
+)
+
+
 def stable_json_dumps(payload: object) -> str:
-    return json.dumps(
-        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-    )
+    return _STABLE_JSON.encode(payload)
+
+
+def stable_json_dumps_bytes(payload: object) -> bytes:
+    # ensure_ascii output, so the ASCII encode is a straight copy.
+    return _STABLE_JSON.encode(payload).encode("ascii")
+
+
+def stable_json_dumps_signed(payload: dict[str, object], key: str) -> bytes:
+    """stable_json_dumps_bytes of `payload` plus `key`: SHA-256 of the rest.
+
+    The digest is over stable_json_dumps_bytes(payload). Each top-level
+    value is encoded once; the unsigned and signed documents are joined
+    from the same pieces instead of serializing the payload twice.
+    """
+    if key in payload:
+        raise ValueError(f"payload already has key: {key!r}")
+    encode = _STABLE_JSON.encode
+    pieces = {
+        name: f"{encode(name)}:{encode(value)}" for name, value in payload.items()
+    }
+    unsigned = "{" + ",".join([pieces[name] for name in sorted(pieces)]) + "}"
+    digest = hash_bytes(unsigned.encode("ascii"))
+    pieces[key] = f"{encode(key)}:{encode(digest)}"
+    signed = "{" + ",".join([pieces[name] for name in sorted(pieces)]) + "}"
+    return signed.encode("ascii")
 
 
 def hash_json(payload: object) -> str:
@@ -30,21 +71,77 @@ def hash_json(payload: object) -> str:
 
 
 def hash_json_bytes(payload: object) -> bytes:
-    return hashlib.sha256(stable_json_dumps(payload).encode("utf-8")).digest()
+    return hash_text_bytes(stable_json_dumps(payload))
 
 
+# Exchange/symbol ids are stored in evlog headers, so this derivation is
+# part of the file format: changing the hash would change every id. It runs
+# once per name per process (cached), so a cheaper hash would save nothing.
+@functools.lru_cache(maxsize=4096)
 def hash_text_u64(text: str) -> int:
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    digest = hashlib.sha256(text.encode("utf-8"), usedforsecurity=False).digest()
     return int.from_bytes(digest[:8], "little")
 
 
 def hash_file(path: str | Path, chunk_size: int = 1 << 20) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
+    # Feed the whole mapped file to one update() so OpenSSL's (SHA-NI)
+    # inner loop runs uninterrupted; fall back to chunked reads if the file
+    # cannot be mapped.
+    h = hashlib.sha256(usedforsecurity=False)
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return h.hexdigest()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError):
+            mm = None
+        if mm is not None:
+            with mm:
+                h.update(mm)
+            return h.hexdigest()
+        # Unbuffered reads into one reused buffer: no per-chunk allocation.
+        buf = bytearray(chunk_size)
+        with memoryview(buf) as view:
+            while n := f.readinto(buf):
+                h.update(view[:n])
     return h.hexdigest()
 
+
+class HashingReader(io.RawIOBase):
+    """Binary read-through wrapper that SHA-256s every byte read from `raw`.
+
+    Lets a single streaming pass both parse a file and fingerprint exactly
+    the bytes that were parsed. Closing it closes `raw`.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._hash = hashlib.sha256(usedforsecurity=False)
+
+    def readable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def readinto(self, buffer) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            with memoryview(buffer) as view:
+                self._hash.update(view[:n])
+        return n
+
+    def drain(self, chunk_size: int = 1 << 20) -> None:
+        """Hash whatever the consumer left unread, up to EOF."""
+        buf = bytearray(chunk_size)
+        while self.readinto(buf):
+            pass
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+        super().close()
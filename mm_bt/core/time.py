@@ -2,20 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True, slots=True, order=True)
-class OrderingKey:
+class OrderingKey(NamedTuple):
+    # A tuple subclass so sorts and heap merges compare keys in C.
     ts_recv_ns: int
     stream_rank: int
     seq_in_stream: int
 
 
 def compare_ordering_key(a: OrderingKey, b: OrderingKey) -> int:
-    if a < b:
-        return -1
-    if a > b:
-        return 1
-    return 0
-
+    return (a > b) - (a < b)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 from enum import IntEnum
-from typing import NewType
+from typing import Final, NewType
 
 from mm_bt.core.errors import SchemaError
 
@@ -22,6 +23,13 @@ class Side(IntEnum):
     ASK = 1
 
 
+# Aliases for hot paths: `Side.BID` is resolved through the enum metaclass on
+# every access (~100 ns on CPython 3.11), a module global is not.
+SIDE_BID: Final = Side.BID
+SIDE_ASK: Final = Side.ASK
+
+
+@functools.lru_cache(maxsize=8)
 def parse_side(value: str) -> Side:
     v = value.lower()
     if v == "bid":
@@ -12,10 +12,16 @@ from mm_bt.evlog.format import (
     read_header,
     unpack_header,
     unpack_record_header,
+    unpack_record_header_from,
+)
+from mm_bt.evlog.index import (
+    IndexEntry,
+    read_index,
+    read_index_arrays,
+    write_index,
 )
-from mm_bt.evlog.index import IndexEntry, read_index, write_index
 from mm_bt.evlog.reader import EvlogReader
-from mm_bt.evlog.types import L2Batch, L2Update
+from mm_bt.evlog.types import L2Batch, L2BatchArrays, L2Update
 from mm_bt.evlog.writer import EvlogWriter
 
 EVLOG_VERSION = VERSION
@@ -28,6 +34,7 @@ __all__ = [
     "EvlogWriter",
     "IndexEntry",
     "L2Batch",
+    "L2BatchArrays",
     "L2Update",
     "MAGIC",
     "RecordType",
@@ -35,7 +42,9 @@ __all__ = [
     "pack_header",
     "read_header",
     "read_index",
+    "read_index_arrays",
     "unpack_header",
     "unpack_record_header",
+    "unpack_record_header_from",
     "write_index",
 ]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import IntEnum
 import struct
 
 from mm_bt.core.errors import SchemaError
+from mm_bt.core.types import Side
 
 MAGIC = b"MMEVLOG\x00"
 VERSION = 1
@@ -28,6 +30,34 @@ L2_BATCH_HEADER_SIZE = struct.calcsize(L2_BATCH_HEADER_FMT)
 L2_UPDATE_FMT = "<B B H q q I"
 L2_UPDATE_SIZE = struct.calcsize(L2_UPDATE_FMT)
 
+# Record header immediately followed by the L2 batch header.
+L2_RECORD_HEADER_FMT = "<B B H I q q B 3x I"
+L2_RECORD_HEADER_SIZE = struct.calcsize(L2_RECORD_HEADER_FMT)
+assert L2_RECORD_HEADER_SIZE == RECORD_HEADER_SIZE + L2_BATCH_HEADER_SIZE
+
+# Precompiled codecs: calling a Struct's bound methods skips the format-string
+# cache lookup that the module-level struct functions do on every call.
+HEADER_BASE_STRUCT = struct.Struct(HEADER_BASE_FMT)
+HEADER_V1_EXTRA_STRUCT = struct.Struct(HEADER_V1_EXTRA_FMT)
+RECORD_HEADER_STRUCT = struct.Struct(RECORD_HEADER_FMT)
+L2_BATCH_HEADER_STRUCT = struct.Struct(L2_BATCH_HEADER_FMT)
+L2_UPDATE_STRUCT = struct.Struct(L2_UPDATE_FMT)
+L2_RECORD_HEADER_STRUCT = struct.Struct(L2_RECORD_HEADER_FMT)
+
+pack_record_header = RECORD_HEADER_STRUCT.pack
+_unpack_from_record_header = RECORD_HEADER_STRUCT.unpack_from
+pack_l2_batch_header = L2_BATCH_HEADER_STRUCT.pack
+unpack_from_l2_batch_header = L2_BATCH_HEADER_STRUCT.unpack_from
+pack_l2_record_header = L2_RECORD_HEADER_STRUCT.pack
+pack_l2_update = L2_UPDATE_STRUCT.pack
+pack_into_l2_update = L2_UPDATE_STRUCT.pack_into
+unpack_from_l2_update = L2_UPDATE_STRUCT.unpack_from
+iter_unpack_l2_updates = L2_UPDATE_STRUCT.iter_unpack
+
+
+SIDE_VALUES = frozenset(side.value for side in Side)
+_INT64_MAX = (1 << 63) - 1
+
 
 class RecordType(IntEnum):
     L2_BATCH = 1
@@ -58,16 +88,14 @@ def pack_header(
         raise SchemaError("exchange_id out of range")
     if symbol_id < 0 or symbol_id > (1 << 64) - 1:
         raise SchemaError("symbol_id out of range")
-    base = struct.pack(
-        HEADER_BASE_FMT,
+    base = HEADER_BASE_STRUCT.pack(
         MAGIC,
         VERSION,
         ENDIAN_LITTLE,
         flags,
         0,
     )
-    extra = struct.pack(
-        HEADER_V1_EXTRA_FMT,
+    extra = HEADER_V1_EXTRA_STRUCT.pack(
         exchange_id,
         symbol_id,
         quantizer_hash,
@@ -78,8 +106,8 @@ def pack_header(
 def unpack_header(data: bytes) -> EvlogHeader:
     if len(data) not in (HEADER_BASE_SIZE, HEADER_V1_SIZE):
         raise SchemaError("invalid evlog header size")
-    magic, version, endian, flags, reserved = struct.unpack(
-        HEADER_BASE_FMT, data[:HEADER_BASE_SIZE]
+    magic, version, endian, flags, reserved = HEADER_BASE_STRUCT.unpack_from(
+        data
     )
     if magic != MAGIC:
         raise SchemaError("invalid evlog magic")
@@ -102,8 +130,8 @@ def unpack_header(data: bytes) -> EvlogHeader:
         )
     if len(data) != HEADER_V1_SIZE:
         raise SchemaError("invalid v1 header size")
-    exchange_id, symbol_id, quantizer_hash = struct.unpack(
-        HEADER_V1_EXTRA_FMT, data[HEADER_BASE_SIZE:]
+    exchange_id, symbol_id, quantizer_hash = HEADER_V1_EXTRA_STRUCT.unpack_from(
+        data, HEADER_BASE_SIZE
     )
     return EvlogHeader(
         version=version,
@@ -121,9 +149,7 @@ def read_header(f) -> EvlogHeader:
         raise SchemaError("missing evlog header")
     if len(base) != HEADER_BASE_SIZE:
         raise SchemaError("truncated evlog header")
-    magic, version, endian, flags, reserved = struct.unpack(
-        HEADER_BASE_FMT, base
-    )
+    magic, version, endian, flags, reserved = HEADER_BASE_STRUCT.unpack(base)
     if magic != MAGIC:
         raise SchemaError("invalid evlog magic")
     if version == 0:
@@ -144,9 +170,7 @@ def read_header(f) -> EvlogHeader:
     extra = f.read(HEADER_V1_EXTRA_SIZE)
     if len(extra) != HEADER_V1_EXTRA_SIZE:
         raise SchemaError("truncated evlog header")
-    exchange_id, symbol_id, quantizer_hash = struct.unpack(
-        HEADER_V1_EXTRA_FMT, extra
-    )
+    exchange_id, symbol_id, quantizer_hash = HEADER_V1_EXTRA_STRUCT.unpack(extra)
     if endian != ENDIAN_LITTLE:
         raise SchemaError(f"unsupported evlog endian: {endian}")
     if reserved != 0:
@@ -164,10 +188,67 @@ def read_header(f) -> EvlogHeader:
 def unpack_record_header(data: bytes) -> tuple[int, int]:
     if len(data) != RECORD_HEADER_SIZE:
         raise SchemaError("invalid record header size")
-    rec_type, flags, reserved, length = struct.unpack(RECORD_HEADER_FMT, data)
+    return unpack_record_header_from(data, 0)
+
+
+def unpack_record_header_from(buffer, offset: int) -> tuple[int, int]:
+    """Read a record header in place at `offset` (caller checks bounds).
+
+    One Struct.unpack_from on the buffer measured about 2x faster than
+    slicing first, and faster than int.from_bytes/byte indexing per field.
+    """
+    rec_type, flags, reserved, length = _unpack_from_record_header(buffer, offset)
     if flags != 0:
         raise SchemaError("non-zero record flags")
     if reserved != 0:
         raise SchemaError("non-zero record reserved field")
     return rec_type, length
 
+
+def l2_update_error(
+    side: int, is_snapshot: int, price_ticks: int, amount_lots: int
+) -> str | None:
+    """Return why a single L2 update row is invalid, or None if it is valid."""
+    if side not in SIDE_VALUES:
+        return f"invalid side: {side}"
+    if is_snapshot not in (0, 1):
+        return f"invalid is_snapshot flag: {is_snapshot}"
+    if price_ticks <= 0:
+        return "non-positive price_ticks"
+    if price_ticks > _INT64_MAX:
+        return f"price_ticks out of int64 range: {price_ticks}"
+    if amount_lots < 0:
+        return "negative amount_lots"
+    if amount_lots > _INT64_MAX:
+        return f"amount_lots out of int64 range: {amount_lots}"
+    return None
+
+
+def check_l2_update_columns(
+    sides: Sequence[int],
+    snapshots: Sequence[int],
+    prices: Sequence[int],
+    amounts: Sequence[int],
+) -> None:
+    """Validate L2 update columns with one combined test per batch.
+
+    Only when the batch is bad are rows re-checked one by one, so the error
+    names the first offending update exactly as a per-row check would.
+    """
+    if not sides:
+        return
+    if (
+        SIDE_VALUES.issuperset(sides)
+        and min(snapshots) >= 0
+        and max(snapshots) <= 1
+        and min(prices) > 0
+        and max(prices) <= _INT64_MAX
+        and min(amounts) >= 0
+        and max(amounts) <= _INT64_MAX
+    ):
+        return
+    for i, row in enumerate(zip(sides, snapshots, prices, amounts)):
+        reason = l2_update_error(*row)
+        if reason is not None:
+            raise SchemaError(f"{reason} at update {i}")
+    raise SchemaError("invalid l2 update")  # pragma: no cover - unreachable
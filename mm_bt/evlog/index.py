@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+import itertools
+import operator
 import struct
+import sys
 from pathlib import Path
-from typing import BinaryIO, Iterable
+from typing import Iterable
 
 from mm_bt.core.errors import SchemaError
 
@@ -19,6 +23,9 @@ INDEX_HEADER_SIZE = struct.calcsize(INDEX_HEADER_FMT)
 INDEX_ENTRY_FMT = "<q q"
 INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY_FMT)
 
+_INDEX_HEADER_STRUCT = struct.Struct(INDEX_HEADER_FMT)
+_INDEX_ENTRY_STRUCT = struct.Struct(INDEX_ENTRY_FMT)
+
 
 @dataclass(frozen=True, slots=True)
 class IndexEntry:
@@ -27,8 +34,7 @@ class IndexEntry:
 
 
 def _pack_header() -> bytes:
-    return struct.pack(
-        INDEX_HEADER_FMT,
+    return _INDEX_HEADER_STRUCT.pack(
         INDEX_MAGIC,
         INDEX_VERSION,
         ENDIAN_LITTLE,
@@ -40,9 +46,7 @@ def _pack_header() -> bytes:
 def _unpack_header(data: bytes) -> None:
     if len(data) != INDEX_HEADER_SIZE:
         raise SchemaError("invalid index header size")
-    magic, version, endian, _flags, reserved = struct.unpack(
-        INDEX_HEADER_FMT, data
-    )
+    magic, version, endian, _flags, reserved = _INDEX_HEADER_STRUCT.unpack(data)
     if magic != INDEX_MAGIC:
         raise SchemaError("invalid index magic")
     if version != INDEX_VERSION:
@@ -53,10 +57,11 @@ def _unpack_header(data: bytes) -> None:
         raise SchemaError("non-zero index reserved field")
 
 
-def _write_entries(f: BinaryIO, entries: Iterable[IndexEntry]) -> int:
-    count = 0
+def _encode_entries(entries: Iterable[IndexEntry]) -> tuple[bytes, int]:
+    packed: list[bytes] = []
     prev_ts: int | None = None
     prev_offset: int | None = None
+    pack_entry = _INDEX_ENTRY_STRUCT.pack
     for entry in entries:
         if entry.ts_recv_ns < 0:
             raise SchemaError(f"negative index timestamp: {entry.ts_recv_ns}")
@@ -66,21 +71,30 @@ def _write_entries(f: BinaryIO, entries: Iterable[IndexEntry]) -> int:
             raise SchemaError("index timestamps not monotone")
         if prev_offset is not None and entry.offset <= prev_offset:
             raise SchemaError("index offsets not increasing")
-        f.write(struct.pack(INDEX_ENTRY_FMT, entry.ts_recv_ns, entry.offset))
+        packed.append(pack_entry(entry.ts_recv_ns, entry.offset))
         prev_ts = entry.ts_recv_ns
         prev_offset = entry.offset
-        count += 1
+    return b"".join(packed), len(packed)
+
+
+def write_index(
+    path: str | Path, entries: Iterable[IndexEntry], *, hasher=None
+) -> int:
+    """Write an index; `hasher` (a hashlib object) is fed the file's bytes."""
+    body, count = _encode_entries(entries)
+    data = _pack_header() + body
+    if hasher is not None:
+        hasher.update(data)
+    Path(path).write_bytes(data)
     return count
 
 
-def write_index(path: str | Path, entries: Iterable[IndexEntry]) -> int:
-    p = Path(path)
-    with p.open("wb") as f:
-        f.write(_pack_header())
-        return _write_entries(f, entries)
-
+def read_index_arrays(path: str | Path) -> tuple[array, array]:
+    """Read an index as (ts_recv_ns, offset) array('q') columns.
 
-def read_index(path: str | Path) -> list[IndexEntry]:
+    The payload is parsed in one frombytes call and validated column-wise;
+    no per-entry objects are created.
+    """
     p = Path(path)
     with p.open("rb") as f:
         header = f.read(INDEX_HEADER_SIZE)
@@ -88,22 +102,39 @@ def read_index(path: str | Path) -> list[IndexEntry]:
         data = f.read()
     if len(data) % INDEX_ENTRY_SIZE != 0:
         raise SchemaError("index payload size mismatch")
-    entries: list[IndexEntry] = []
-    prev_ts: int | None = None
-    prev_offset: int | None = None
-    for offset in range(0, len(data), INDEX_ENTRY_SIZE):
-        ts_recv_ns, rec_offset = struct.unpack_from(
-            INDEX_ENTRY_FMT, data, offset
-        )
+    flat = array("q")
+    flat.frombytes(data)
+    if sys.byteorder != "little":
+        flat.byteswap()
+    ts = flat[0::2]
+    offsets = flat[1::2]
+    if not ts or (
+        min(ts) >= 0
+        and min(offsets) >= 0
+        and all(map(operator.le, ts, itertools.islice(ts, 1, None)))
+        and all(map(operator.lt, offsets, itertools.islice(offsets, 1, None)))
+    ):
+        return ts, offsets
+    # Only a bad index is rescanned entry by entry, so the error names the
+    # first offending entry, checked in the same order as _encode_entries.
+    prev_ts = prev_offset = -1
+    for i, (ts_recv_ns, offset) in enumerate(zip(ts, offsets)):
         if ts_recv_ns < 0:
-            raise SchemaError("negative index timestamp")
-        if rec_offset < 0:
-            raise SchemaError("negative index offset")
-        if prev_ts is not None and ts_recv_ns < prev_ts:
-            raise SchemaError("index timestamps not monotone")
-        if prev_offset is not None and rec_offset <= prev_offset:
-            raise SchemaError("index offsets not increasing")
-        entries.append(IndexEntry(ts_recv_ns=ts_recv_ns, offset=rec_offset))
-        prev_ts = ts_recv_ns
-        prev_offset = rec_offset
-    return entries
+            reason = "negative index timestamp"
+        elif offset < 0:
+            reason = "negative index offset"
+        elif ts_recv_ns < prev_ts:
+            reason = "index timestamps not monotone"
+        elif offset <= prev_offset:
+            reason = "index offsets not increasing"
+        else:
+            prev_ts = ts_recv_ns
+            prev_offset = offset
+            continue
+        raise SchemaError(f"{reason} at entry {i}")
+    raise SchemaError("invalid index")  # pragma: no cover - unreachable
+
+
+def read_index(path: str | Path) -> list[IndexEntry]:
+    ts, offsets = read_index_arrays(path)
+    return list(map(IndexEntry, ts, offsets))
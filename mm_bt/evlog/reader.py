@@ -3,31 +3,50 @@
 from __future__ import annotations
 
 import bisect
-import struct
+import mmap
+import os
+from array import array
 from pathlib import Path
-from typing import BinaryIO, Iterator
+from typing import BinaryIO, Callable, Iterator, TypeVar
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Lots, Side, Ticks, TsNs
+from mm_bt.core.types import Side, TsNs
 from mm_bt.evlog.format import (
-    L2_BATCH_HEADER_FMT,
     L2_BATCH_HEADER_SIZE,
-    L2_UPDATE_FMT,
     L2_UPDATE_SIZE,
     RECORD_HEADER_SIZE,
     RecordType,
+    check_l2_update_columns,
+    iter_unpack_l2_updates,
     read_header,
-    unpack_record_header,
+    unpack_from_l2_batch_header,
+    unpack_record_header_from,
 )
-from mm_bt.evlog.index import IndexEntry, read_index
-from mm_bt.evlog.types import L2Batch, L2Update
+from mm_bt.evlog.index import read_index_arrays
+from mm_bt.evlog.types import L2Batch, L2BatchArrays, L2Update
 
+_T = TypeVar("_T")
 
-def _decode_l2_payload(payload: bytes) -> L2Batch:
+# Bytes prefetched after seek_time jumps to an indexed offset.
+_SEEK_PREFETCH = 4 * 1024 * 1024
+
+# Indexed by the raw (already validated) column values; avoids calling the
+# IntEnum / bool constructors per update.
+_SIDE_BY_VALUE = tuple(sorted(Side, key=int))
+_BOOL_BY_VALUE = (False, True)
+
+
+_L2Columns = tuple[
+    int, int, int, tuple[int, ...], tuple[int, ...], tuple[int, ...], tuple[int, ...]
+]
+
+
+def _decode_l2_header(payload: bytes | memoryview) -> tuple[int, int, int, int]:
+    """Validate an L2 payload's batch header and its size against the count."""
     if len(payload) < L2_BATCH_HEADER_SIZE:
         raise SchemaError("l2 payload too small")
-    ts_recv_ns, ts_exch_ns, resets_book, update_count = struct.unpack_from(
-        L2_BATCH_HEADER_FMT, payload, 0
+    ts_recv_ns, ts_exch_ns, resets_book, update_count = (
+        unpack_from_l2_batch_header(payload)
     )
     if ts_recv_ns < 0 or ts_exch_ns < 0:
         raise SchemaError("negative timestamp")
@@ -36,40 +55,70 @@ def _decode_l2_payload(payload: bytes) -> L2Batch:
     expected_len = L2_BATCH_HEADER_SIZE + update_count * L2_UPDATE_SIZE
     if len(payload) != expected_len:
         raise SchemaError("l2 payload size mismatch")
+    return ts_recv_ns, ts_exch_ns, resets_book, update_count
 
-    updates: list[L2Update] = []
-    offset = L2_BATCH_HEADER_SIZE
-    for _ in range(update_count):
-        side_value, is_snapshot, r16, price_ticks, amount_lots, r32 = (
-            struct.unpack_from(L2_UPDATE_FMT, payload, offset)
-        )
-        if r16 != 0 or r32 != 0:
-            raise SchemaError("non-zero l2 update reserved fields")
-        try:
-            side = Side(side_value)
-        except ValueError as exc:
-            raise SchemaError(f"invalid side: {side_value}") from exc
-        if is_snapshot not in (0, 1):
-            raise SchemaError(f"invalid is_snapshot flag: {is_snapshot}")
-        if price_ticks <= 0:
-            raise SchemaError("non-positive price_ticks")
-        if amount_lots < 0:
-            raise SchemaError("negative amount_lots")
-        updates.append(
-            L2Update(
-                side=side,
-                price_ticks=Ticks(price_ticks),
-                amount_lots=Lots(amount_lots),
-                is_snapshot=bool(is_snapshot),
-            )
-        )
-        offset += L2_UPDATE_SIZE
 
+def _decode_l2_columns(payload: bytes | memoryview) -> _L2Columns:
+    """Validate an L2 payload; return header fields and update columns.
+
+    Columns are (sides, is_snapshot, price_ticks, amount_lots), empty for a
+    batch without updates.
+    """
+    ts_recv_ns, ts_exch_ns, resets_book, update_count = _decode_l2_header(
+        payload
+    )
+    if not update_count:
+        return ts_recv_ns, ts_exch_ns, resets_book, (), (), (), ()
+
+    # Unpack every update in one C-level pass, then validate whole columns
+    # instead of running the checks per row.
+    rows = iter_unpack_l2_updates(memoryview(payload)[L2_BATCH_HEADER_SIZE:])
+    sides, snapshots, r16s, prices, amounts, r32s = zip(*rows)
+    if any(r16s) or any(r32s):
+        raise SchemaError("non-zero l2 update reserved fields")
+    check_l2_update_columns(sides, snapshots, prices, amounts)
+    return ts_recv_ns, ts_exch_ns, resets_book, sides, snapshots, prices, amounts
+
+
+def _decode_l2_payload(payload: bytes | memoryview) -> L2Batch:
+    ts_recv_ns, ts_exch_ns, resets_book, sides, snapshots, prices, amounts = (
+        _decode_l2_columns(payload)
+    )
+    # Columns feed the positional constructor through map(), so the
+    # per-update loop runs in C rather than as a comprehension with keywords.
+    # The list is materialized first: tuple() of an iterator regrows its
+    # result repeatedly, while tuple() of a list is one sized pointer copy.
+    updates = tuple(
+        [
+            *map(
+                L2Update,
+                map(_SIDE_BY_VALUE.__getitem__, sides),
+                prices,
+                amounts,
+                map(_BOOL_BY_VALUE.__getitem__, snapshots),
+            )
+        ]
+    )
     return L2Batch(
         ts_recv_ns=TsNs(ts_recv_ns),
         ts_exch_ns=TsNs(ts_exch_ns),
         resets_book=bool(resets_book),
-        updates=tuple(updates),
+        updates=updates,
+    )
+
+
+def _decode_l2_payload_arrays(payload: bytes | memoryview) -> L2BatchArrays:
+    ts_recv_ns, ts_exch_ns, resets_book, sides, snapshots, prices, amounts = (
+        _decode_l2_columns(payload)
+    )
+    return L2BatchArrays(
+        ts_recv_ns=TsNs(ts_recv_ns),
+        ts_exch_ns=TsNs(ts_exch_ns),
+        resets_book=bool(resets_book),
+        sides=array("B", sides),
+        price_ticks=array("q", prices),
+        amount_lots=array("q", amounts),
+        is_snapshot=array("B", snapshots),
     )
 
 
@@ -83,51 +132,143 @@ class EvlogReader:
         self._path = Path(path)
         self._file: BinaryIO | None = None
         self._header = None
-        self._index: list[IndexEntry] | None = None
+        self._mm: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self._raw_updates: memoryview | None = None
+        self._cursor = 0
+        # The index is kept as two packed int64 columns (no per-entry
+        # objects); bisect works on the ts column directly.
+        self._index_ts: array | None = None
+        self._index_offsets: array | None = None
         if index_path is not None:
-            self._index = read_index(index_path)
-            self._index_ts = [entry.ts_recv_ns for entry in self._index]
-        else:
-            self._index_ts = None
+            self._index_ts, self._index_offsets = read_index_arrays(index_path)
 
     def __enter__(self) -> "EvlogReader":
         self._file = self._path.open("rb")
-        self._header = read_header(self._file)
+        try:
+            self._header = read_header(self._file)
+            # Records are read straight out of the page cache: one mapping,
+            # an integer cursor, and zero-copy payload slices.
+            self._cursor = self._file.tell()
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            self._file = None
+            raise
+        self._view = memoryview(self._mm)
+        # Replay is a forward scan; ask for aggressive readahead.
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(
+                    self._file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                )
+            except OSError:
+                pass
+        self._madvise(getattr(mmap, "MADV_SEQUENTIAL", None), 0, len(self._mm))
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        if self._raw_updates is not None:
+            # A suspended iter_l2_batches_raw still exports a slice.
+            self._raw_updates.release()
+            self._raw_updates = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         if self._file is not None:
             self._file.close()
             self._file = None
 
     def seek_time(self, ts_recv_ns: int) -> None:
-        if self._file is None:
+        if self._view is None:
             raise SchemaError("reader is closed")
-        if self._index is None or self._index_ts is None:
+        if self._index_ts is None or self._index_offsets is None:
             raise SchemaError("index not available")
         idx = bisect.bisect_left(self._index_ts, ts_recv_ns)
-        if idx >= len(self._index):
-            self._file.seek(0, 2)
+        if idx >= len(self._index_offsets):
+            self._cursor = len(self._view)
             return
-        self._file.seek(self._index[idx].offset)
+        self._cursor = self._index_offsets[idx]
+        self._madvise(
+            getattr(mmap, "MADV_WILLNEED", None), self._cursor, _SEEK_PREFETCH
+        )
 
-    def iter_l2_batches(self) -> Iterator[L2Batch]:
-        if self._file is None:
+    def _madvise(self, advice: int | None, start: int, length: int) -> None:
+        """Best-effort page hint; a no-op where madvise is unsupported."""
+        mm = self._mm
+        if advice is None or mm is None or not hasattr(mm, "madvise"):
+            return
+        start -= start % mmap.PAGESIZE
+        length = min(length, len(mm) - start)
+        if length <= 0:
+            return
+        try:
+            mm.madvise(advice, start, length)
+        except OSError:
+            pass
+
+    def _iter_record_spans(self) -> Iterator[tuple[int, int]]:
+        """Yield (start, stop) payload offsets of successive L2 records."""
+        if self._view is None or self._mm is None:
             raise SchemaError("reader is closed")
+        mm = self._mm
+        end = len(self._view)
         while True:
-            header = self._file.read(RECORD_HEADER_SIZE)
-            if not header:
+            cursor = self._cursor
+            if cursor >= end:
                 break
-            if len(header) != RECORD_HEADER_SIZE:
+            if cursor + RECORD_HEADER_SIZE > end:
                 raise SchemaError("truncated record header")
-            rec_type, payload_len = unpack_record_header(header)
+            rec_type, payload_len = unpack_record_header_from(mm, cursor)
             if payload_len % 8 != 0:
                 raise SchemaError("payload length not 8-byte aligned")
-            payload = self._file.read(payload_len)
-            if len(payload) != payload_len:
+            start = cursor + RECORD_HEADER_SIZE
+            stop = start + payload_len
+            if stop > end:
                 raise SchemaError("truncated payload")
-            if rec_type == int(RecordType.L2_BATCH):
-                yield _decode_l2_payload(payload)
-            else:
+            if rec_type != int(RecordType.L2_BATCH):
                 raise SchemaError(f"unknown record type: {rec_type}")
+            self._cursor = stop
+            yield start, stop
+
+    def _iter_l2_records(self, decode: Callable[[memoryview], _T]) -> Iterator[_T]:
+        for start, stop in self._iter_record_spans():
+            assert self._view is not None
+            # Decode before yielding so no slice of the mapping outlives this
+            # step (the mapping cannot be closed while slices are exported).
+            with self._view[start:stop] as payload:
+                item = decode(payload)
+            yield item
+
+    def iter_l2_batches(self) -> Iterator[L2Batch]:
+        return self._iter_l2_records(_decode_l2_payload)
+
+    def iter_l2_batches_arrays(self) -> Iterator[L2BatchArrays]:
+        """Like iter_l2_batches, but yields columnar batches."""
+        return self._iter_l2_records(_decode_l2_payload_arrays)
+
+    def iter_l2_batches_raw(self) -> Iterator[tuple[int, int, bool, memoryview]]:
+        """Yield (ts_recv_ns, ts_exch_ns, resets_book, updates) per batch.
 
+        `updates` is a zero-copy view of the packed L2_UPDATE_FMT rows; only
+        the batch header is validated and no L2Update objects are built.
+        The view is released when the iterator advances or the reader
+        closes, so copy it (`bytes(updates)`) to keep it; decode kept rows
+        with `format.iter_unpack_l2_updates`.
+        """
+        for start, stop in self._iter_record_spans():
+            assert self._view is not None
+            with self._view[start:stop] as payload:
+                ts_recv_ns, ts_exch_ns, resets_book, _count = _decode_l2_header(
+                    payload
+                )
+            updates = self._view[start + L2_BATCH_HEADER_SIZE : stop]
+            self._raw_updates = updates
+            try:
+                yield ts_recv_ns, ts_exch_ns, bool(resets_book), updates
+            finally:
+                updates.release()
+                self._raw_updates = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 
 from mm_bt.core.types import Lots, Side, Ticks, TsNs
@@ -22,3 +23,55 @@ class L2Batch:
     resets_book: bool
     updates: tuple[L2Update, ...]
 
+
+@dataclass(frozen=True, slots=True)
+class L2BatchArrays:
+    """Columnar L2Batch: one typed array per update field, no per-update objects.
+
+    `sides` and `is_snapshot` are array('B') (Side values, 0/1); prices and
+    amounts are array('q').
+    """
+
+    ts_recv_ns: TsNs
+    ts_exch_ns: TsNs
+    resets_book: bool
+    sides: array
+    price_ticks: array
+    amount_lots: array
+    is_snapshot: array
+
+    @classmethod
+    def from_batch(cls, batch: L2Batch) -> L2BatchArrays:
+        updates = batch.updates
+        return cls(
+            ts_recv_ns=batch.ts_recv_ns,
+            ts_exch_ns=batch.ts_exch_ns,
+            resets_book=batch.resets_book,
+            sides=array("B", [u.side for u in updates]),
+            price_ticks=array("q", [u.price_ticks for u in updates]),
+            amount_lots=array("q", [u.amount_lots for u in updates]),
+            is_snapshot=array("B", [u.is_snapshot for u in updates]),
+        )
+
+    def to_batch(self) -> L2Batch:
+        return L2Batch(
+            ts_recv_ns=self.ts_recv_ns,
+            ts_exch_ns=self.ts_exch_ns,
+            resets_book=self.resets_book,
+            updates=tuple(
+                [
+                    L2Update(
+                        side=Side(side),
+                        price_ticks=Ticks(price),
+                        amount_lots=Lots(amount),
+                        is_snapshot=bool(snapshot),
+                    )
+                    for side, price, amount, snapshot in zip(
+                        self.sides,
+                        self.price_ticks,
+                        self.amount_lots,
+                        self.is_snapshot,
+                    )
+                ]
+            ),
+        )
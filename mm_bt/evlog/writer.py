@@ -2,23 +2,56 @@
 
 from __future__ import annotations
 
-import struct
+import hashlib
+import itertools
+import mmap
+import os
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterable, Sequence
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Side
 from mm_bt.evlog.format import (
-    L2_BATCH_HEADER_FMT,
     L2_BATCH_HEADER_SIZE,
-    L2_UPDATE_FMT,
     L2_UPDATE_SIZE,
-    RECORD_HEADER_FMT,
-    RECORD_HEADER_SIZE,
     RecordType,
+    check_l2_update_columns,
     pack_header,
+    pack_l2_record_header,
+    pack_l2_update,
 )
-from mm_bt.evlog.types import L2Batch
+from mm_bt.evlog.types import L2Batch, L2BatchArrays
+
+
+# Queued record bytes that trigger a flush.
+_PENDING_LIMIT = 1 << 20
+_HAS_WRITEV = hasattr(os, "writev")
+# Buffers per writev call; POSIX only guarantees 16, Linux allows 1024.
+_IOV_MAX = 1024
+if _HAS_WRITEV and hasattr(os, "sysconf"):
+    try:
+        _IOV_MAX = os.sysconf("SC_IOV_MAX")
+    except (OSError, ValueError):
+        pass
+    if _IOV_MAX <= 0:
+        _IOV_MAX = 16
+
+
+def _writev_all(fd: int, buffers: list[bytes | bytearray]) -> None:
+    """os.writev every buffer, resuming after short writes."""
+    # Empty buffers are dropped: a writev of only empty views returns 0 and
+    # would never advance past them.
+    views = [memoryview(buffer) for buffer in buffers if buffer]
+    i = 0
+    n = len(views)
+    while i < n:
+        written = os.writev(fd, views[i : i + _IOV_MAX])
+        while written and i < n:
+            size = len(views[i])
+            if written < size:
+                views[i] = views[i][written:]
+                break
+            written -= size
+            i += 1
 
 
 def _require_int64(value: int, field: str) -> None:
@@ -26,6 +59,62 @@ def _require_int64(value: int, field: str) -> None:
         raise SchemaError(f"{field} out of int64 range: {value}")
 
 
+def _encode_l2_record(
+    ts_recv_ns: int,
+    ts_exch_ns: int,
+    resets_book: bool,
+    sides: Sequence[int],
+    snapshots: Sequence[int],
+    prices: Sequence[int],
+    amounts: Sequence[int],
+) -> tuple[bytes, bytes]:
+    """Encode one L2 batch record as (headers, update rows)."""
+    ts_recv_ns = int(ts_recv_ns)
+    ts_exch_ns = int(ts_exch_ns)
+    _require_int64(ts_recv_ns, "ts_recv_ns")
+    _require_int64(ts_exch_ns, "ts_exch_ns")
+    if ts_recv_ns < 0 or ts_exch_ns < 0:
+        raise SchemaError("negative timestamp")
+    update_count = len(sides)
+    if update_count > (1 << 32) - 1:
+        raise SchemaError(f"update_count out of u32 range: {update_count}")
+    check_l2_update_columns(sides, snapshots, prices, amounts)
+    payload_len = L2_BATCH_HEADER_SIZE + update_count * L2_UPDATE_SIZE
+    if payload_len % 8 != 0:
+        raise SchemaError("l2 payload size not 8-byte aligned")
+    # Record header and batch header go out in one combined pack. Header
+    # and update rows stay separate buffers: writev/mmap take them as they
+    # are, so no per-record concatenation copy is made.
+    header = pack_l2_record_header(
+        int(RecordType.L2_BATCH),
+        0,
+        0,
+        payload_len,
+        ts_recv_ns,
+        ts_exch_ns,
+        1 if resets_book else 0,
+        update_count,
+    )
+    zeros = itertools.repeat(0)
+    body = b"".join(
+        map(pack_l2_update, sides, snapshots, zeros, prices, amounts, zeros)
+    )
+    return header, body
+
+
+def _encode_l2_batch(batch: L2Batch) -> tuple[bytes, bytes]:
+    updates = batch.updates
+    return _encode_l2_record(
+        batch.ts_recv_ns,
+        batch.ts_exch_ns,
+        batch.resets_book,
+        [update.side for update in updates],
+        [1 if update.is_snapshot else 0 for update in updates],
+        [update.price_ticks for update in updates],
+        [update.amount_lots for update in updates],
+    )
+
+
 class EvlogWriter:
     def __init__(
         self,
@@ -37,96 +126,165 @@ class EvlogWriter:
     ) -> None:
         self._path = Path(path)
         self._file: BinaryIO | None = None
+        self._mm: mmap.mmap | None = None
+        # Offset of the next record (file end once pending writes land).
+        self._cursor = 0
+        self._pending: list[bytes | bytearray] = []
+        self._pending_size = 0
+        self._hash = hashlib.sha256(usedforsecurity=False)
         self._exchange_id = exchange_id
         self._symbol_id = symbol_id
         self._quantizer_hash = quantizer_hash
 
     def __enter__(self) -> "EvlogWriter":
-        self._file = self._path.open("wb")
-        self._file.write(
-            pack_header(
-                exchange_id=self._exchange_id,
-                symbol_id=self._symbol_id,
-                quantizer_hash=self._quantizer_hash,
-            )
+        # Read/write so open_mmap can map the file for writing.
+        self._file = self._path.open("w+b")
+        header = pack_header(
+            exchange_id=self._exchange_id,
+            symbol_id=self._symbol_id,
+            quantizer_hash=self._quantizer_hash,
         )
+        self._file.write(header)
+        self._hash = hashlib.sha256(header, usedforsecurity=False)
+        # Records bypass the file object's buffer (writev on the fd), so the
+        # header must be on disk first and the position is tracked here.
+        self._file.flush()
+        self._cursor = len(header)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        if self._file is not None:
-            self._file.close()
-            self._file = None
+        try:
+            if self._file is not None:
+                self.flush_pending_writes()
+        finally:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+                if self._file is not None:
+                    # Drop the unused tail of the preallocated region.
+                    self._file.truncate(self._cursor)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def flush_pending_writes(self) -> None:
+        """Write queued records with one scatter-gather call (writev)."""
+        if self._file is None:
+            raise SchemaError("writer is closed")
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        self._pending_size = 0
+        if _HAS_WRITEV:
+            _writev_all(self._file.fileno(), pending)
+        else:
+            self._file.write(b"".join(pending))
+            self._file.flush()
+
+    def open_mmap(self, estimated_size: int) -> None:
+        """Write subsequent records straight into a mapping of the file.
+
+        The file is preallocated to `estimated_size` bytes past the current
+        position and the mapping doubles when a record would overrun it; the
+        file is trimmed to the bytes actually written on close. Saves the
+        per-record write syscall and kernel copy for bulk ingest.
+        """
+        if self._file is None:
+            raise SchemaError("writer is closed")
+        if self._mm is not None:
+            raise SchemaError("writer already mapped")
+        if estimated_size <= 0:
+            raise SchemaError("estimated_size must be positive")
+        self.flush_pending_writes()
+        self._map(self._cursor + estimated_size)
+
+    def _map(self, size: int) -> None:
+        assert self._file is not None
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_WRITE)
+
+    def _emit(self, header: bytes, body: bytes) -> None:
+        mm = self._mm
+        start = self._cursor
+        mid = start + len(header)
+        end = mid + len(body)
+        self._cursor = end
+        # Every byte lands exactly once and in order, so the running hash
+        # equals the finished file's SHA-256 without re-reading it.
+        self._hash.update(header)
+        self._hash.update(body)
+        if mm is None:
+            # Queued, not written: flushed in batches with one syscall.
+            self._pending.append(header)
+            self._pending.append(body)
+            self._pending_size += end - start
+            if self._pending_size >= _PENDING_LIMIT:
+                self.flush_pending_writes()
+            return
+        if end > len(mm):
+            size = len(mm)
+            while size < end:
+                size *= 2
+            # Remap rather than mmap.resize, which is not available everywhere.
+            mm.close()
+            self._mm = None
+            self._map(size)
+            mm = self._mm
+        mm[start:mid] = header
+        mm[mid:end] = body
+
+    @property
+    def sha256_hex(self) -> str:
+        """SHA-256 of everything written so far (the whole file once closed)."""
+        return self._hash.hexdigest()
 
     def tell(self) -> int:
+        """Offset of the next record, counting records still queued."""
         if self._file is None:
             raise SchemaError("writer is closed")
-        return int(self._file.tell())
+        return self._cursor
 
     def write_l2_batch(self, batch: L2Batch) -> None:
         if self._file is None:
             raise SchemaError("writer is closed")
+        self._emit(*_encode_l2_batch(batch))
 
-        ts_recv_ns = int(batch.ts_recv_ns)
-        ts_exch_ns = int(batch.ts_exch_ns)
-        _require_int64(ts_recv_ns, "ts_recv_ns")
-        _require_int64(ts_exch_ns, "ts_exch_ns")
-        if ts_recv_ns < 0 or ts_exch_ns < 0:
-            raise SchemaError("negative timestamp")
-
-        updates = batch.updates
-        update_count = len(updates)
-        if update_count < 0 or update_count > (1 << 32) - 1:
-            raise SchemaError(f"update_count out of u32 range: {update_count}")
-        payload_len = L2_BATCH_HEADER_SIZE + update_count * L2_UPDATE_SIZE
-        if payload_len % 8 != 0:
-            raise SchemaError("l2 payload size not 8-byte aligned")
-
-        payload = bytearray(payload_len)
-        struct.pack_into(
-            L2_BATCH_HEADER_FMT,
-            payload,
-            0,
-            ts_recv_ns,
-            ts_exch_ns,
-            1 if batch.resets_book else 0,
-            update_count,
-        )
+    def write_l2_batches(self, batches: Iterable[L2Batch]) -> list[int]:
+        """Write several batches; returns each record's file offset.
 
-        offset = L2_BATCH_HEADER_SIZE
-        for update in updates:
-            side_value = int(update.side)
-            if side_value not in (Side.BID, Side.ASK):
-                raise SchemaError(f"invalid side: {side_value}")
-            price_ticks = int(update.price_ticks)
-            amount_lots = int(update.amount_lots)
-            _require_int64(price_ticks, "price_ticks")
-            _require_int64(amount_lots, "amount_lots")
-            if price_ticks <= 0:
-                raise SchemaError("non-positive price_ticks")
-            if amount_lots < 0:
-                raise SchemaError("negative amount_lots")
-            struct.pack_into(
-                L2_UPDATE_FMT,
-                payload,
-                offset,
-                side_value,
-                1 if update.is_snapshot else 0,
-                0,
-                price_ticks,
-                amount_lots,
-                0,
+        Records are queued and flushed together (see flush_pending_writes),
+        so this is an index-building convenience, not a separate I/O path.
+        """
+        if self._file is None:
+            raise SchemaError("writer is closed")
+        offsets: list[int] = []
+        for batch in batches:
+            header, body = _encode_l2_batch(batch)
+            offsets.append(self._cursor)
+            self._emit(header, body)
+        return offsets
+
+    def write_l2_batch_arrays(self, batch: L2BatchArrays) -> None:
+        """Write a columnar batch; columns are validated once, not per row."""
+        if self._file is None:
+            raise SchemaError("writer is closed")
+        sides = batch.sides
+        if not (
+            len(batch.price_ticks)
+            == len(batch.amount_lots)
+            == len(batch.is_snapshot)
+            == len(sides)
+        ):
+            raise SchemaError("l2 column length mismatch")
+        self._emit(
+            *_encode_l2_record(
+                batch.ts_recv_ns,
+                batch.ts_exch_ns,
+                batch.resets_book,
+                sides,
+                batch.is_snapshot,
+                batch.price_ticks,
+                batch.amount_lots,
             )
-            offset += L2_UPDATE_SIZE
-
-        record_header = struct.pack(
-            RECORD_HEADER_FMT,
-            int(RecordType.L2_BATCH),
-            0,
-            0,
-            payload_len,
         )
-        if len(record_header) != RECORD_HEADER_SIZE:
-            raise SchemaError("record header size mismatch")
-        self._file.write(record_header)
-        self._file.write(payload)
-
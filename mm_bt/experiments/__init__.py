@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from mm_bt.experiments.psr_dsr import (
     deflated_sharpe_ratio,
+    deflated_sharpe_ratios,
     probabilistic_sharpe_ratio,
     sharpe_ratio,
 )
 
 __all__ = [
     "deflated_sharpe_ratio",
+    "deflated_sharpe_ratios",
     "probabilistic_sharpe_ratio",
     "sharpe_ratio",
 ]
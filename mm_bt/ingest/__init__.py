@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from mm_bt.ingest.compiler import CompileResult, compile_l2_csv
-from mm_bt.ingest.l2_batcher import iter_l2_batches
+from mm_bt.ingest.l2_batcher import iter_l2_batches, iter_l2_batches_arrays
 from mm_bt.ingest.quarantine import (
     JsonlQuarantineSink,
     ListQuarantineSink,
@@ -20,5 +20,6 @@ __all__ = [
     "QuarantineSink",
     "compile_l2_csv",
     "iter_l2_batches",
+    "iter_l2_batches_arrays",
     "record_quarantine",
 ]
@@ -2,33 +2,47 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
+import json
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
-from contextlib import nullcontext
+from typing import Iterable, Sequence
+from contextlib import ExitStack, nullcontext
 
 from mm_bt.core.config import FailurePolicy, QuarantineAction
 from mm_bt.core.errors import DeterminismError, SchemaError
 from mm_bt.core.hashing import (
+    HashingReader,
+    hash_bytes,
     hash_file,
-    hash_json,
     hash_json_bytes,
-    hash_text,
     hash_text_u64,
-    stable_json_dumps,
+    stable_json_dumps_bytes,
+    stable_json_dumps_signed,
 )
 from mm_bt.core.fixedpoint import Quantizer
 from mm_bt.evlog.format import VERSION as EVLOG_VERSION
 from mm_bt.evlog.index import IndexEntry, write_index
+from mm_bt.evlog.types import L2BatchArrays
 from mm_bt.evlog.writer import EvlogWriter
-from mm_bt.ingest.l2_batcher import iter_l2_batches
+from mm_bt.ingest.l2_batcher import iter_l2_batches_arrays
 from mm_bt.ingest.quarantine import JsonlQuarantineSink
 from mm_bt.io.tardis_csv import iter_l2_rows
 
 MANIFEST_VERSION = 1
 COMPILER_VERSION = 1
 
+# Parsed batches buffered ahead of the evlog writer thread.
+_WRITE_QUEUE_SIZE = 64
+
+# Hash of the compiler source as imported; it cannot change between compiles.
+_COMPILER_HASH = hash_file(Path(__file__))
+
 
 @dataclass(frozen=True, slots=True)
 class CompileResult:
@@ -70,6 +84,8 @@ def _manifest_payload(
     exchange_id: int,
     symbol_id: int,
     quantizer_hash: str,
+    failure_policy: FailurePolicy,
+    quarantine_action: QuarantineAction,
 ) -> dict[str, object]:
     payload: dict[str, object] = {
         "manifest_version": MANIFEST_VERSION,
@@ -96,11 +112,125 @@ def _manifest_payload(
             "sha256": quantizer_hash,
         },
         "format_version": EVLOG_VERSION,
+        "failure_policy": failure_policy.value,
+        "quarantine_action": quarantine_action.value,
     }
-    payload["manifest_sha256"] = hash_text(stable_json_dumps(payload))
     return payload
 
 
+def _stat_key(st: os.stat_result) -> tuple[int, int, int, int]:
+    return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _write_pipelined(
+    writer: EvlogWriter, batches: Iterable[L2BatchArrays]
+) -> list[IndexEntry]:
+    """Write batches on a dedicated thread fed through a bounded queue.
+
+    Parsing continues while records are encoded and written; a single
+    consumer keeps file order. Returns the index entries in write order.
+    """
+    pending: queue.Queue[L2BatchArrays | None] = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    entries: list[IndexEntry] = []
+    errors: list[BaseException] = []
+
+    def consume() -> None:
+        while True:
+            batch = pending.get()
+            if batch is None:
+                return
+            if errors:
+                # Keep draining so the producer never blocks on a full queue.
+                continue
+            try:
+                offset = writer.tell()
+                writer.write_l2_batch_arrays(batch)
+                entries.append(
+                    IndexEntry(ts_recv_ns=int(batch.ts_recv_ns), offset=offset)
+                )
+            except BaseException as exc:
+                errors.append(exc)
+
+    thread = threading.Thread(target=consume, name="evlog-writer", daemon=True)
+    thread.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            pending.put(batch)
+    finally:
+        pending.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
+    return entries
+
+
+def _reuse_compiled(
+    *,
+    manifest_path: Path,
+    evlog_path: Path,
+    index_path: Path,
+    paths: list[Path],
+    quantizer: Quantizer,
+    failure_policy: FailurePolicy,
+    quarantine_action: QuarantineAction,
+) -> CompileResult | None:
+    """Result of an earlier identical compile whose outputs are intact.
+
+    The manifest must be signed and canonical, name the same compiler,
+    format, quantizer, failure policy and input paths, and every input and
+    output must still hash to its recorded digest. Hashing streams the
+    files; no CSV is parsed.
+    """
+    try:
+        raw = manifest_path.read_bytes()
+        manifest = json.loads(raw)
+        manifest.pop("manifest_sha256")
+        if raw != stable_json_dumps_signed(manifest, "manifest_sha256") + b"\n":
+            return None
+        quantizer_payload = {
+            "price_increment": str(quantizer.price_increment),
+            "amount_increment": str(quantizer.amount_increment),
+        }
+        expected: dict[str, object] = {
+            "manifest_version": MANIFEST_VERSION,
+            "compiler_version": COMPILER_VERSION,
+            "compiler_sha256": _COMPILER_HASH,
+            "format_version": EVLOG_VERSION,
+            "quantizer": {
+                **quantizer_payload,
+                "sha256": hash_json_bytes(quantizer_payload).hex(),
+            },
+            "failure_policy": failure_policy.value,
+            "quarantine_action": quarantine_action.value,
+        }
+        if any(manifest.get(key) != value for key, value in expected.items()):
+            return None
+        files = [*paths, evlog_path, index_path]
+        recorded = [entry["path"] for entry in manifest["inputs"]]
+        recorded += [manifest["evlog"]["path"], manifest["index"]["path"]]
+        if recorded != [str(path) for path in files]:
+            return None
+        record_count = manifest["record_count"]
+        if type(record_count) is not int:
+            return None
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            digests = list(pool.map(hash_file, files))
+        recorded = [entry["sha256"] for entry in manifest["inputs"]]
+        recorded += [manifest["evlog"]["sha256"], manifest["index"]["sha256"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if digests != recorded:
+        return None
+    return CompileResult(
+        evlog_path=evlog_path,
+        index_path=index_path,
+        manifest_path=manifest_path,
+        record_count=record_count,
+    )
+
+
 def compile_l2_csv(
     *,
     l2_path: str | Path | None = None,
@@ -111,7 +241,17 @@ def compile_l2_csv(
     quarantine_action: QuarantineAction = QuarantineAction.HALT,
     quarantine_path: str | Path | None = None,
     output_prefix: str | None = None,
+    strict_determinism: bool = False,
+    reuse_existing: bool = False,
 ) -> CompileResult:
+    """Compile L2 CSV input(s) into an evlog, index and signed manifest.
+
+    With `reuse_existing`, an earlier HARD_FAIL compile of the same inputs
+    (by content), quantizer and compiler is returned as is when its outputs
+    are intact, instead of parsing the inputs again. Other failure policies
+    always recompile, and outputs they wrote (recorded in the manifest) are
+    never reused: their rows may have been skipped or quarantined.
+    """
     if (l2_path is None) == (l2_paths is None):
         raise SchemaError("exactly one of l2_path or l2_paths is required")
     if l2_paths is None:
@@ -147,74 +287,113 @@ def compile_l2_csv(
         else quarantine_path
     )
 
-    input_entries = [
-        {"path": str(path), "sha256": hash_file(path)} for path in paths
-    ]
-    inputs_hash = hash_json(input_entries)
+    if reuse_existing and failure_policy == FailurePolicy.HARD_FAIL:
+        reused = _reuse_compiled(
+            manifest_path=manifest_path,
+            evlog_path=evlog_path,
+            index_path=index_path,
+            paths=paths,
+            quantizer=quantizer,
+            failure_policy=failure_policy,
+            quarantine_action=quarantine_action,
+        )
+        if reused is not None:
+            return reused
 
-    entries: list[IndexEntry] = []
-    record_count = 0
-    row_iters = [iter_l2_rows(path) for path in paths]
-    first_row = None
-    first_iter = None
-    remaining_iters = []
-    for idx, row_iter in enumerate(row_iters):
-        try:
-            first_row = next(row_iter)
-            first_iter = row_iter
-            remaining_iters = list(row_iters[idx + 1 :])
-            break
-        except StopIteration:
-            continue
-    if first_row is None or first_iter is None:
-        raise SchemaError("no rows in input files")
-    exchange = first_row.exchange
-    symbol = first_row.symbol
-    exchange_id = hash_text_u64(exchange)
-    symbol_id = hash_text_u64(symbol)
-    quantizer_payload = {
-        "price_increment": str(quantizer.price_increment),
-        "amount_increment": str(quantizer.amount_increment),
-    }
-    quantizer_hash_hex = hash_json(quantizer_payload)
-    quantizer_hash_bytes = hash_json_bytes(quantizer_payload)
-    sink_context = (
-        JsonlQuarantineSink(quarantine_path)
-        if failure_policy == FailurePolicy.QUARANTINE and quarantine_path is not None
-        else nullcontext(None)
-    )
-    with sink_context as sink:
-        with EvlogWriter(
-            evlog_path,
-            exchange_id=exchange_id,
-            symbol_id=symbol_id,
-            quantizer_hash=quantizer_hash_bytes,
-        ) as writer:
-            for batch in iter_l2_batches(
-                itertools.chain([first_row], first_iter, *remaining_iters),
-                quantizer,
-                failure_policy=failure_policy,
-                quarantine_action=quarantine_action,
-                quarantine_sink=sink,
-                source="",
-            ):
-                offset = writer.tell()
-                writer.write_l2_batch(batch)
-                entries.append(
-                    IndexEntry(ts_recv_ns=int(batch.ts_recv_ns), offset=offset)
+    with ExitStack() as stack:
+        # Inputs are hashed as they are parsed; that digest is the one
+        # recorded. Under strict_determinism an independent hash of every
+        # input also runs on worker threads (hashlib releases the GIL) and
+        # must match it.
+        hash_futures: list[Future[str]] = []
+        if strict_determinism:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=len(paths)))
+            stack.callback(pool.shutdown, wait=True, cancel_futures=True)
+            hash_futures = [pool.submit(hash_file, path) for path in paths]
+        readers = [
+            stack.enter_context(HashingReader(path.open("rb", buffering=0)))
+            for path in paths
+        ]
+        # Otherwise a file whose identity, size and mtime are unchanged at
+        # the end is taken as unchanged, and only the others are re-read.
+        open_stats = [_stat_key(os.fstat(reader.fileno())) for reader in readers]
+        row_iters = [
+            iter_l2_rows(path, fileobj=reader)
+            for path, reader in zip(paths, readers)
+        ]
+        # Finish the row generators before their readers are closed.
+        for row_iter in row_iters:
+            stack.callback(row_iter.close)
+        # Peek the first row (it names the stream) and put it back in front
+        # with one flat chain; chain stays in C per row, where a merging
+        # generator would add a Python frame resume to every row.
+        first_row = None
+        idx = 0
+        for idx, row_iter in enumerate(row_iters):
+            first_row = next(row_iter, None)
+            if first_row is not None:
+                break
+        if first_row is None:
+            raise SchemaError("no rows in input files")
+        rows = itertools.chain((first_row,), *row_iters[idx:])
+        exchange = first_row.exchange
+        symbol = first_row.symbol
+        exchange_id = hash_text_u64(exchange)
+        symbol_id = hash_text_u64(symbol)
+        quantizer_payload = {
+            "price_increment": str(quantizer.price_increment),
+            "amount_increment": str(quantizer.amount_increment),
+        }
+        quantizer_hash_bytes = hash_json_bytes(quantizer_payload)
+        quantizer_hash_hex = quantizer_hash_bytes.hex()
+        sink_context = (
+            JsonlQuarantineSink(quarantine_path)
+            if failure_policy == FailurePolicy.QUARANTINE
+            and quarantine_path is not None
+            else nullcontext(None)
+        )
+        with sink_context as sink:
+            with EvlogWriter(
+                evlog_path,
+                exchange_id=exchange_id,
+                symbol_id=symbol_id,
+                quantizer_hash=quantizer_hash_bytes,
+            ) as writer:
+                entries = _write_pipelined(
+                    writer,
+                    # Columnar batches: no per-update objects on this path.
+                    iter_l2_batches_arrays(
+                        rows,
+                        quantizer,
+                        failure_policy=failure_policy,
+                        quarantine_action=quarantine_action,
+                        quarantine_sink=sink,
+                        source="",
+                    ),
                 )
-                record_count += 1
-
-    write_index(index_path, entries)
-
-    for entry in input_entries:
-        path = Path(entry["path"])
-        current_hash = hash_file(path)
-        if current_hash != entry["sha256"]:
-            raise DeterminismError(f"input changed during compile: {path}")
-    compiler_hash = hash_file(Path(__file__))
-    evlog_hash = hash_file(evlog_path)
-    index_hash = hash_file(index_path)
+                record_count = len(entries)
+            evlog_hash = writer.sha256_hex
+
+        input_entries = []
+        for idx, (path, reader) in enumerate(zip(paths, readers)):
+            reader.drain()
+            digest = reader.hexdigest()
+            if strict_determinism:
+                changed = hash_futures[idx].result() != digest
+            else:
+                changed = _stat_key(os.stat(path)) != open_stats[idx] and (
+                    hash_file(path) != digest
+                )
+            if changed:
+                raise DeterminismError(f"input changed during compile: {path}")
+            input_entries.append({"path": str(path), "sha256": digest})
+
+    # Folded in only now, from the digests taken while parsing; the entries
+    # are unique per compile, so they skip hash_json's memo.
+    inputs_hash = hash_bytes(stable_json_dumps_bytes(input_entries))
+    index_hasher = hashlib.sha256(usedforsecurity=False)
+    write_index(index_path, entries, hasher=index_hasher)
+    index_hash = index_hasher.hexdigest()
     manifest = _manifest_payload(
         inputs=input_entries,
         inputs_hash=inputs_hash,
@@ -222,7 +401,7 @@ def compile_l2_csv(
         evlog_hash=evlog_hash,
         index_path=index_path,
         index_hash=index_hash,
-        compiler_hash=compiler_hash,
+        compiler_hash=_COMPILER_HASH,
         record_count=record_count,
         quantizer=quantizer,
         exchange=exchange,
@@ -230,10 +409,12 @@ def compile_l2_csv(
         exchange_id=exchange_id,
         symbol_id=symbol_id,
         quantizer_hash=quantizer_hash_hex,
+        failure_policy=failure_policy,
+        quarantine_action=quarantine_action,
     )
-    manifest_path.write_text(
-        stable_json_dumps(manifest) + "\n",
-        encoding="utf-8",
+    # Signed with manifest_sha256, the digest of the rest of the manifest.
+    manifest_path.write_bytes(
+        stable_json_dumps_signed(manifest, "manifest_sha256") + b"\n"
     )
     return CompileResult(
         evlog_path=evlog_path,
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from array import array
+from itertools import repeat
 from typing import Iterable, Iterator
 
 from mm_bt.core.config import FailurePolicy, QuarantineAction
 from mm_bt.core.errors import OrderingError, QuantizationError, SchemaError
 from mm_bt.core.fixedpoint import Quantizer
-from mm_bt.core.types import TsNs
-from mm_bt.evlog.types import L2Batch, L2Update
+from mm_bt.core.types import Lots, Side, Ticks, TsNs
+from mm_bt.evlog.types import L2Batch, L2BatchArrays, L2Update
 from mm_bt.ingest.quarantine import QuarantineRecord, QuarantineSink, record_quarantine
 from mm_bt.io.tardis_csv import L2Row
 
+# Entries per quantization memo before it is reset.
+_MEMO_LIMIT = 1 << 16
+# Columns are int64 arrays; larger quantized values are rejected per row.
+_INT64_MAX = (1 << 63) - 1
+
 
 def _handle_error(
     exc: Exception,
@@ -23,36 +30,43 @@ def _handle_error(
     line_number: int,
     payload: object,
 ) -> QuarantineAction:
-    record_quarantine(
-        policy,
-        sink,
-        QuarantineRecord(
-            reason=str(exc),
-            source=source,
-            line_number=line_number,
-            payload=payload,
-        ),
-    )
-    if policy == FailurePolicy.HARD_FAIL or action == QuarantineAction.HALT:
+    if policy == FailurePolicy.HARD_FAIL:
+        # Nothing would consume a record; fail before building one.
+        raise exc
+    if sink is not None:
+        record_quarantine(
+            policy,
+            sink,
+            QuarantineRecord(
+                reason=str(exc),
+                source=source,
+                line_number=line_number,
+                payload=payload,
+            ),
+        )
+    if action == QuarantineAction.HALT:
         raise exc
     return action
 
 
-def iter_l2_batches(
+# (ts_recv_ns, ts_exch_ns, resets_book, is_snapshot, sides, prices, amounts);
+# prices and amounts are array('q').
+_L2Columns = tuple[int, int, bool, bool, list[Side], array, array]
+
+
+def _iter_l2_columns(
     rows: Iterable[L2Row],
     quantizer: Quantizer,
     *,
     failure_policy: FailurePolicy,
-    quarantine_action: QuarantineAction = QuarantineAction.HALT,
-    quarantine_sink: QuarantineSink | None = None,
-    source: str = "",
-) -> Iterator[L2Batch]:
-    """
-    Invariants:
-    - local_timestamp is non-decreasing; no reordering.
-    - within a batch, is_snapshot is constant.
-    - updates are emitted in file order.
-    - quarantine_action controls post-error handling for quarantined rows/batches.
+    quarantine_action: QuarantineAction,
+    quarantine_sink: QuarantineSink | None,
+    source: str,
+) -> Iterator[_L2Columns]:
+    """Batching core shared by iter_l2_batches and iter_l2_batches_arrays.
+
+    Yields each batch as update columns; is_snapshot is per batch since it
+    is constant within one. Yielded columns are handed over, never reused.
     """
 
     prev_local_ts: int | None = None
@@ -64,7 +78,20 @@ def iter_l2_batches(
     batch_is_snapshot: bool | None = None
     batch_resets_book: bool | None = None
     batch_ts_exch_us: int | None = None
-    updates: list[L2Update] = []
+    # Fresh columns start each batch, so a yielded batch owns them without a
+    # copy; the bound appends are rebound along with them. The int columns
+    # are packed int64 arrays; sides stay Side members, which L2Update takes
+    # as they are.
+    sides: list[Side] = []
+    prices = array("q")
+    amounts = array("q")
+    append_side = sides.append
+    append_price = prices.append
+    append_amount = amounts.append
+    quantize_price = quantizer.quantize_price
+    quantize_amount = quantizer.quantize_amount
+    price_memo: dict[str, Ticks] = {}
+    amount_memo: dict[str, Lots] = {}
     skip_batch = False
 
     for row in rows:
@@ -93,7 +120,7 @@ def iter_l2_batches(
                 if batch_local_ts is None:
                     batch_local_ts = row.local_timestamp_us
                 skip_batch = True
-                updates = []
+                del sides[:], prices[:], amounts[:]
                 batch_ts_exch_us = None
                 prev_local_ts = row.local_timestamp_us
                 continue
@@ -122,14 +149,14 @@ def iter_l2_batches(
             batch_is_snapshot = None
             batch_resets_book = None
             batch_ts_exch_us = None
-            updates = []
+            del sides[:], prices[:], amounts[:]
 
         if batch_local_ts is None:
             batch_local_ts = row.local_timestamp_us
             batch_is_snapshot = row.is_snapshot
             batch_resets_book = (not prev_is_snapshot) and row.is_snapshot
         elif row.local_timestamp_us != batch_local_ts:
-            if updates:
+            if sides:
                 if batch_ts_exch_us is None:
                     action = _handle_error(
                         SchemaError("missing exchange timestamp in batch"),
@@ -144,20 +171,26 @@ def iter_l2_batches(
                         QuarantineAction.SKIP_ROW,
                         QuarantineAction.SKIP_BATCH,
                     ):
-                        updates = []
-                if updates:
-                    yield L2Batch(
-                        ts_recv_ns=TsNs(batch_local_ts * 1_000),
-                        ts_exch_ns=TsNs(batch_ts_exch_us * 1_000),
-                        resets_book=bool(batch_resets_book),
-                        updates=tuple(updates),
+                        del sides[:], prices[:], amounts[:]
+                if sides:
+                    yield (
+                        batch_local_ts * 1_000,
+                        batch_ts_exch_us * 1_000,
+                        bool(batch_resets_book),
+                        bool(batch_is_snapshot),
+                        sides,
+                        prices,
+                        amounts,
                     )
                     prev_is_snapshot = bool(batch_is_snapshot)
             batch_local_ts = row.local_timestamp_us
             batch_is_snapshot = row.is_snapshot
             batch_resets_book = (not prev_is_snapshot) and row.is_snapshot
             batch_ts_exch_us = None
-            updates = []
+            sides, prices, amounts = [], array("q"), array("q")
+            append_side = sides.append
+            append_price = prices.append
+            append_amount = amounts.append
 
         if batch_is_snapshot is not None and row.is_snapshot != batch_is_snapshot:
             action = _handle_error(
@@ -176,14 +209,34 @@ def iter_l2_batches(
                 continue
             if action == QuarantineAction.SKIP_BATCH:
                 skip_batch = True
-                updates = []
+                del sides[:], prices[:], amounts[:]
                 batch_ts_exch_us = None
                 prev_local_ts = row.local_timestamp_us
                 continue
 
+        # L2 streams revisit the same few price/amount strings constantly;
+        # each distinct string is quantized once. Failures are not memoized.
+        price_ticks = price_memo.get(row.price)
+        amount_lots = amount_memo.get(row.amount)
         try:
-            price_ticks = quantizer.quantize_price(row.price)
-            amount_lots = quantizer.quantize_amount(row.amount)
+            if price_ticks is None:
+                price_ticks = quantize_price(row.price)
+                if price_ticks > _INT64_MAX:
+                    raise QuantizationError(
+                        f"price_ticks out of int64 range: {price_ticks}"
+                    )
+                if len(price_memo) >= _MEMO_LIMIT:
+                    price_memo.clear()
+                price_memo[row.price] = price_ticks
+            if amount_lots is None:
+                amount_lots = quantize_amount(row.amount)
+                if amount_lots > _INT64_MAX:
+                    raise QuantizationError(
+                        f"amount_lots out of int64 range: {amount_lots}"
+                    )
+                if len(amount_memo) >= _MEMO_LIMIT:
+                    amount_memo.clear()
+                amount_memo[row.amount] = amount_lots
         except QuantizationError as exc:
             action = _handle_error(
                 QuantizationError(f"{exc} at line {row.line_number}"),
@@ -199,24 +252,19 @@ def iter_l2_batches(
                 continue
             if action == QuarantineAction.SKIP_BATCH:
                 skip_batch = True
-                updates = []
+                del sides[:], prices[:], amounts[:]
                 batch_ts_exch_us = None
                 prev_local_ts = row.local_timestamp_us
                 continue
 
-        updates.append(
-            L2Update(
-                side=row.side,
-                price_ticks=price_ticks,
-                amount_lots=amount_lots,
-                is_snapshot=row.is_snapshot,
-            )
-        )
+        append_side(row.side)
+        append_price(price_ticks)
+        append_amount(amount_lots)
         batch_ts_exch_us = row.timestamp_us
         prev_local_ts = row.local_timestamp_us
 
     if batch_local_ts is not None:
-        if updates:
+        if sides:
             if batch_ts_exch_us is None:
                 _handle_error(
                     SchemaError("missing exchange timestamp in batch"),
@@ -228,10 +276,79 @@ def iter_l2_batches(
                     payload=None,
                 )
             else:
-                yield L2Batch(
-                    ts_recv_ns=TsNs(batch_local_ts * 1_000),
-                    ts_exch_ns=TsNs(batch_ts_exch_us * 1_000),
-                    resets_book=bool(batch_resets_book),
-                    updates=tuple(updates),
+                yield (
+                    batch_local_ts * 1_000,
+                    batch_ts_exch_us * 1_000,
+                    bool(batch_resets_book),
+                    bool(batch_is_snapshot),
+                    sides,
+                    prices,
+                    amounts,
                 )
 
+
+def iter_l2_batches(
+    rows: Iterable[L2Row],
+    quantizer: Quantizer,
+    *,
+    failure_policy: FailurePolicy,
+    quarantine_action: QuarantineAction = QuarantineAction.HALT,
+    quarantine_sink: QuarantineSink | None = None,
+    source: str = "",
+) -> Iterator[L2Batch]:
+    """
+    Invariants:
+    - local_timestamp is non-decreasing; no reordering.
+    - within a batch, is_snapshot is constant.
+    - updates are emitted in file order.
+    - quarantine_action controls post-error handling for quarantined rows/batches.
+    """
+    for ts_recv_ns, ts_exch_ns, resets_book, is_snapshot, sides, prices, amounts in (
+        _iter_l2_columns(
+            rows,
+            quantizer,
+            failure_policy=failure_policy,
+            quarantine_action=quarantine_action,
+            quarantine_sink=quarantine_sink,
+            source=source,
+        )
+    ):
+        yield L2Batch(
+            ts_recv_ns=TsNs(ts_recv_ns),
+            ts_exch_ns=TsNs(ts_exch_ns),
+            resets_book=resets_book,
+            updates=tuple(
+                [*map(L2Update, sides, prices, amounts, repeat(is_snapshot))]
+            ),
+        )
+
+
+def iter_l2_batches_arrays(
+    rows: Iterable[L2Row],
+    quantizer: Quantizer,
+    *,
+    failure_policy: FailurePolicy,
+    quarantine_action: QuarantineAction = QuarantineAction.HALT,
+    quarantine_sink: QuarantineSink | None = None,
+    source: str = "",
+) -> Iterator[L2BatchArrays]:
+    """Like iter_l2_batches, but yields columnar batches (no L2Update objects)."""
+    for ts_recv_ns, ts_exch_ns, resets_book, is_snapshot, sides, prices, amounts in (
+        _iter_l2_columns(
+            rows,
+            quantizer,
+            failure_policy=failure_policy,
+            quarantine_action=quarantine_action,
+            quarantine_sink=quarantine_sink,
+            source=source,
+        )
+    ):
+        yield L2BatchArrays(
+            ts_recv_ns=TsNs(ts_recv_ns),
+            ts_exch_ns=TsNs(ts_exch_ns),
+            resets_book=resets_book,
+            sides=array("B", sides),
+            price_ticks=prices,
+            amount_lots=amounts,
+            is_snapshot=array("B", [is_snapshot]) * len(sides),
+        )
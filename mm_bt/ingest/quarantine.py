@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict, is_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
-import json
+import functools
 from pathlib import Path
-from typing import Any, Protocol, TextIO
+from typing import Any, BinaryIO, Protocol
 
 from mm_bt.core.config import FailurePolicy
 from mm_bt.core.errors import SchemaError
+from mm_bt.core.hashing import stable_json_dumps_bytes
+
+
+_WRITE_BUFFER_SIZE = 64 * 1024
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,11 +47,27 @@ def record_quarantine(
         sink.record(record)
 
 
+@functools.lru_cache(maxsize=256)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
 def _normalize_payload(value: Any) -> Any:
     if isinstance(value, Enum):
         return value.name.lower()
-    if is_dataclass(value):
-        return _normalize_payload(asdict(value))
+    if is_dataclass(value) and not isinstance(value, type):
+        # Same result as normalizing asdict(value), without its deep copy:
+        # fields are read directly, with the names cached per type.
+        return {
+            name: _normalize_payload(getattr(value, name))
+            for name in _field_names(type(value))
+        }
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # Named tuples (e.g. L2Row) are written as objects, like dataclasses.
+        return {
+            name: _normalize_payload(item)
+            for name, item in zip(value._fields, value)
+        }
     if isinstance(value, dict):
         return {str(k): _normalize_payload(v) for k, v in value.items()}
     if isinstance(value, (list, tuple)):
@@ -58,12 +78,14 @@ def _normalize_payload(value: Any) -> Any:
 @dataclass
 class JsonlQuarantineSink:
     path: str | Path
-    _file: TextIO | None = None
+    _file: BinaryIO | None = None
 
     def __enter__(self) -> "JsonlQuarantineSink":
         if self._file is not None:
             raise SchemaError("quarantine sink already open")
-        self._file = Path(self.path).open("w", encoding="utf-8", newline="")
+        # Lines are ASCII JSON, so they are written as bytes through one
+        # buffer; bursts of bad rows become a few large writes.
+        self._file = Path(self.path).open("wb", buffering=_WRITE_BUFFER_SIZE)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -80,8 +102,6 @@ class JsonlQuarantineSink:
             "line_number": record.line_number,
             "payload": _normalize_payload(record.payload),
         }
-        data = json.dumps(
-            payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-        )
-        self._file.write(data + "\n")
-
+        write = self._file.write
+        write(stable_json_dumps_bytes(payload))
+        write(b"\n")
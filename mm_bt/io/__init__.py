@@ -15,7 +15,9 @@ from mm_bt.io.tardis_download import (
     DownloadPlan,
     build_download_plan,
     canonical_tardis_path,
+    download_many,
     download_tardis_csv_gz,
+    iter_downloads,
 )
 from mm_bt.io.tardis_locator import TardisLocator, locate_tardis_files
 
@@ -32,7 +34,9 @@ __all__ = [
     "TardisLocator",
     "build_download_plan",
     "canonical_tardis_path",
+    "download_many",
     "download_tardis_csv_gz",
+    "iter_downloads",
     "iter_l2_rows",
     "locate_tardis_files",
 ]
@@ -3,69 +3,76 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from mm_bt.core.decimal_ctx import parse_decimal
+from mm_bt.core.decimal_ctx import DECIMAL_CTX, parse_decimal
 from mm_bt.core.errors import SchemaError
 from mm_bt.io.tardis_csv import L2Row, iter_l2_rows
 
 _INFER_MAX_ROWS = 1000
 
 
+def _parse_scaled(value: str) -> tuple[int, int] | None:
+    """Parse a plain `digits[.digits]` string as (value * 10**scale, scale).
+
+    The scale counts every fractional digit, trailing zeros included, like
+    the Decimal exponent. Returns None for anything else (signs, exponents,
+    special values, ...), which go through parse_decimal instead.
+    """
+    text = value.strip()
+    if not text.isascii():
+        return None
+    ipart, _, frac = text.partition(".")
+    if not ipart.isdigit() or (frac and not frac.isdigit()):
+        return None
+    return int(ipart + frac), len(frac)
+
+
 @dataclass
 class _IncrementStats:
-    scale: int = 0
-    gcd_value: int | None = None
-    first_value: int | None = None
-    has_distinct: bool = False
-
-    def add(self, value: Decimal, *, field: str, allow_zero: bool) -> None:
-        if value.is_nan() or value.is_infinite():
-            raise SchemaError(f"{field} non-finite")
-        if value == 0:
+    # Non-zero values as value * 10**exp pairs; rescaled to a common scale
+    # and reduced with one multi-argument gcd in finish().
+    values: list[int] = field(default_factory=list)
+    exps: list[int] = field(default_factory=list)
+
+    def add(self, scaled: int, exp: int, *, field: str, allow_zero: bool) -> None:
+        """Add the value scaled / 10**exp (see _parse_field)."""
+        if scaled == 0:
             if allow_zero:
                 return
             raise SchemaError(f"{field} must be positive")
-        if value < 0:
+        if scaled < 0:
             raise SchemaError(f"{field} negative")
-        exp = -value.as_tuple().exponent
-        if exp < 0:
-            exp = 0
-        if exp > self.scale:
-            factor = 10 ** (exp - self.scale)
-            if self.gcd_value is not None:
-                self.gcd_value *= factor
-            if self.first_value is not None:
-                self.first_value *= factor
-            self.scale = exp
-        scaled = value.scaleb(self.scale).to_integral_exact()
-        val = int(scaled)
-        if self.gcd_value is None:
-            self.gcd_value = val
-            self.first_value = val
-            return
-        if val != self.first_value:
-            self.has_distinct = True
-        self.gcd_value = math.gcd(self.gcd_value, val)
+        self.values.append(scaled)
+        self.exps.append(exp)
 
     def finish(self, *, field: str) -> Decimal:
-        if self.gcd_value is None:
+        if not self.values:
             raise SchemaError(f"{field} has no positive values")
-        if not self.has_distinct:
+        scale = max(self.exps)
+        scaled = [
+            value * 10 ** (scale - exp) for value, exp in zip(self.values, self.exps)
+        ]
+        if min(scaled) == max(scaled):
             raise SchemaError(f"{field} has no distinct values to infer increment")
-        return Decimal(self.gcd_value).scaleb(-self.scale)
+        return Decimal(math.gcd(*scaled)).scaleb(-scale)
 
 
-def _parse_decimal_field(row: L2Row, value: str, field: str) -> Decimal:
+def _parse_field(row: L2Row, value: str, field: str) -> tuple[int, int]:
+    parsed = _parse_scaled(value)
+    if parsed is not None:
+        return parsed
     try:
-        return parse_decimal(value)
+        decimal = parse_decimal(value)
     except ValueError as exc:
         raise SchemaError(
             f"{field} invalid at line {row.line_number} in {row.source}: {exc}"
         ) from exc
+    exp = max(-decimal.as_tuple().exponent, 0)
+    return int(decimal.scaleb(exp, DECIMAL_CTX)), exp
 
 
 def _iter_rows(paths: Sequence[str | Path]) -> Iterable[L2Row]:
@@ -83,10 +90,10 @@ def infer_l2_increments(
     amount_stats = _IncrementStats()
     seen = 0
     for row in _iter_rows(l2_paths):
-        price = _parse_decimal_field(row, row.price, "price")
-        amount = _parse_decimal_field(row, row.amount, "amount")
-        price_stats.add(price, field="price", allow_zero=False)
-        amount_stats.add(amount, field="amount", allow_zero=True)
+        price = _parse_field(row, row.price, "price")
+        amount = _parse_field(row, row.amount, "amount")
+        price_stats.add(*price, field="price", allow_zero=False)
+        amount_stats.add(*amount, field="amount", allow_zero=True)
         seen += 1
         if seen >= _INFER_MAX_ROWS:
             break
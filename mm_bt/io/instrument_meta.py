@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
+import functools
 import importlib
+import inspect
 import pkgutil
 import json
 import os
 from pathlib import Path
-from typing import Callable, Protocol
+from types import MappingProxyType
+from typing import Callable, Mapping, Protocol
 
 from mm_bt.core.decimal_ctx import parse_decimal
 from mm_bt.core.errors import SchemaError
 from mm_bt.core.fixedpoint import Quantizer
 
+try:  # Optional accelerator; the stdlib parser is used without it.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass(frozen=True, slots=True)
 class InstrumentMeta:
@@ -25,9 +34,14 @@ class InstrumentMeta:
     min_trade_amount: str | None
 
     def quantizer(self) -> Quantizer:
-        return Quantizer.from_strings(
-            self.price_increment, self.amount_increment
-        )
+        return _quantizer_for(self.price_increment, self.amount_increment)
+
+
+# Built on first use and shared: instruments mostly repeat a handful of
+# increment pairs, and Quantizer is immutable.
+@functools.lru_cache(maxsize=4096)
+def _quantizer_for(price_increment: str, amount_increment: str) -> Quantizer:
+    return Quantizer.from_strings(price_increment, amount_increment)
 
 
 class InstrumentMetaProvider(Protocol):
@@ -51,74 +65,140 @@ def _require_str(value: object, field: str) -> str:
     return value
 
 
-class StaticJsonProvider:
-    def __init__(self, path: str | Path) -> None:
-        p = Path(path)
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if not isinstance(data, dict):
-            raise SchemaError("instrument meta must be an object")
-        allowed_top = {"version", "instruments"}
-        if set(data.keys()) != allowed_top:
-            raise SchemaError("unexpected top-level keys in instrument meta")
-        if data["version"] != 0:
-            raise SchemaError("unsupported instrument meta version")
-        instruments = data["instruments"]
-        if not isinstance(instruments, list):
-            raise SchemaError("instruments must be a list")
+def _loads(data: bytes) -> object:
+    # Parsed from bytes either way, skipping a separate str decode.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-        self._by_key: dict[tuple[str, str, str], InstrumentMeta] = {}
-        for entry in instruments:
-            if not isinstance(entry, dict):
-                raise SchemaError("instrument entry must be an object")
-            allowed = {
-                "exchange",
-                "symbol",
-                "date",
-                "price_increment",
-                "amount_increment",
-                "min_trade_amount",
-            }
-            if not set(entry.keys()).issubset(allowed):
-                raise SchemaError("unexpected keys in instrument entry")
-            exchange = _require_str(entry.get("exchange"), "exchange")
-            symbol = _require_str(entry.get("symbol"), "symbol")
-            date = _require_str(entry.get("date"), "date")
-            _validate_date(date)
-            price_increment = _require_str(
-                entry.get("price_increment"), "price_increment"
-            )
-            amount_increment = _require_str(
-                entry.get("amount_increment"), "amount_increment"
-            )
-            min_trade_amount = entry.get("min_trade_amount")
-            if min_trade_amount is not None:
-                min_trade_amount = _require_str(
-                    min_trade_amount, "min_trade_amount"
-                )
-
-            # Validate decimals early.
-            try:
-                parse_decimal(price_increment)
-                parse_decimal(amount_increment)
-                if min_trade_amount is not None:
-                    parse_decimal(min_trade_amount)
-            except ValueError as exc:
-                raise SchemaError(f"invalid decimal in instrument meta: {exc}") from exc
-
-            meta = InstrumentMeta(
-                exchange=exchange,
-                symbol=symbol,
-                date=date,
-                price_increment=price_increment,
-                amount_increment=amount_increment,
-                min_trade_amount=min_trade_amount,
+
+def _read_json(path: str) -> object:
+    return _loads(Path(path).read_bytes())
+
+
+def _file_key(path: Path) -> tuple[str, int, int]:
+    """(resolved path, mtime_ns, size): changes whenever the file is rewritten."""
+    st = path.stat()
+    return str(path.resolve()), st.st_mtime_ns, st.st_size
+
+
+_MetaByKey = Mapping[tuple[str, str, str], InstrumentMeta]
+
+
+_TOP_KEYS = frozenset({"version", "instruments"})
+_ENTRY_KEYS = frozenset(
+    {
+        "exchange",
+        "symbol",
+        "date",
+        "price_increment",
+        "amount_increment",
+        "min_trade_amount",
+    }
+)
+_REQUIRED_FIELDS = (
+    "exchange",
+    "symbol",
+    "date",
+    "price_increment",
+    "amount_increment",
+)
+
+
+def _check_decimals(*values: str | None) -> None:
+    try:
+        for value in values:
+            if value is not None:
+                parse_decimal(value)
+    except ValueError as exc:
+        raise SchemaError(f"invalid decimal in instrument meta: {exc}") from exc
+
+
+def _parse_entry(entry: object) -> InstrumentMeta:
+    if not isinstance(entry, dict):
+        raise SchemaError("instrument entry must be an object")
+    values = [entry.get(name) for name in _REQUIRED_FIELDS]
+    # One pass over the common all-valid case; the per-field walk below only
+    # runs to report the first offending field, in declaration order.
+    if not all([type(value) is str and value for value in values]):
+        for name, value in zip(_REQUIRED_FIELDS, values):
+            _require_str(value, name)
+            if name == "date":
+                _validate_date(value)
+    exchange, symbol, date, price_increment, amount_increment = values
+    _validate_date(date)
+    min_trade_amount = entry.get("min_trade_amount")
+    if min_trade_amount is not None:
+        min_trade_amount = _require_str(min_trade_amount, "min_trade_amount")
+    _check_decimals(price_increment, amount_increment, min_trade_amount)
+    return InstrumentMeta(
+        exchange=exchange,
+        symbol=symbol,
+        date=date,
+        price_increment=price_increment,
+        amount_increment=amount_increment,
+        min_trade_amount=min_trade_amount,
+    )
+
+
+def _parse_meta_file(data: object, *, label: str, strict: bool) -> _MetaByKey:
+    """Validate a {version, instruments} document; shared by file and cache.
+
+    `strict` additionally rejects unknown entry keys and duplicate entries.
+    """
+    if not isinstance(data, dict):
+        raise SchemaError(f"{label} must be an object")
+    if data.keys() != _TOP_KEYS:
+        raise SchemaError(f"unexpected top-level keys in {label}")
+    if data["version"] != 0:
+        raise SchemaError(f"unsupported {label} version")
+    instruments = data["instruments"]
+    if not isinstance(instruments, list):
+        raise SchemaError("instruments must be a list")
+
+    by_key: dict[tuple[str, str, str], InstrumentMeta] = {}
+    for entry in instruments:
+        if strict and isinstance(entry, dict) and not entry.keys() <= _ENTRY_KEYS:
+            raise SchemaError("unexpected keys in instrument entry")
+        meta = _parse_entry(entry)
+        key = (meta.exchange, meta.symbol, meta.date)
+        if strict and key in by_key:
+            raise SchemaError(
+                f"duplicate instrument entry: {key[0]}/{key[1]}/{key[2]}"
             )
-            key = (exchange, symbol, date)
-            if key in self._by_key:
-                raise SchemaError(
-                    f"duplicate instrument entry: {exchange}/{symbol}/{date}"
-                )
-            self._by_key[key] = meta
+        by_key[key] = meta
+    return MappingProxyType(by_key)
+
+
+# Parsed and validated once per file version; sweeps construct providers for
+# the same file repeatedly. The mapping is read-only since it is shared.
+@functools.lru_cache(maxsize=32)
+def _load_static_meta(path: str, mtime_ns: int, size: int) -> _MetaByKey:
+    return _parse_meta_file(_read_json(path), label="instrument meta", strict=True)
+
+
+_DatesAndMetas = tuple[tuple[str, ...], tuple[InstrumentMeta, ...]]
+
+
+@functools.lru_cache(maxsize=32)
+def _static_meta_by_symbol(
+    path: str, mtime_ns: int, size: int
+) -> Mapping[tuple[str, str], _DatesAndMetas]:
+    # (exchange, symbol) -> date-sorted (dates, metas); ISO dates sort as text.
+    grouped: dict[tuple[str, str], list[InstrumentMeta]] = {}
+    for meta in _load_static_meta(path, mtime_ns, size).values():
+        grouped.setdefault((meta.exchange, meta.symbol), []).append(meta)
+    by_sym = {}
+    for key, metas in grouped.items():
+        metas.sort(key=lambda meta: meta.date)
+        by_sym[key] = (tuple(meta.date for meta in metas), tuple(metas))
+    return MappingProxyType(by_sym)
+
+
+class StaticJsonProvider:
+    def __init__(self, path: str | Path) -> None:
+        self._file_key = _file_key(Path(path))
+        self._by_key = _load_static_meta(*self._file_key)
 
     def get(self, exchange: str, symbol: str, date: str) -> InstrumentMeta:
         key = (exchange, symbol, date)
@@ -129,6 +209,18 @@ class StaticJsonProvider:
             )
         return meta
 
+    def get_range(
+        self, exchange: str, symbol: str, start: str, end: str
+    ) -> tuple[InstrumentMeta, ...]:
+        """Metas for exchange/symbol dated start..end (inclusive), by date."""
+        _validate_date(start)
+        _validate_date(end)
+        by_sym = _static_meta_by_symbol(*self._file_key)
+        dates, metas = by_sym.get((exchange, symbol), ((), ()))
+        lo = bisect.bisect_left(dates, start)
+        hi = bisect.bisect_right(dates, end)
+        return metas[lo:hi]
+
 
 def _require_tardis_instruments_module():
     try:
@@ -183,6 +275,34 @@ def _resolve_instruments_fn(module) -> Callable[..., object]:
     raise SchemaError("tardis-dev instruments API not found")
 
 
+# Index into _call_instruments_fn's attempts that each API function accepted.
+_ATTEMPT_BY_FN: dict[Callable[..., object], int] = {}
+
+
+def _attempt_from_signature(
+    fn: Callable[..., object],
+    base_kwargs: dict[str, object],
+    attempts: list[dict[str, object]],
+) -> int | None:
+    """Index of the first attempt whose keywords `fn` declares, else None."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    names = set()
+    for param in params:
+        if param.kind is param.VAR_KEYWORD:
+            return None
+        if param.kind is not param.POSITIONAL_ONLY:
+            names.add(param.name)
+    if not names.issuperset(base_kwargs):
+        return None
+    for i, extra in enumerate(attempts):
+        if names.issuperset(extra):
+            return i
+    return None
+
+
 def _call_instruments_fn(
     fn: Callable[..., object],
     *,
@@ -202,17 +322,28 @@ def _call_instruments_fn(
         {"from_date": date, "to_date": date, "symbols": [symbol]},
         {"from_date": date, "to_date": date},
     ]
+    # The attempt the signature accepts (or that worked last time) is tried
+    # first; TypeError probing remains for functions taking **kwargs or
+    # without an introspectable signature.
+    known = _ATTEMPT_BY_FN.get(fn)
+    if known is None:
+        known = _attempt_from_signature(fn, base_kwargs, attempts)
+    order = range(len(attempts))
+    if known is not None:
+        order = [known, *(i for i in order if i != known)]
     last_exc: Exception | None = None
-    for extra in attempts:
-        kwargs = {**base_kwargs, **extra}
+    for i in order:
+        kwargs = {**base_kwargs, **attempts[i]}
         try:
-            return fn(**kwargs)
+            result = fn(**kwargs)
         except TypeError as exc:
             msg = str(exc)
             if "unexpected keyword" in msg or "got an unexpected keyword" in msg:
                 last_exc = exc
                 continue
             raise
+        _ATTEMPT_BY_FN[fn] = i
+        return result
     if last_exc is not None:
         raise SchemaError(
             "tardis-dev instruments API signature not supported"
@@ -272,11 +403,17 @@ def _select_instrument_record(
     raise SchemaError(f"instrument meta not found for symbol: {symbol}")
 
 
+# Module discovery walks tardis_dev's package directory; done once per
+# process. Failures raise and so are not cached.
+@functools.lru_cache(maxsize=1)
+def _tardis_instruments_fn() -> Callable[..., object]:
+    return _resolve_instruments_fn(_require_tardis_instruments_module())
+
+
 def _fetch_tardis_instruments(
     *, exchange: str, date: str, symbol: str, api_key: str | None
 ) -> list[object]:
-    module = _require_tardis_instruments_module()
-    fn = _resolve_instruments_fn(module)
+    fn = _tardis_instruments_fn()
     result = _call_instruments_fn(
         fn,
         exchange=exchange,
@@ -287,79 +424,66 @@ def _fetch_tardis_instruments(
     return _normalize_instrument_records(result)
 
 
-def _load_cache(path: Path) -> dict[tuple[str, str, str], InstrumentMeta]:
+def _load_cache(path: Path) -> _MetaByKey:
     if not path.exists():
         return {}
-    data = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise SchemaError("instrument meta cache must be an object")
-    allowed_top = {"version", "instruments"}
-    if set(data.keys()) != allowed_top:
-        raise SchemaError("unexpected top-level keys in instrument meta cache")
-    if data["version"] != 0:
-        raise SchemaError("unsupported instrument meta cache version")
-    instruments = data["instruments"]
-    if not isinstance(instruments, list):
-        raise SchemaError("instruments must be a list")
+    return _load_cache_file(*_file_key(path))
 
-    by_key: dict[tuple[str, str, str], InstrumentMeta] = {}
-    for entry in instruments:
-        if not isinstance(entry, dict):
-            raise SchemaError("instrument entry must be an object")
-        exchange = _require_str(entry.get("exchange"), "exchange")
-        symbol = _require_str(entry.get("symbol"), "symbol")
-        date = _require_str(entry.get("date"), "date")
-        _validate_date(date)
-        price_increment = _require_str(
-            entry.get("price_increment"), "price_increment"
-        )
-        amount_increment = _require_str(
-            entry.get("amount_increment"), "amount_increment"
-        )
-        min_trade_amount = entry.get("min_trade_amount")
-        if min_trade_amount is not None:
-            min_trade_amount = _require_str(
-                min_trade_amount, "min_trade_amount"
-            )
-        try:
-            parse_decimal(price_increment)
-            parse_decimal(amount_increment)
-            if min_trade_amount is not None:
-                parse_decimal(min_trade_amount)
-        except ValueError as exc:
-            raise SchemaError(f"invalid decimal in instrument meta: {exc}") from exc
-        meta = InstrumentMeta(
-            exchange=exchange,
-            symbol=symbol,
-            date=date,
-            price_increment=price_increment,
-            amount_increment=amount_increment,
-            min_trade_amount=min_trade_amount,
-        )
-        key = (exchange, symbol, date)
-        by_key[key] = meta
-    return by_key
 
+# Version 1 cache: this header line, then one entry object per line, later
+# lines winning. Version 0 (one {version, instruments} document) is still
+# read and is rewritten as version 1 on the next append.
+_CACHE_HEADER = b'{"version":1}\n'
 
-def _write_cache(
-    path: Path, by_key: dict[tuple[str, str, str], InstrumentMeta]
-) -> None:
-    instruments = []
-    for key in sorted(by_key.keys()):
-        meta = by_key[key]
-        instruments.append(
-            {
-                "exchange": meta.exchange,
-                "symbol": meta.symbol,
-                "date": meta.date,
-                "price_increment": meta.price_increment,
-                "amount_increment": meta.amount_increment,
-                "min_trade_amount": meta.min_trade_amount,
-            }
+
+@functools.lru_cache(maxsize=32)
+def _load_cache_file(path: str, mtime_ns: int, size: int) -> _MetaByKey:
+    data = Path(path).read_bytes()
+    if not data.startswith(_CACHE_HEADER):
+        return _parse_meta_file(
+            _loads(data), label="instrument meta cache", strict=False
         )
-    payload = {"version": 0, "instruments": instruments}
+    by_key: dict[tuple[str, str, str], InstrumentMeta] = {}
+    for line in data[len(_CACHE_HEADER) :].splitlines():
+        meta = _parse_entry(_loads(line))
+        by_key[(meta.exchange, meta.symbol, meta.date)] = meta
+    return MappingProxyType(by_key)
+
+
+def _cache_line(meta: InstrumentMeta) -> bytes:
+    entry = {
+        "exchange": meta.exchange,
+        "symbol": meta.symbol,
+        "date": meta.date,
+        "price_increment": meta.price_increment,
+        "amount_increment": meta.amount_increment,
+        "min_trade_amount": meta.min_trade_amount,
+    }
+    return json.dumps(entry, separators=(",", ":")).encode("ascii") + b"\n"
+
+
+def _append_cache(
+    path: Path,
+    meta: InstrumentMeta,
+    by_key: Mapping[tuple[str, str, str], InstrumentMeta],
+) -> None:
+    """Append `meta` to the cache; O(1) per fetch once the file is version 1.
+
+    A missing or version 0 cache is written whole from `by_key` instead.
+    """
+    try:
+        with path.open("rb") as fh:
+            current = fh.read(len(_CACHE_HEADER)) == _CACHE_HEADER
+    except FileNotFoundError:
+        current = False
+    if current:
+        with path.open("ab") as fh:
+            fh.write(_cache_line(meta))
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    path.write_bytes(
+        _CACHE_HEADER + b"".join(_cache_line(by_key[key]) for key in sorted(by_key))
+    )
 
 
 class TardisInstrumentMetaApiProvider:
@@ -409,13 +533,7 @@ class TardisInstrumentMetaApiProvider:
             names=("minTradeAmount", "min_trade_amount"),
             required=False,
         )
-        try:
-            parse_decimal(price_increment)
-            parse_decimal(amount_increment)
-            if min_trade_amount is not None:
-                parse_decimal(min_trade_amount)
-        except ValueError as exc:
-            raise SchemaError(f"invalid decimal in instrument meta: {exc}") from exc
+        _check_decimals(price_increment, amount_increment, min_trade_amount)
         meta = InstrumentMeta(
             exchange=exchange,
             symbol=symbol,
@@ -426,5 +544,5 @@ class TardisInstrumentMetaApiProvider:
         )
         self._by_key[key] = meta
         if self._cache_path is not None:
-            _write_cache(self._cache_path, self._by_key)
+            _append_cache(self._cache_path, meta, self._by_key)
         return meta
@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import csv
 import gzip
-from dataclasses import dataclass
+import io
+import os
+import sys
+from contextlib import contextmanager
+from itertools import chain, count, islice, repeat
 from pathlib import Path
-from typing import Iterator, TextIO
+from typing import BinaryIO, Iterator, NamedTuple, TextIO
 
 from mm_bt.core.errors import SchemaError
 from mm_bt.core.types import Side, parse_side
 
+try:  # Optional ISA-L bindings: same gzip format, faster SIMD inflate.
+    from isal.igzip import IGzipFile as _GzipFile
+except ImportError:
+    _GzipFile = gzip.GzipFile
+
 L2_HEADER = [
     "exchange",
     "symbol",
@@ -23,8 +32,30 @@ L2_HEADER = [
 ]
 
 
-@dataclass(frozen=True, slots=True)
-class L2Row:
+_READ_BUFFER_SIZE = 1 << 20
+
+# Rows parsed per chunk (see _parse_chunk).
+_CHUNK_ROWS = 4096
+
+# Exact-text lookups for the usual spellings; anything else is lowercased and
+# looked up again before being rejected.
+_BOOL_BY_TEXT = {"true": True, "false": False, "True": True, "False": False}
+_SIDE_BY_TEXT = {"bid": Side.BID, "ask": Side.ASK}
+
+
+def _lookup_column(table: dict, values: tuple[str, ...]) -> list | None:
+    """Map a column through `table`; None if any value is not found."""
+    out = list(map(table.get, values))
+    if None in out:
+        out = list(map(table.get, map(str.lower, values)))
+        if None in out:
+            return None
+    return out
+
+
+class L2Row(NamedTuple):
+    # A tuple subclass: one allocation per row from the tuple free lists,
+    # and smaller than a slots dataclass instance.
     exchange: str
     symbol: str
     timestamp_us: int
@@ -52,54 +83,181 @@ def _require_str(value: str, field: str) -> str:
 
 
 def _parse_bool_field(value: str, field: str) -> bool:
-    v = value.lower()
-    if v == "true":
-        return True
-    if v == "false":
-        return False
-    raise SchemaError(f"{field} invalid: {value!r}")
+    v = _BOOL_BY_TEXT.get(value)
+    if v is None:
+        v = _BOOL_BY_TEXT.get(value.lower())
+        if v is None:
+            raise SchemaError(f"{field} invalid: {value!r}")
+    return v
 
 
-def _open_csv(path: str | Path) -> TextIO:
-    p = Path(path)
-    if p.suffix == ".gz":
-        return gzip.open(p, mode="rt", encoding="utf-8", newline="")
-    return p.open("rt", encoding="utf-8", newline="")
+def _advise_sequential(fileobj: BinaryIO) -> None:
+    # Inputs are read front to back once; ask for aggressive readahead.
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (OSError, ValueError, AttributeError, io.UnsupportedOperation):
+        pass
+
+
+@contextmanager
+def _open_csv(path: Path) -> Iterator[TextIO]:
+    with path.open("rb", buffering=0) as raw, _borrow_csv(path, raw) as f:
+        yield f
+
+
+@contextmanager
+def _borrow_csv(path: Path, fileobj: BinaryIO) -> Iterator[TextIO]:
+    # Decode a caller-owned binary stream without closing it. Reads go
+    # through one large buffer, so an unbuffered source sees 1 MiB reads.
+    _advise_sequential(fileobj)
+    buffered = io.BufferedReader(fileobj, _READ_BUFFER_SIZE)
+    raw: BinaryIO = buffered
+    if path.suffix == ".gz":
+        raw = _GzipFile(fileobj=buffered, mode="rb")
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    try:
+        yield text
+    finally:
+        if not fileobj.closed:
+            text.detach()
+            if raw is not buffered:
+                raw.close()
+            buffered.detach()
 
 
-def iter_l2_rows(path: str | Path) -> Iterator[L2Row]:
+def _parse_row(row: list[str], line_number: int, source: str) -> L2Row:
+    if len(row) != len(L2_HEADER):
+        raise SchemaError(
+            f"row length {len(row)} != {len(L2_HEADER)} at line {line_number}"
+        )
+    exchange, symbol, ts, local_ts, is_snapshot, side, price, amount = row
+    exchange = sys.intern(_require_str(exchange, "exchange"))
+    symbol = sys.intern(_require_str(symbol, "symbol"))
+    timestamp_us = _parse_int_field(ts, "timestamp")
+    local_timestamp_us = _parse_int_field(local_ts, "local_timestamp")
+    if timestamp_us < 0 or local_timestamp_us < 0:
+        raise SchemaError(f"negative timestamp at line {line_number}")
+    return L2Row(
+        exchange=exchange,
+        symbol=symbol,
+        timestamp_us=timestamp_us,
+        local_timestamp_us=local_timestamp_us,
+        is_snapshot=_parse_bool_field(is_snapshot, "is_snapshot"),
+        side=parse_side(side),
+        price=price,
+        amount=amount,
+        line_number=line_number,
+        source=source,
+    )
+
+
+def _parse_chunk(
+    chunk: list[list[str]], first_line: int, source: str
+) -> list[L2Row] | None:
+    """Validate and convert a chunk of rows column by column.
+
+    Every check and conversion is one C-level map()/all() over a column.
+    Returns None if any row is invalid; the caller then re-parses the chunk
+    with _parse_row, which yields the rows before the bad one and raises
+    the same error as always.
+    """
+    if set(map(len, chunk)) != {len(L2_HEADER)}:
+        return None
+    exchanges, symbols, ts, local_ts, snapshots, sides, prices, amounts = zip(
+        *chunk
+    )
+    if not (
+        all(exchanges)
+        and all(symbols)
+        and all(map(str.isdigit, ts))
+        and all(map(str.isdigit, local_ts))
+    ):
+        return None
+    # A file repeats one exchange/symbol: interned, every row shares one
+    # object and downstream equality checks hit the identity fast path.
+    exchanges = map(sys.intern, exchanges)
+    symbols = map(sys.intern, symbols)
+    flags = _lookup_column(_BOOL_BY_TEXT, snapshots)
+    parsed_sides = _lookup_column(_SIDE_BY_TEXT, sides)
+    if flags is None or parsed_sides is None:
+        return None
+    try:
+        timestamps = list(map(int, ts))
+        local_timestamps = list(map(int, local_ts))
+    except ValueError:
+        return None
+    # tuple.__new__ over zipped columns builds the rows in C; calling L2Row
+    # would run the named tuple's Python-level __new__ per row.
+    return list(
+        map(
+            tuple.__new__,
+            repeat(L2Row),
+            zip(
+                exchanges,
+                symbols,
+                timestamps,
+                local_timestamps,
+                flags,
+                parsed_sides,
+                prices,
+                amounts,
+                range(first_line, first_line + len(chunk)),
+                repeat(source),
+            ),
+        )
+    )
+
+
+def _needs_csv_reader(block: str) -> bool:
+    # Quoting, bare CR line ends and blank lines are left to csv.reader.
+    return '"' in block or "\r" in block or "\n\n" in block or block[0] == "\n"
+
+
+def _iter_chunk(
+    chunk: list[list[str]], line_number: int, source: str
+) -> Iterator[L2Row]:
+    rows = _parse_chunk(chunk, line_number, source)
+    if rows is None:
+        return map(_parse_row, chunk, count(line_number), repeat(source))
+    return iter(rows)
+
+
+def iter_l2_rows(
+    path: str | Path, *, fileobj: BinaryIO | None = None
+) -> Iterator[L2Row]:
+    """Yield validated rows from `path`.
+
+    If `fileobj` is given, rows are read from that binary stream instead
+    (`path` still picks gzip vs plain and names the source); it is not closed.
+    """
     p = Path(path)
-    with _open_csv(p) as f:
-        reader = csv.reader(f)
+    source = sys.intern(str(p))
+    with _open_csv(p) if fileobj is None else _borrow_csv(p, fileobj) as f:
         try:
-            header = next(reader)
+            header = next(csv.reader(f))
         except StopIteration as exc:
             raise SchemaError("empty CSV") from exc
         if header != L2_HEADER:
             raise SchemaError(f"unexpected header: {header!r}")
 
-        for line_number, row in enumerate(reader, start=2):
-            if len(row) != len(L2_HEADER):
-                raise SchemaError(
-                    f"row length {len(row)} != {len(L2_HEADER)} at line {line_number}"
-                )
-            exchange, symbol, ts, local_ts, is_snapshot, side, price, amount = row
-            exchange = _require_str(exchange, "exchange")
-            symbol = _require_str(symbol, "symbol")
-            timestamp_us = _parse_int_field(ts, "timestamp")
-            local_timestamp_us = _parse_int_field(local_ts, "local_timestamp")
-            if timestamp_us < 0 or local_timestamp_us < 0:
-                raise SchemaError(f"negative timestamp at line {line_number}")
-            yield L2Row(
-                exchange=exchange,
-                symbol=symbol,
-                timestamp_us=timestamp_us,
-                local_timestamp_us=local_timestamp_us,
-                is_snapshot=_parse_bool_field(is_snapshot, "is_snapshot"),
-                side=parse_side(side),
-                price=price,
-                amount=amount,
-                line_number=line_number,
-                source=str(p),
-            )
-
+        # Tardis L2 rows are plain comma-separated fields, so a chunk of lines
+        # is split with str.split instead of csv.reader's per-character state
+        # machine. The first chunk that needs real CSV parsing hands the rest
+        # of the file to csv.reader.
+        line_number = 2
+        while lines := list(islice(f, _CHUNK_ROWS)):
+            block = "".join(lines)
+            if _needs_csv_reader(block):
+                reader = csv.reader(chain(lines, f))
+                while chunk := list(islice(reader, _CHUNK_ROWS)):
+                    yield from _iter_chunk(chunk, line_number, source)
+                    line_number += len(chunk)
+                return
+            split = block.split("\n")
+            if not split[-1]:
+                split.pop()
+            chunk = list(map(str.split, split, repeat(",")))
+            yield from _iter_chunk(chunk, line_number, source)
+            line_number += len(chunk)
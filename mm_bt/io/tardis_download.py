@@ -12,6 +12,8 @@ from __future__ import annotations
 import csv
 import gzip
 import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -57,16 +59,29 @@ def _is_not_found_error(exc: BaseException) -> bool:
     return False
 
 
+# Decompressed bytes read to find the header line; far more than it needs.
+_HEADER_PROBE_SIZE = 4096
+
+
 def _validate_l2_gz_header(path: Path) -> None:
+    # Only the first block is inflated and the header line is split
+    # directly; csv.reader is kept for the (unexpected) quoted header.
     try:
-        with gzip.open(path, mode="rt", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            try:
-                header = next(reader)
-            except StopIteration as exc:
-                raise SchemaError(f"empty gzip CSV: {path}") from exc
+        with gzip.open(path, mode="rb") as f:
+            head = f.read(_HEADER_PROBE_SIZE)
     except OSError as exc:
         raise SchemaError(f"invalid gzip CSV: {path}") from exc
+    if not head:
+        raise SchemaError(f"empty gzip CSV: {path}")
+    line = head.split(b"\n", 1)[0].split(b"\r", 1)[0]
+    try:
+        text = line.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise SchemaError(f"invalid L2 header encoding in {path}") from exc
+    if '"' in text:
+        header = next(csv.reader([text]), [])
+    else:
+        header = text.split(",")
     if header != L2_HEADER:
         raise SchemaError(f"unexpected L2 header in {path}: {header!r}")
 
@@ -92,14 +107,27 @@ def _find_flat_downloads(
     date: str,
     symbol: str,
 ) -> tuple[Path, ...]:
+    # A literal prefix/suffix test per scandir entry: no glob pattern (so
+    # symbols containing glob characters match literally) and no Path or
+    # stat per non-matching entry.
     prefix = f"{exchange}_{data_type}_{date}_{symbol}"
+    min_len = len(prefix) + len(".csv.gz")
     matches: list[Path] = []
     for base in (root, root / exchange):
-        if not base.exists() or not base.is_dir():
+        try:
+            entries = os.scandir(base)
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        for path in base.glob(f"{prefix}*.csv.gz"):
-            if path.is_file():
-                matches.append(path)
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    len(name) >= min_len
+                    and name.startswith(prefix)
+                    and name.endswith(".csv.gz")
+                    and entry.is_file()
+                ):
+                    matches.append(Path(entry.path))
     return tuple(sorted(matches, key=lambda p: p.name))
 
 
@@ -264,3 +292,74 @@ def download_tardis_csv_gz(
         f"dataset not found: exchange={exchange} "
         f"data_type={data_type} date={date} symbol={symbol}"
     )
+
+
+def iter_downloads(
+    plans: Sequence[DownloadPlan],
+    *,
+    api_key: str | None = None,
+    if_exists: str = "error",
+    validate_header: bool = True,
+    skip_missing: bool = False,
+    concurrency: int = 8,
+) -> Iterator[Path | None]:
+    """Download every plan, yielding results in plan order.
+
+    Downloads are network-bound, so up to `concurrency` run in threads. A
+    missing dataset yields None when `skip_missing`; other errors are raised
+    in plan order and cancel the downloads not yet started.
+    """
+    if concurrency < 1:
+        raise SchemaError("concurrency must be >= 1")
+
+    def download(plan: DownloadPlan) -> Path | None:
+        try:
+            return download_tardis_csv_gz(
+                # target_path is {root}/{exchange}/{data_type}/{date}/{file}.
+                root=plan.target_path.parents[3],
+                exchange=plan.exchange,
+                data_type=plan.data_type,
+                date=plan.date,
+                symbol=plan.symbol,
+                api_key=api_key,
+                if_exists=if_exists,
+                validate_header=validate_header,
+            )
+        except DownloadNotFound:
+            if skip_missing:
+                return None
+            raise
+
+    if concurrency == 1 or len(plans) <= 1:
+        yield from map(download, plans)
+        return
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(download, plan) for plan in plans]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def download_many(
+    plans: Sequence[DownloadPlan],
+    *,
+    api_key: str | None = None,
+    if_exists: str = "error",
+    validate_header: bool = True,
+    skip_missing: bool = False,
+    concurrency: int = 8,
+) -> list[Path | None]:
+    """Like iter_downloads, collected into a list."""
+    return list(
+        iter_downloads(
+            plans,
+            api_key=api_key,
+            if_exists=if_exists,
+            validate_header=validate_header,
+            skip_missing=skip_missing,
+            concurrency=concurrency,
+        )
+    )
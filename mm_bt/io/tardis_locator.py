@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -40,42 +42,33 @@ def _match_prefix(base: str, prefix: str) -> bool:
 
 
 def _collect_matches(dir_path: Path, key: str) -> list[Path]:
-    if not dir_path.exists():
+    # One scandir pass: names are filtered before any type check, and
+    # is_file() answers from the dirent type without a stat (except for
+    # symlinks, which are still followed).
+    try:
+        entries = os.scandir(dir_path)
+    except FileNotFoundError:
         return []
-    if not dir_path.is_dir():
-        raise SchemaError(f"not a directory: {dir_path}")
-    matches: list[Path] = []
-    for entry in dir_path.iterdir():
-        if not entry.is_file():
-            continue
-        base = _strip_csv_suffix(entry.name)
-        if base is None:
-            continue
-        if _match_prefix(base, key):
-            matches.append(entry)
-    return sorted(matches, key=lambda p: p.name)
-
-
-def _layout_date_dir(
-    root: Path,
-    exchange: str,
-    data_type: str,
-    date: str,
-    symbol_or_group: str,
-) -> list[Path]:
-    dir_path = root / exchange / data_type / date
-    return _collect_matches(dir_path, symbol_or_group)
-
-
-def _layout_symbol_dir(
-    root: Path,
-    exchange: str,
-    data_type: str,
-    date: str,
-    symbol_or_group: str,
-) -> list[Path]:
-    dir_path = root / exchange / data_type / symbol_or_group
-    return _collect_matches(dir_path, date)
+    except NotADirectoryError:
+        raise SchemaError(f"not a directory: {dir_path}") from None
+    names: list[str] = []
+    with entries:
+        for entry in entries:
+            base = _strip_csv_suffix(entry.name)
+            if base is None or not _match_prefix(base, key):
+                continue
+            if entry.is_file():
+                names.append(entry.name)
+    names.sort()
+    return [dir_path / name for name in names]
+
+
+def _dir_stamp(path: Path) -> int | None:
+    """mtime_ns of a layout dir (None if missing); bumped by any add/remove."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def locate_tardis_files(
@@ -96,12 +89,34 @@ def locate_tardis_files(
     symbol_or_group = _require_str(symbol_or_group, "symbol_or_group")
     _validate_date(date)
 
-    matches_date_dir = _layout_date_dir(
-        root_path, exchange, data_type, date, symbol_or_group
-    )
-    matches_symbol_dir = _layout_symbol_dir(
-        root_path, exchange, data_type, date, symbol_or_group
+    # Both candidate dirs are stat'ed and their mtimes join the cache key, so
+    # a repeated lookup skips the directory scans until a layout dir changes.
+    base = root_path / exchange / data_type
+    date_dir = base / date
+    symbol_dir = base / symbol_or_group
+    return _locate_cached(
+        date_dir,
+        symbol_dir,
+        date,
+        symbol_or_group,
+        None if root_path.is_absolute() else os.getcwd(),
+        _dir_stamp(date_dir),
+        _dir_stamp(symbol_dir),
     )
+
+
+@functools.lru_cache(maxsize=1024)
+def _locate_cached(
+    date_dir: Path,
+    symbol_dir: Path,
+    date: str,
+    symbol_or_group: str,
+    cwd: str | None,
+    date_dir_mtime_ns: int | None,
+    symbol_dir_mtime_ns: int | None,
+) -> tuple[Path, ...]:
+    matches_date_dir = _collect_matches(date_dir, symbol_or_group)
+    matches_symbol_dir = _collect_matches(symbol_dir, date)
     if matches_date_dir and matches_symbol_dir:
         raise SchemaError(
             "ambiguous tardis layout: matches found in date and symbol dirs"
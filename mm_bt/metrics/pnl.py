@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from itertools import islice, repeat
+from operator import sub
+from typing import Sequence, cast
 
 from mm_bt.core.errors import SchemaError
 from mm_bt.core.types import Bps
@@ -11,19 +13,13 @@ _BPS_SCALE = 10_000
 
 
 def _round_half_even(numer: int, denom: int) -> int:
+    """numer / denom rounded half to even, without sign or tie branches."""
     if denom <= 0:
         raise SchemaError("denom must be positive")
-    sign = 1
-    if numer < 0:
-        sign = -1
-        numer = -numer
-    q, r = divmod(numer, denom)
-    twice_r = r * 2
-    if twice_r > denom:
-        q += 1
-    elif twice_r == denom and (q % 2 == 1):
-        q += 1
-    return sign * q
+    # floor(x + 1/2), minus one exactly when it lands on an odd tie; floor
+    # division makes this correct for either sign.
+    q, r = divmod(2 * numer + denom, 2 * denom)
+    return q - ((not r) & q)
 
 
 def returns_from_equity(
@@ -34,15 +30,19 @@ def returns_from_equity(
         raise SchemaError("initial_cash must be positive")
     if len(equity) < 2:
         raise SchemaError("insufficient equity points for returns")
-    for value in equity:
-        if not isinstance(value, int):
-            raise SchemaError("equity values must be int")
-    returns: list[Bps] = []
-    prev = equity[0]
-    for current in equity[1:]:
-        delta = current - prev
-        bps = _round_half_even(delta * _BPS_SCALE, initial_cash)
-        returns.append(Bps(bps))
-        prev = current
-    return tuple(returns)
-
+    if not all(map(isinstance, equity, repeat(int))):
+        raise SchemaError("equity values must be int")
+    # _round_half_even(delta * scale, initial_cash), inlined. The tie fix
+    # stays a short-circuit test here: in the interpreter that is cheaper
+    # than the branch-free form, as ties are rare.
+    denom = 2 * initial_cash
+    scale = 2 * _BPS_SCALE
+    returns: list[int] = []
+    append = returns.append
+    for delta in map(sub, islice(equity, 1, None), equity):
+        q, r = divmod(delta * scale + initial_cash, denom)
+        if not r and q & 1:
+            q -= 1
+        append(q)
+    # Bps is a NewType over int; the ints are returned as-is.
+    return cast("tuple[Bps, ...]", tuple(returns))
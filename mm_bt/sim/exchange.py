@@ -8,7 +8,16 @@ from pathlib import Path
 from mm_bt.book.api import Book
 from mm_bt.book.book_py import BookPy
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Bps, Lots, QuoteAtoms, Side, Ticks, TsNs
+from mm_bt.core.types import (
+    Bps,
+    Lots,
+    QuoteAtoms,
+    SIDE_ASK,
+    SIDE_BID,
+    Side,
+    Ticks,
+    TsNs,
+)
 from mm_bt.evlog.reader import EvlogReader
 from mm_bt.experiments.psr_dsr import (
     deflated_sharpe_ratio,
@@ -54,78 +63,65 @@ class RunResult:
     dsr: float
 
 
-def _ensure_snapshot_ready(
-    bid_px: Ticks | None,
-    bid_qty: Lots | None,
-    ask_px: Ticks | None,
-    ask_qty: Lots | None,
-) -> BookSnapshot:
-    if bid_px is None or bid_qty is None or ask_px is None or ask_qty is None:
-        raise SchemaError("missing best bid/ask")
-    if int(bid_qty) <= 0 or int(ask_qty) <= 0:
-        raise SchemaError("non-positive top-of-book size")
-    return BookSnapshot(
-        bid_px=bid_px,
-        bid_qty=bid_qty,
-        ask_px=ask_px,
-        ask_qty=ask_qty,
-    )
-
-
 def _execute_market_order(
     *,
     ts_recv_ns: TsNs,
     order: MarketOrder,
     book: BookSnapshot,
     portfolio: Portfolio,
-    fee_model: FixedBpsFeeModel,
+    fee_bps: int,
     allow_short: bool,
     allow_margin: bool,
     ignore_risk_rejects: bool,
 ) -> Fill | None:
+    """Fill `order` against the top of book and book it on `portfolio`.
+
+    Fee and ledger math (FixedBpsFeeModel.fee_atoms, Portfolio.apply_fill)
+    are inlined on plain ints: the risk checks here are the ones apply_fill
+    would repeat, and price/qty are already known positive.
+    """
     qty = int(order.qty_lots)
     if qty <= 0:
         raise SchemaError("qty_lots must be positive")
-    if order.side == Side.BID:
+    side = order.side
+    if side == SIDE_BID:
         price = book.ask_px
         available = book.ask_qty
-    elif order.side == Side.ASK:
+    elif side == SIDE_ASK:
         price = book.bid_px
         available = book.bid_qty
     else:
-        raise SchemaError(f"invalid side: {order.side}")
-    if qty > int(available):
+        raise SchemaError(f"invalid side: {side}")
+    if qty > available:
         raise SchemaError("market order exceeds top-of-book size")
 
-    notional = QuoteAtoms(int(price) * qty)
-    fee_atoms = fee_model.fee_atoms(notional)
-    if order.side == Side.BID:
-        if not allow_margin:
-            total = int(notional) + int(fee_atoms)
-            if int(portfolio.cash) < total:
-                if ignore_risk_rejects:
-                    return None
-                raise SchemaError("insufficient cash for buy")
-    elif order.side == Side.ASK:
-        if not allow_short and int(portfolio.position) < qty:
+    notional = price * qty
+    fee = notional * fee_bps // 10_000
+    cash = portfolio.cash
+    position = portfolio.position
+    if side == SIDE_BID:
+        cash -= notional + fee
+        if cash < 0 and not allow_margin:
+            if ignore_risk_rejects:
+                return None
+            raise SchemaError("insufficient cash for buy")
+        position += qty
+    else:
+        if position < qty and not allow_short:
             if ignore_risk_rejects:
                 return None
             raise SchemaError("insufficient position for sell")
-    portfolio.apply_fill(
-        side=order.side,
-        price_ticks=price,
-        qty_lots=order.qty_lots,
-        fee_atoms=fee_atoms,
-        allow_short=allow_short,
-        allow_margin=allow_margin,
-    )
+        cash += notional - fee
+        position -= qty
+    portfolio.cash = QuoteAtoms(cash)
+    portfolio.position = Lots(position)
     return Fill(
         ts_recv_ns=ts_recv_ns,
-        side=order.side,
+        side=side,
         price_ticks=price,
         qty_lots=order.qty_lots,
-        notional=notional,
-        fee_atoms=fee_atoms,
+        notional=QuoteAtoms(notional),
+        fee_atoms=QuoteAtoms(fee),
     )
 
 
@@ -146,39 +142,64 @@ def run_backtest(
     if not config.allow_short and initial_position < 0:
         raise SchemaError("initial_position short not allowed")
 
+    # Plain ints: the fill path does arithmetic on them directly.
     portfolio = Portfolio(
-        cash=config.initial_cash,
-        position=config.initial_position,
+        cash=QuoteAtoms(initial_cash),
+        position=Lots(initial_position),
     )
+    fee_bps = fee_model.bps
     active_book = book if book is not None else BookPy()
 
     fills: list[Fill] = []
-    equity_curve: list[tuple[TsNs, QuoteAtoms]] = []
+    # The equity curve is kept as two parallel columns; the values column
+    # feeds returns_from_equity as-is and pairs are only built for RunResult.
+    equity_ts: list[TsNs] = []
+    equity_values: list[QuoteAtoms] = []
     action_id = 0
     fill_id = 0
     seen_ready_book = False
+    # Loop invariants, bound once per run.
+    allow_short = config.allow_short
+    allow_margin = config.allow_margin
+    ignore_risk_rejects = config.ignore_risk_rejects
+    skip_missing = config.skip_initial_missing_book
+    best_bid_ask = active_book.best_bid_ask
+    on_batch = strategy.on_batch
+    # BookSnapshot is immutable, so it is rebuilt (and revalidated) only
+    # when the top of book actually changes between batches.
+    last_top: tuple[Ticks | None, Lots | None, Ticks | None, Lots | None] = (
+        None,
+        None,
+        None,
+        None,
+    )
+    snapshot: BookSnapshot | None = None
 
     with EvlogReader(evlog_path, index_path=index_path) as reader:
         for batch in reader.iter_l2_batches():
             active_book.apply_l2_batch(batch)
-            bid_px, bid_qty, ask_px, ask_qty = active_book.best_bid_ask()
-            if (
-                bid_px is None
-                or bid_qty is None
-                or ask_px is None
-                or ask_qty is None
-            ):
-                if config.skip_initial_missing_book and not seen_ready_book:
-                    continue
-                raise SchemaError("missing best bid/ask")
-            snapshot = _ensure_snapshot_ready(bid_px, bid_qty, ask_px, ask_qty)
-            seen_ready_book = True
-            ctx = StrategyContext(
-                ts_recv_ns=batch.ts_recv_ns,
-                cash=portfolio.cash,
-                position=portfolio.position,
+            top = best_bid_ask()
+            if snapshot is None or top != last_top:
+                bid_px, bid_qty, ask_px, ask_qty = top
+                if (
+                    bid_px is None
+                    or bid_qty is None
+                    or ask_px is None
+                    or ask_qty is None
+                ):
+                    if skip_missing and not seen_ready_book:
+                        continue
+                    raise SchemaError("missing best bid/ask")
+                if bid_qty <= 0 or ask_qty <= 0:
+                    raise SchemaError("non-positive top-of-book size")
+                snapshot = BookSnapshot(bid_px, bid_qty, ask_px, ask_qty)
+                last_top = top
+                seen_ready_book = True
+            ts_recv_ns = batch.ts_recv_ns
+            actions = on_batch(
+                StrategyContext(ts_recv_ns, portfolio.cash, portfolio.position),
+                snapshot,
             )
-            actions = strategy.on_batch(ctx, snapshot)
             if actions is None:
                 raise SchemaError("strategy returned no actions iterable")
             try:
@@ -191,27 +212,27 @@ def run_backtest(
                     raise SchemaError("unsupported action type")
                 if tape is not None:
                     tape.record_action(
-                        ts_recv_ns=batch.ts_recv_ns,
+                        ts_recv_ns=ts_recv_ns,
                         action_id=action_id,
                         side=action.side,
                         qty_lots=action.qty_lots,
                     )
                 fill = _execute_market_order(
-                    ts_recv_ns=batch.ts_recv_ns,
+                    ts_recv_ns=ts_recv_ns,
                     order=action,
                     book=snapshot,
                     portfolio=portfolio,
-                    fee_model=fee_model,
-                    allow_short=config.allow_short,
-                    allow_margin=config.allow_margin,
-                    ignore_risk_rejects=config.ignore_risk_rejects,
+                    fee_bps=fee_bps,
+                    allow_short=allow_short,
+                    allow_margin=allow_margin,
+                    ignore_risk_rejects=ignore_risk_rejects,
                 )
                 if fill is None:
                     continue
                 fill_id += 1
                 if tape is not None:
                     tape.record_fill(
-                        ts_recv_ns=batch.ts_recv_ns,
+                        ts_recv_ns=ts_recv_ns,
                         fill_id=fill_id,
                         action_id=action_id,
                         side=fill.side,
@@ -222,23 +243,22 @@ def run_backtest(
                     )
                 fills.append(fill)
 
-            # Liquidation value: bid for long/flat, ask for short.
-            mark_px = (
-                snapshot.bid_px
-                if int(portfolio.position) >= 0
-                else snapshot.ask_px
-            )
-            equity = portfolio.equity(mark_px)
-            equity_curve.append((batch.ts_recv_ns, equity))
+            # Liquidation value: bid for long/flat, ask for short. Marks come
+            # from a ready book, so Portfolio.equity's check is not repeated.
+            cash = portfolio.cash
+            position = portfolio.position
+            mark_px = snapshot.bid_px if position >= 0 else snapshot.ask_px
+            equity = QuoteAtoms(cash + position * mark_px)
+            equity_ts.append(ts_recv_ns)
+            equity_values.append(equity)
             if tape is not None:
                 tape.record_equity(
-                    ts_recv_ns=batch.ts_recv_ns,
-                    cash=portfolio.cash,
-                    position=portfolio.position,
+                    ts_recv_ns=ts_recv_ns,
+                    cash=cash,
+                    position=position,
                     equity=equity,
                 )
 
-    equity_values = [int(value) for _, value in equity_curve]
     returns = returns_from_equity(equity_values, initial_cash=initial_cash)
     sharpe = sharpe_ratio(returns)
     psr = probabilistic_sharpe_ratio(
@@ -251,7 +271,7 @@ def run_backtest(
     )
     return RunResult(
         fills=tuple(fills),
-        equity_curve=tuple(equity_curve),
+        equity_curve=tuple(zip(equity_ts, equity_values)),
         returns=returns,
         sharpe=sharpe,
         psr=psr,
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Lots, QuoteAtoms, Side, Ticks
+from mm_bt.core.types import Lots, QuoteAtoms, SIDE_ASK, SIDE_BID, Side, Ticks
 
 
 @dataclass
@@ -36,13 +36,13 @@ class Portfolio:
 
         cash = int(self.cash)
         position = int(self.position)
-        if side == Side.BID:
+        if side == SIDE_BID:
             total = notional + fee
             if not allow_margin and cash < total:
                 raise SchemaError("insufficient cash for buy")
             cash -= total
             position += qty
-        elif side == Side.ASK:
+        elif side == SIDE_ASK:
             if not allow_short and position < qty:
                 raise SchemaError("insufficient position for sell")
             cash += notional - fee
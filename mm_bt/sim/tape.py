@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
 from pathlib import Path
 from typing import BinaryIO
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Lots, QuoteAtoms, Side, Ticks, TsNs
+from mm_bt.core.types import Lots, QuoteAtoms, SIDE_BID, Side, Ticks, TsNs
 
 
-def _write_json_line(f: BinaryIO, record: dict[str, object]) -> None:
+# Buffered record bytes that trigger a write.
+_FLUSH_SIZE = 1 << 20
+
+# Per-record lines, byte-identical to _json_line's output (sorted keys,
+# compact separators) for the int/ASCII fields they carry; formatting them
+# directly skips building a dict and running the json encoder per record.
+_ACTION_LINE = (
+    b'{"action_id":%d,"qty_lots":%d,"side":"%s","ts_recv_ns":%d,'
+    b'"type":"action"}\n'
+)
+_FILL_LINE = (
+    b'{"action_id":%d,"fee_atoms":%d,"fill_id":%d,"notional":%d,'
+    b'"price_ticks":%d,"qty_lots":%d,"side":"%s","ts_recv_ns":%d,'
+    b'"type":"fill"}\n'
+)
+_EQUITY_LINE = (
+    b'{"cash":%d,"equity":%d,"position":%d,"ts_recv_ns":%d,"type":"equity"}\n'
+)
+
+
+def _json_line(record: dict[str, object]) -> bytes:
     payload = json.dumps(
         record, sort_keys=True, separators=(",", ":"), ensure_ascii=True
     )
-    f.write(payload.encode("utf-8") + b"\n")
+    return payload.encode("utf-8") + b"\n"
 
 
 @dataclass
@@ -23,26 +43,40 @@ class TapeWriter:
     path: str | Path
     run_meta: dict[str, object] | None = None
     _file: BinaryIO | None = None
+    # Records are appended here and written in large chunks.
+    _buf: bytearray = field(default_factory=bytearray, init=False, repr=False)
 
     def __enter__(self) -> "TapeWriter":
         if self._file is not None:
             raise SchemaError("tape already open")
         self._file = Path(self.path).open("wb")
+        self._buf.clear()
         if self.run_meta is not None:
             if "type" in self.run_meta:
                 raise SchemaError("run_meta cannot override type")
-            _write_json_line(self._file, {"type": "header", **self.run_meta})
+            self._buf += _json_line({"type": "header", **self.run_meta})
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
         if self._file is not None:
-            self._file.close()
-            self._file = None
+            try:
+                self._flush()
+            finally:
+                self._file.close()
+                self._file = None
 
-    def _require_open(self) -> BinaryIO:
+    def _flush(self) -> None:
+        if self._file is not None and self._buf:
+            self._file.write(self._buf)
+            self._buf.clear()
+
+    def _append(self, line: bytes) -> None:
         if self._file is None:
             raise SchemaError("tape is not open")
-        return self._file
+        buf = self._buf
+        buf += line
+        if len(buf) >= _FLUSH_SIZE:
+            self._flush()
 
     def record_action(
         self,
@@ -56,15 +90,14 @@ class TapeWriter:
             raise SchemaError("action_id must be positive")
         if int(qty_lots) <= 0:
             raise SchemaError("qty_lots must be positive")
-        _write_json_line(
-            self._require_open(),
-            {
-                "type": "action",
-                "ts_recv_ns": int(ts_recv_ns),
-                "action_id": action_id,
-                "side": "bid" if side == Side.BID else "ask",
-                "qty_lots": int(qty_lots),
-            },
+        self._append(
+            _ACTION_LINE
+            % (
+                action_id,
+                qty_lots,
+                b"bid" if side == SIDE_BID else b"ask",
+                ts_recv_ns,
+            )
         )
 
     def record_fill(
@@ -87,19 +120,18 @@ class TapeWriter:
             raise SchemaError("price_ticks must be positive")
         if int(qty_lots) <= 0:
             raise SchemaError("qty_lots must be positive")
-        _write_json_line(
-            self._require_open(),
-            {
-                "type": "fill",
-                "ts_recv_ns": int(ts_recv_ns),
-                "fill_id": fill_id,
-                "action_id": action_id,
-                "side": "bid" if side == Side.BID else "ask",
-                "price_ticks": int(price_ticks),
-                "qty_lots": int(qty_lots),
-                "notional": int(notional),
-                "fee_atoms": int(fee_atoms),
-            },
+        self._append(
+            _FILL_LINE
+            % (
+                action_id,
+                fee_atoms,
+                fill_id,
+                notional,
+                price_ticks,
+                qty_lots,
+                b"bid" if side == SIDE_BID else b"ask",
+                ts_recv_ns,
+            )
         )
 
     def record_equity(
@@ -110,14 +142,5 @@ class TapeWriter:
         position: Lots,
         equity: QuoteAtoms,
     ) -> None:
-        _write_json_line(
-            self._require_open(),
-            {
-                "type": "equity",
-                "ts_recv_ns": int(ts_recv_ns),
-                "cash": int(cash),
-                "position": int(position),
-                "equity": int(equity),
-            },
-        )
+        self._append(_EQUITY_LINE % (cash, equity, position, ts_recv_ns))
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import random
 
 from mm_bt.core.errors import SchemaError
-from mm_bt.core.types import Lots, Side
+from mm_bt.core.types import Lots, SIDE_ASK, SIDE_BID
 from mm_bt.strategy.api import BookSnapshot, MarketOrder, Strategy, StrategyContext
 
 
@@ -15,13 +15,13 @@ class AlternatingMarketOrderStrategy(Strategy):
         if qty <= 0:
             raise SchemaError("qty_lots must be positive")
         self._qty_lots = qty_lots
-        self._next_side = Side.BID
+        self._next_side = SIDE_BID
 
     def on_batch(
         self, ctx: StrategyContext, book: BookSnapshot
     ) -> tuple[MarketOrder, ...]:
         order = MarketOrder(side=self._next_side, qty_lots=self._qty_lots)
-        self._next_side = Side.ASK if self._next_side == Side.BID else Side.BID
+        self._next_side = SIDE_ASK if self._next_side == SIDE_BID else SIDE_BID
         return (order,)
 
 
@@ -48,17 +48,37 @@ class RandomMarketOrderStrategy(Strategy):
         self._order_pct = order_pct
         self._min_qty = min_qty
         self._max_qty = max_qty
+        self._getrandbits = self._rng.getrandbits
+        self._qty_span = max_qty - min_qty + 1
+        self._qty_bits = self._qty_span.bit_length()
 
     def on_batch(
         self, ctx: StrategyContext, book: BookSnapshot
     ) -> tuple[MarketOrder, ...]:
-        if self._order_pct == 0:
+        # Draws are the same as rng.randrange(n) (CPython's getrandbits
+        # rejection loop with k = n.bit_length()), minus its per-call
+        # argument normalization, so seeded runs replay unchanged.
+        order_pct = self._order_pct
+        if order_pct == 0:
             return ()
-        if self._order_pct < 100 and self._rng.randrange(100) >= self._order_pct:
-            return ()
-        side = Side.BID if self._rng.randrange(2) == 0 else Side.ASK
-        if self._min_qty == self._max_qty:
+        getrandbits = self._getrandbits
+        if order_pct < 100:
+            r = getrandbits(7)
+            while r >= 100:
+                r = getrandbits(7)
+            if r >= order_pct:
+                return ()
+        r = getrandbits(2)
+        while r >= 2:
+            r = getrandbits(2)
+        side = SIDE_BID if r == 0 else SIDE_ASK
+        span = self._qty_span
+        if span == 1:
             qty = self._min_qty
         else:
-            qty = self._rng.randrange(self._min_qty, self._max_qty + 1)
+            k = self._qty_bits
+            r = getrandbits(k)
+            while r >= span:
+                r = getrandbits(k)
+            qty = self._min_qty + r
         return (MarketOrder(side=side, qty_lots=Lots(qty)),)
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from mm_bt.book import BookArray, BookPy
+from mm_bt.core import SchemaError
+from mm_bt.core import Lots, Side, Ticks, TsNs
+from mm_bt.evlog import L2Batch, L2Update
+
+
+def _batch(resets: bool, updates) -> L2Batch:
+    return L2Batch(
+        ts_recv_ns=TsNs(0),
+        ts_exch_ns=TsNs(0),
+        resets_book=resets,
+        updates=tuple(updates),
+    )
+
+
+def test_apply_updates_best_and_levels() -> None:
+    book = BookArray()
+    book.apply_l2_batch(
+        _batch(
+            True,
+            [
+                L2Update(Side.BID, Ticks(100), Lots(1), True),
+                L2Update(Side.BID, Ticks(98), Lots(3), True),
+                L2Update(Side.ASK, Ticks(101), Lots(2), True),
+                L2Update(Side.ASK, Ticks(105), Lots(4), True),
+            ],
+        )
+    )
+    assert book.best_bid_ask() == (100, 1, 101, 2)
+    assert book.levels(Side.BID, 5) == ((100, 98), (1, 3))
+    assert book.levels(Side.ASK, 1) == ((101,), (2,))
+
+    book.apply_l2_batch(
+        _batch(False, [L2Update(Side.BID, Ticks(100), Lots(0), False)])
+    )
+    assert book.best_bid_ask() == (98, 3, 101, 2)
+
+
+def test_grows_for_prices_outside_ladder() -> None:
+    book = BookArray(capacity=64)
+    book.apply_l2_batch(
+        _batch(
+            True,
+            [
+                L2Update(Side.BID, Ticks(1000), Lots(1), True),
+                L2Update(Side.ASK, Ticks(5000), Lots(2), True),
+                L2Update(Side.BID, Ticks(10), Lots(3), True),
+            ],
+        )
+    )
+    assert book.best_bid_ask() == (1000, 1, 5000, 2)
+    assert book.levels(Side.BID, 5) == ((1000, 10), (1, 3))
+
+
+def test_rejects_crossed_and_invalid() -> None:
+    book = BookArray()
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch(
+            _batch(
+                True,
+                [
+                    L2Update(Side.BID, Ticks(11), Lots(1), True),
+                    L2Update(Side.ASK, Ticks(11), Lots(1), True),
+                ],
+            )
+        )
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch(
+            _batch(True, [L2Update(Side.BID, Ticks(0), Lots(1), True)])
+        )
+    with pytest.raises(SchemaError):
+        BookArray(capacity=100)
+
+
+def test_matches_book_py() -> None:
+    rng = random.Random(7)
+    ref = BookPy(reject_crossed=False)
+    book = BookArray(reject_crossed=False, capacity=64)
+    for i in range(200):
+        updates = []
+        for _ in range(rng.randint(1, 8)):
+            side = Side.BID if rng.random() < 0.5 else Side.ASK
+            base = 1000 if side == Side.BID else 1100
+            price = base + rng.randint(-150, 150)
+            amount = 0 if rng.random() < 0.3 else rng.randint(1, 9)
+            updates.append(L2Update(side, Ticks(price), Lots(amount), False))
+        batch = _batch(i % 50 == 0, updates)
+        ref.apply_l2_batch(batch)
+        book.apply_l2_batch(batch)
+        assert book.best_bid_ask() == ref.best_bid_ask()
+        assert book.levels(Side.BID, 10) == ref.levels(Side.BID, 10)
+        assert book.levels(Side.ASK, 10) == ref.levels(Side.ASK, 10)
+
+
+def test_apply_l2_batch_arrays() -> None:
+    book = BookArray()
+    book.apply_l2_batch_arrays([100, 101, 99], [1, 2, 4], [0, 1, 0], True)
+    assert book.best_bid_ask() == (100, 1, 101, 2)
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch_arrays([0], [1], [0], False)
+
+
+def test_best_refresh_after_delete_across_words() -> None:
+    book = BookArray(capacity=1024)
+    book.apply_l2_batch_arrays(
+        [500, 300, 501, 900], [1, 2, 3, 4], [0, 0, 1, 1], True
+    )
+    book.apply_l2_batch_arrays([500, 501], [0, 0], [0, 1], False)
+    assert book.best_bid_ask() == (300, 2, 900, 4)
+    book.apply_l2_batch_arrays([300, 900], [0, 0], [0, 1], False)
+    assert book.best_bid_ask() == (None, None, None, None)
+    book.apply_l2_batch_arrays([200], [5], [1], False)
+    assert book.best_bid_ask() == (None, None, 200, 5)
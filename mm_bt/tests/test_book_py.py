@@ -1,3 +1,5 @@
+from array import array
+
 import pytest
 
 from mm_bt.book import BookPy
@@ -129,3 +131,119 @@ def test_incremental_updates_preserve_other_levels() -> None:
     assert int(ask_qty) == 3
     ask_prices, _ = book.levels(Side.ASK, 10)
     assert [int(p) for p in ask_prices] == [12]
+
+
+def test_top_of_book_insert_and_delete() -> None:
+    book = BookPy()
+    book.apply_l2_batch(
+        _batch(
+            True,
+            [
+                L2Update(Side.BID, Ticks(10), Lots(1), True),
+                L2Update(Side.ASK, Ticks(14), Lots(1), True),
+            ],
+        )
+    )
+    book.apply_l2_batch(
+        _batch(
+            False,
+            [
+                L2Update(Side.BID, Ticks(12), Lots(2), False),
+                L2Update(Side.BID, Ticks(11), Lots(3), False),
+                L2Update(Side.ASK, Ticks(13), Lots(4), False),
+                L2Update(Side.ASK, Ticks(15), Lots(5), False),
+            ],
+        )
+    )
+    bid_px, bid_qty, ask_px, ask_qty = book.best_bid_ask()
+    assert (int(bid_px), int(bid_qty), int(ask_px), int(ask_qty)) == (12, 2, 13, 4)
+    book.apply_l2_batch(
+        _batch(
+            False,
+            [
+                L2Update(Side.BID, Ticks(12), Lots(0), False),
+                L2Update(Side.ASK, Ticks(13), Lots(0), False),
+                L2Update(Side.ASK, Ticks(15), Lots(0), False),
+            ],
+        )
+    )
+    bid_px, bid_qty, ask_px, ask_qty = book.best_bid_ask()
+    assert (int(bid_px), int(bid_qty), int(ask_px), int(ask_qty)) == (11, 3, 14, 1)
+    bid_prices, _ = book.levels(Side.BID, 10)
+    assert [int(p) for p in bid_prices] == [11, 10]
+
+
+def test_apply_l2_batch_arrays_matches_batch() -> None:
+    updates = [
+        L2Update(Side.BID, Ticks(10), Lots(1), True),
+        L2Update(Side.BID, Ticks(9), Lots(2), True),
+        L2Update(Side.ASK, Ticks(12), Lots(3), True),
+        L2Update(Side.BID, Ticks(10), Lots(0), True),
+    ]
+    ref = BookPy()
+    ref.apply_l2_batch(_batch(True, updates))
+    book = BookPy()
+    book.apply_l2_batch_arrays(
+        array("q", [int(u.price_ticks) for u in updates]),
+        array("q", [int(u.amount_lots) for u in updates]),
+        array("B", [int(u.side) for u in updates]),
+        True,
+    )
+    assert book.best_bid_ask() == ref.best_bid_ask()
+    assert book.levels(Side.BID, 5) == ref.levels(Side.BID, 5)
+
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch_arrays([10], [-1], [0], False)
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch_arrays([10], [1], [2], False)
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch_arrays([10, 11], [1], [0], False)
+
+
+def test_rejects_unknown_side() -> None:
+    book = BookPy()
+    for side in (2, -1, -2):
+        with pytest.raises(SchemaError, match="unknown side"):
+            book.apply_l2_batch(
+                _batch(True, [L2Update(side, Ticks(10), Lots(1), True)])
+            )
+
+
+def test_best_bid_ask_refreshes_after_updates() -> None:
+    book = BookPy()
+    book.apply_l2_batch(
+        _batch(True, [L2Update(Side.BID, Ticks(10), Lots(1), True)])
+    )
+    assert book.best_bid_ask() == (10, 1, None, None)
+    book.apply_l2_batch(
+        _batch(False, [L2Update(Side.BID, Ticks(10), Lots(4), False)])
+    )
+    assert book.best_bid_ask() == (10, 4, None, None)
+    book.reset()
+    assert book.best_bid_ask() == (None, None, None, None)
+
+
+def test_crossed_book_keeps_failing_until_fixed() -> None:
+    book = BookPy()
+    book.apply_l2_batch(
+        _batch(
+            True,
+            [
+                L2Update(Side.BID, Ticks(10), Lots(1), True),
+                L2Update(Side.ASK, Ticks(12), Lots(1), True),
+            ],
+        )
+    )
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch(
+            _batch(False, [L2Update(Side.BID, Ticks(12), Lots(1), False)])
+        )
+    # A mid-book update does not move the top, but the book is still crossed.
+    with pytest.raises(SchemaError):
+        book.apply_l2_batch(
+            _batch(False, [L2Update(Side.BID, Ticks(9), Lots(1), False)])
+        )
+    book.apply_l2_batch(
+        _batch(False, [L2Update(Side.BID, Ticks(12), Lots(0), False)])
+    )
+    assert book.best_bid_ask() == (10, 1, 12, 1)
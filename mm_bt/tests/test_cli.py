@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import mm_bt
+
+
+@pytest.mark.parametrize(
+    ("cli", "heavy"),
+    [
+        ("bt_compile", "mm_bt.ingest.compiler"),
+        ("bt_run", "mm_bt.sim.exchange"),
+        ("tardis_download", "mm_bt.io.tardis_download"),
+    ],
+)
+def test_cli_help_skips_heavy_imports(cli, heavy) -> None:
+    # A fresh interpreter: this one has imported everything already.
+    code = (
+        "import sys\n"
+        f"from mm_bt.cli import {cli} as cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print({heavy!r} in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(mm_bt.__file__).parents[1],
+    )
+    assert out.stdout.splitlines()[-1] == "False"
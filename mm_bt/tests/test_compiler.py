@@ -4,10 +4,13 @@ import pytest
 
 from mm_bt.book import BookPy
 from mm_bt.core import Quantizer
-from mm_bt.core import SchemaError
+from mm_bt.core import DeterminismError, QuantizationError, SchemaError
+from mm_bt.core import FailurePolicy, QuarantineAction
+from mm_bt.core import hash_file, hash_json, stable_json_dumps_bytes
 from mm_bt.evlog import EvlogReader
 from mm_bt.evlog import EVLOG_VERSION
 from mm_bt.ingest import compile_l2_csv
+from mm_bt.ingest import compiler
 from mm_bt.sim import iter_best_bid_ask
 
 
@@ -57,6 +60,18 @@ def test_compile_l2_smoke(tmp_path) -> None:
     assert manifest["format_version"] == EVLOG_VERSION
     assert "sha256" in manifest["quantizer"]
     assert "compiler_sha256" in manifest
+    assert manifest["evlog"]["sha256"] == hash_file(result.evlog_path)
+    assert manifest["index"]["sha256"] == hash_file(result.index_path)
+    assert manifest["inputs"][0]["sha256"] == hash_file(path)
+    assert manifest["inputs_sha256"] == hash_json(manifest["inputs"])
+    assert manifest["quantizer"]["sha256"] == hash_json(
+        {"price_increment": "1", "amount_increment": "1"}
+    )
+    unsigned = {k: v for k, v in manifest.items() if k != "manifest_sha256"}
+    assert manifest["manifest_sha256"] == hash_json(unsigned)
+    assert result.manifest_path.read_bytes() == (
+        stable_json_dumps_bytes(manifest) + b"\n"
+    )
 
     book = BookPy()
     with EvlogReader(result.evlog_path, index_path=result.index_path) as reader:
@@ -155,3 +170,128 @@ def test_compile_multiple_inputs_with_prefix(tmp_path) -> None:
     manifest = json.loads(result.manifest_path.read_text(encoding="utf-8"))
     assert len(manifest["inputs"]) == 2
     assert manifest["record_count"] == 2
+
+
+def test_compile_skips_empty_leading_inputs(tmp_path) -> None:
+    empty = _write_l2(tmp_path, [], name="l2_0.csv")
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "900", "1000", "true", "bid", "10", "1"],
+            ["binance", "BTCUSDT", "910", "2000", "false", "ask", "12", "1"],
+        ],
+        name="l2_1.csv",
+    )
+    q = Quantizer.from_strings("1", "1")
+    result = compile_l2_csv(
+        l2_paths=[empty, path],
+        output_dir=tmp_path / "out",
+        quantizer=q,
+        output_prefix="merged",
+    )
+    assert result.record_count == 2
+    with pytest.raises(SchemaError, match="no rows"):
+        compile_l2_csv(
+            l2_paths=[empty],
+            output_dir=tmp_path / "out",
+            quantizer=q,
+            output_prefix="empty",
+        )
+
+
+def test_compile_input_change_check(tmp_path, monkeypatch) -> None:
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "900", "1000", "true", "bid", "10", "1"],
+            ["binance", "BTCUSDT", "910", "2000", "false", "ask", "12", "1"],
+        ],
+    )
+    q = Quantizer.from_strings("1", "1")
+    manifests = [
+        json.loads(
+            compile_l2_csv(
+                l2_path=path,
+                output_dir=tmp_path / "out",
+                quantizer=q,
+                strict_determinism=strict,
+            ).manifest_path.read_text(encoding="utf-8")
+        )
+        for strict in (True, False)
+    ]
+    assert manifests[0] == manifests[1]
+    assert manifests[0]["inputs"][0]["sha256"] == hash_file(path)
+
+    # A differing independent hash is only consulted in strict mode (or when
+    # the file's stat changed).
+    monkeypatch.setattr(compiler, "hash_file", lambda path: "0" * 64)
+    compile_l2_csv(l2_path=path, output_dir=tmp_path / "out", quantizer=q)
+    with pytest.raises(DeterminismError):
+        compile_l2_csv(
+            l2_path=path,
+            output_dir=tmp_path / "out",
+            quantizer=q,
+            strict_determinism=True,
+        )
+
+
+def test_compile_reuses_intact_outputs(tmp_path, monkeypatch) -> None:
+    row = ["binance", "BTCUSDT", "900", "1000", "true", "bid", "10", "1"]
+    path = _write_l2(tmp_path, [row])
+    out_dir = tmp_path / "out"
+    q = Quantizer.from_strings("1", "1")
+    first = compile_l2_csv(l2_path=path, output_dir=out_dir, quantizer=q)
+    manifest = first.manifest_path.read_bytes()
+
+    def _no_parse(*_args, **_kwargs):
+        raise AssertionError("inputs parsed again")
+
+    monkeypatch.setattr(compiler, "iter_l2_rows", _no_parse)
+    again = compile_l2_csv(
+        l2_path=path, output_dir=out_dir, quantizer=q, reuse_existing=True
+    )
+    assert again == first
+    assert first.manifest_path.read_bytes() == manifest
+    monkeypatch.undo()
+
+    # A different quantizer, or changed inputs/outputs, compile again.
+    other = Quantizer.from_strings("0.5", "1")
+    compile_l2_csv(
+        l2_path=path, output_dir=out_dir, quantizer=other, reuse_existing=True
+    )
+    assert first.manifest_path.read_bytes() != manifest
+    compile_l2_csv(l2_path=path, output_dir=out_dir, quantizer=q)
+    assert first.manifest_path.read_bytes() == manifest
+    first.index_path.write_bytes(b"")
+    result = compile_l2_csv(
+        l2_path=path, output_dir=out_dir, quantizer=q, reuse_existing=True
+    )
+    assert hash_file(result.index_path) == json.loads(manifest)["index"]["sha256"]
+
+
+def test_compile_reuse_ignores_quarantine_outputs(tmp_path) -> None:
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "900", "1000", "true", "bid", "10", "1"],
+            ["binance", "BTCUSDT", "905", "1000", "true", "ask", "11.5", "1"],
+            ["binance", "BTCUSDT", "910", "2000", "false", "ask", "12", "1"],
+        ],
+    )
+    out_dir = tmp_path / "out"
+    q = Quantizer.from_strings("1", "1")
+    skipped = compile_l2_csv(
+        l2_path=path,
+        output_dir=out_dir,
+        quantizer=q,
+        failure_policy=FailurePolicy.QUARANTINE,
+        quarantine_action=QuarantineAction.SKIP_ROW,
+    )
+    assert skipped.record_count == 2
+    manifest = json.loads(skipped.manifest_path.read_bytes())
+    assert manifest["failure_policy"] == "quarantine"
+    assert manifest["quarantine_action"] == "skip_row"
+    with pytest.raises(QuantizationError):
+        compile_l2_csv(
+            l2_path=path, output_dir=out_dir, quantizer=q, reuse_existing=True
+        )
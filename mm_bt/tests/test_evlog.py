@@ -1,9 +1,17 @@
+import struct
+
+import pytest
+
+from mm_bt.core import SchemaError
 from mm_bt.core import hash_json_bytes, hash_text_u64
 from mm_bt.core import Lots, Side, Ticks, TsNs
-from mm_bt.evlog import IndexEntry, read_index, write_index
+from mm_bt.evlog import IndexEntry, read_index, read_index_arrays, write_index
 from mm_bt.evlog import EvlogReader
-from mm_bt.evlog import L2Batch, L2Update
+from mm_bt.evlog import L2Batch, L2BatchArrays, L2Update
 from mm_bt.evlog import EvlogWriter
+from mm_bt.evlog import writer as writer_mod
+from mm_bt.evlog.format import L2_BATCH_HEADER_FMT, L2_UPDATE_FMT
+from mm_bt.evlog.reader import _decode_l2_payload
 
 
 def _batch(ts_recv: int, ts_exch: int, resets: bool, updates) -> L2Batch:
@@ -48,6 +56,9 @@ def test_evlog_roundtrip(tmp_path) -> None:
     assert [int(u.price_ticks) for u in out.updates] == [10, 11]
     assert [int(u.amount_lots) for u in out.updates] == [1, 2]
     assert [u.is_snapshot for u in out.updates] == [True, True]
+    # Ids are persisted in headers; their derivation must not change.
+    assert hash_text_u64("binance") == 4153827473758600025
+    assert hash_text_u64("BTCUSDT") == 16805322543783651865
 
 
 def test_evlog_index_seek(tmp_path) -> None:
@@ -99,3 +110,214 @@ def test_index_roundtrip(tmp_path) -> None:
     write_index(idx_path, entries)
     out = read_index(idx_path)
     assert out == entries
+    ts, offsets = read_index_arrays(idx_path)
+    assert (list(ts), list(offsets)) == ([1000, 2000], [16, 64])
+
+    data = idx_path.read_bytes()
+    header = data[: len(data) - 32]
+    for rows, match in (
+        ([(2000, 16), (1000, 64)], "not monotone"),
+        ([(1000, 64), (2000, 64)], "not increasing"),
+        ([(-1, 16)], "negative index timestamp"),
+        # The first offender wins, not the first failing column check.
+        ([(1000, 16), (900, 32), (2000, -1)], "not monotone at entry 1"),
+        ([(1000, 16), (2000, 16), (-1, 64)], "not increasing at entry 1"),
+    ):
+        idx_path.write_bytes(
+            header + b"".join(struct.pack("<q q", *row) for row in rows)
+        )
+        with pytest.raises(SchemaError, match=match):
+            read_index_arrays(idx_path)
+
+
+def test_decode_l2_payload_rejects_bad_updates() -> None:
+    def payload(*rows) -> bytes:
+        head = struct.pack(L2_BATCH_HEADER_FMT, 1, 1, 0, len(rows))
+        return head + b"".join(struct.pack(L2_UPDATE_FMT, *row) for row in rows)
+
+    good = (0, 1, 0, 10, 1, 0)
+    out = _decode_l2_payload(payload(good, (1, 0, 0, 11, 0, 0)))
+    assert [
+        (u.side, u.price_ticks, u.amount_lots, u.is_snapshot) for u in out.updates
+    ] == [(Side.BID, 10, 1, True), (Side.ASK, 11, 0, False)]
+    for bad in (
+        (2, 0, 0, 10, 1, 0),
+        (0, 2, 0, 10, 1, 0),
+        (0, 0, 0, 0, 1, 0),
+        (0, 0, 0, 10, -1, 0),
+    ):
+        with pytest.raises(SchemaError, match="at update 1"):
+            _decode_l2_payload(payload(good, bad, bad))
+    for bad in ((0, 0, 1, 10, 1, 0), (0, 0, 0, 10, 1, 7)):
+        with pytest.raises(SchemaError, match="reserved"):
+            _decode_l2_payload(payload(good, bad))
+
+
+def test_evlog_arrays_roundtrip(tmp_path) -> None:
+    path = tmp_path / "test.evlog"
+    batch = _batch(
+        1000,
+        900,
+        True,
+        [
+            L2Update(Side.BID, Ticks(10), Lots(1), True),
+            L2Update(Side.ASK, Ticks(11), Lots(0), False),
+        ],
+    )
+    with EvlogWriter(path) as writer:
+        writer.write_l2_batch_arrays(L2BatchArrays.from_batch(batch))
+        writer.write_l2_batch(batch)
+
+    with EvlogReader(path) as reader:
+        arrays = list(reader.iter_l2_batches_arrays())
+    with EvlogReader(path) as reader:
+        batches = list(reader.iter_l2_batches())
+    assert batches == [batch, batch]
+    assert [a.to_batch() for a in arrays] == [batch, batch]
+    assert list(arrays[0].sides) == [0, 1]
+    assert list(arrays[0].price_ticks) == [10, 11]
+
+    bad = L2BatchArrays.from_batch(batch)
+    bad.price_ticks[0] = 0
+    with EvlogWriter(path) as writer:
+        with pytest.raises(SchemaError):
+            writer.write_l2_batch_arrays(bad)
+
+
+def test_reader_rejects_truncated_record(tmp_path) -> None:
+    path = tmp_path / "test.evlog"
+    batch = _batch(1000, 900, True, [L2Update(Side.BID, Ticks(10), Lots(1), True)])
+    with EvlogWriter(path) as writer:
+        writer.write_l2_batch(batch)
+        writer.write_l2_batch(batch)
+    data = path.read_bytes()
+    for cut in (3, 30):
+        path.write_bytes(data[:-cut])
+        with EvlogReader(path) as reader:
+            batches = reader.iter_l2_batches()
+            assert next(batches) == batch
+            with pytest.raises(SchemaError):
+                next(batches)
+
+
+def test_writer_reports_first_bad_update(tmp_path) -> None:
+    batch = _batch(
+        1,
+        1,
+        False,
+        [
+            L2Update(Side.BID, Ticks(10), Lots(1), False),
+            L2Update(Side.BID, Ticks(10), Lots(-1), False),
+            L2Update(Side.BID, Ticks(0), Lots(1), False),
+        ],
+    )
+    with EvlogWriter(tmp_path / "test.evlog") as writer:
+        with pytest.raises(SchemaError, match="negative amount_lots at update 1"):
+            writer.write_l2_batch(batch)
+
+
+def test_writer_batches_records_in_one_write(tmp_path) -> None:
+    path = tmp_path / "test.evlog"
+    batches = [
+        _batch(1000, 900, True, [L2Update(Side.BID, Ticks(10), Lots(1), True)]),
+        _batch(2000, 1900, False, []),
+        _batch(3000, 2900, False, [L2Update(Side.ASK, Ticks(11), Lots(2), False)]),
+    ]
+    with EvlogWriter(path) as writer:
+        start = writer.tell()
+        offsets = writer.write_l2_batches(batches)
+        assert offsets[0] == start
+        assert writer.write_l2_batches([]) == []
+        end = writer.tell()
+
+    assert offsets == sorted(offsets)
+    assert end == path.stat().st_size
+    with EvlogReader(path) as reader:
+        assert list(reader.iter_l2_batches()) == batches
+
+
+def test_mmap_writer_matches_file_writer(tmp_path) -> None:
+    batches = [
+        _batch(
+            1000 * i,
+            900 * i,
+            i == 1,
+            [L2Update(Side.BID, Ticks(10 + i), Lots(i), False)] * i,
+        )
+        for i in range(1, 20)
+    ]
+    plain = tmp_path / "plain.evlog"
+    mapped = tmp_path / "mapped.evlog"
+    with EvlogWriter(plain) as writer:
+        for batch in batches:
+            writer.write_l2_batch(batch)
+    with EvlogWriter(mapped) as writer:
+        writer.open_mmap(64)
+        offsets = [writer.tell()]
+        for batch in batches:
+            writer.write_l2_batch(batch)
+            offsets.append(writer.tell())
+        with pytest.raises(SchemaError):
+            writer.open_mmap(64)
+
+    assert mapped.read_bytes() == plain.read_bytes()
+    assert offsets[-1] == mapped.stat().st_size
+    with EvlogReader(mapped) as reader:
+        assert list(reader.iter_l2_batches()) == batches
+
+
+def test_iter_l2_batches_raw(tmp_path) -> None:
+    path = tmp_path / "test.evlog"
+    batches = [
+        _batch(1000, 900, True, [L2Update(Side.BID, Ticks(10), Lots(1), True)]),
+        _batch(2000, 1900, False, []),
+    ]
+    with EvlogWriter(path) as writer:
+        for batch in batches:
+            writer.write_l2_batch(batch)
+
+    with EvlogReader(path) as reader:
+        raw = [
+            (ts_recv, ts_exch, resets, bytes(updates))
+            for ts_recv, ts_exch, resets, updates in reader.iter_l2_batches_raw()
+        ]
+    assert [r[:3] for r in raw] == [(1000, 900, True), (2000, 1900, False)]
+    assert list(struct.iter_unpack(L2_UPDATE_FMT, raw[0][3])) == [
+        (0, 1, 0, 10, 1, 0)
+    ]
+    assert raw[1][3] == b""
+
+    # Closing the reader mid-iteration releases the exported slice.
+    with EvlogReader(path) as reader:
+        it = reader.iter_l2_batches_raw()
+        _, _, _, updates = next(it)
+    with pytest.raises(ValueError):
+        updates[0]
+    it.close()
+
+
+@pytest.mark.parametrize("has_writev", [True, False])
+def test_writer_queues_and_flushes_records(
+    tmp_path, monkeypatch, has_writev
+) -> None:
+    monkeypatch.setattr(writer_mod, "_PENDING_LIMIT", 200)
+    monkeypatch.setattr(writer_mod, "_IOV_MAX", 2)
+    monkeypatch.setattr(writer_mod, "_HAS_WRITEV", has_writev)
+    path = tmp_path / "test.evlog"
+    batches = [
+        _batch(
+            1000 * i,
+            900 * i,
+            False,
+            [L2Update(Side.ASK, Ticks(i), Lots(1), False)],
+        )
+        for i in range(1, 30)
+    ]
+    with EvlogWriter(path) as writer:
+        offsets = [writer.tell()]
+        for batch in batches:
+            writer.write_l2_batch(batch)
+            offsets.append(writer.tell())
+    assert offsets[-1] == path.stat().st_size
+    with EvlogReader(path) as reader:
+        assert list(reader.iter_l2_batches()) == batches
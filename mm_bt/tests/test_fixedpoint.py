@@ -39,3 +39,16 @@ def test_quantizer_validates_increments() -> None:
         Quantizer(Decimal("0"), Decimal("1"))
     with pytest.raises(QuantizationError):
         Quantizer(Decimal("-1"), Decimal("1"))
+
+
+def test_quantize_fast_path_matches_decimal_forms() -> None:
+    q = Quantizer.from_strings("0.05", "0.001")
+    assert int(q.quantize_price(" 10.0500 ")) == 201
+    assert int(q.quantize_price("10.")) == 200
+    assert int(q.quantize_price("1.005E1")) == 201
+    assert int(q.quantize_amount("0.000")) == 0
+    with pytest.raises(QuantizationError):
+        q.quantize_price("10.01")
+    with pytest.raises(QuantizationError):
+        q.quantize_price("10.0x")
+
@@ -77,3 +77,23 @@ def test_infer_increments_uses_first_1000_rows(tmp_path) -> None:
     price_inc, amount_inc = infer_l2_increments([path])
     assert price_inc == "0.5"
     assert amount_inc == "0.1"
+
+
+def test_infer_increments_mixed_number_forms(tmp_path) -> None:
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "1", "1", "true", "bid", " 10.50", "2E+1"],
+            ["binance", "BTCUSDT", "2", "1", "true", "ask", "1.1E1", "0.00"],
+            ["binance", "BTCUSDT", "3", "2", "false", "bid", "12", "30"],
+        ],
+    )
+    assert infer_l2_increments([path]) == ("0.50", "10")
+
+    path = _write_l2(
+        tmp_path,
+        [["binance", "BTCUSDT", "1", "1", "true", "bid", "-1.5", "1"]],
+        name="neg.csv",
+    )
+    with pytest.raises(SchemaError, match="price negative"):
+        infer_l2_increments([path])
@@ -1,7 +1,11 @@
+import dataclasses
+import functools
+
 import pytest
 
 from mm_bt.core import SchemaError
 from mm_bt.io import StaticJsonProvider, TardisInstrumentMetaApiProvider
+from mm_bt.io.instrument_meta import _call_instruments_fn
 
 
 def _write_meta(tmp_path, payload) -> str:
@@ -22,6 +26,12 @@ def test_static_meta_load_and_get(tmp_path) -> None:
     meta = provider.get("binance", "BTCUSDT", "2020-01-01")
     assert meta.price_increment == "0.01"
     assert meta.amount_increment == "0.001"
+    assert StaticJsonProvider(path).get("binance", "BTCUSDT", "2020-01-01") is meta
+
+    # A rewritten file is parsed again.
+    _write_meta(tmp_path, payload.replace('"0.01"', '"0.5"'))
+    provider = StaticJsonProvider(path)
+    assert provider.get("binance", "BTCUSDT", "2020-01-01").price_increment == "0.5"
 
 
 def test_static_meta_rejects_missing_fields(tmp_path) -> None:
@@ -112,3 +122,116 @@ def test_tardis_meta_provider_rejects_missing_symbol() -> None:
     provider = TardisInstrumentMetaApiProvider(fetcher=_fetcher)
     with pytest.raises(SchemaError):
         provider.get("binance", "BTCUSDT", "2020-01-01")
+
+
+def test_static_meta_quantizer_built_once(tmp_path) -> None:
+    payload = """
+    {"version":0,"instruments":[
+        {"exchange":"binance","symbol":"BTCUSDT","date":"2020-01-02",
+         "price_increment":"0.01","amount_increment":"0.001"}
+    ]}
+    """
+    meta = StaticJsonProvider(_write_meta(tmp_path, payload)).get(
+        "binance", "BTCUSDT", "2020-01-02"
+    )
+    quantizer = meta.quantizer()
+    assert meta.quantizer() is quantizer
+    assert int(quantizer.quantize_price("10.01")) == 1001
+    assert dataclasses.replace(meta, symbol="ETHUSDT").quantizer() is quantizer
+
+
+def test_call_instruments_fn_remembers_signature() -> None:
+    calls = []
+
+    def get_instruments(**kwargs):
+        calls.append(sorted(kwargs))
+        if "date" in kwargs:
+            raise TypeError("got an unexpected keyword argument 'date'")
+        return []
+
+    for expected in (4, 5):
+        out = _call_instruments_fn(
+            get_instruments,
+            exchange="binance",
+            date="2020-01-01",
+            symbol="BTCUSDT",
+            api_key=None,
+        )
+        assert out == []
+        assert len(calls) == expected
+    assert calls[-1] == ["exchange", "from_date", "symbols", "to_date"]
+
+
+def test_tardis_meta_cache_appends_lines(tmp_path) -> None:
+    def _fetcher(*, symbol, **_kwargs):
+        return [{"symbol": symbol, "priceIncrement": "0.1", "amountIncrement": "1"}]
+
+    cache = tmp_path / "cache.json"
+    # A version 0 cache is read, then rewritten as lines on the next fetch.
+    cache.write_text(
+        '{"version":0,"instruments":[{"exchange":"binance","symbol":"A",'
+        '"date":"2020-01-01","price_increment":"1","amount_increment":"1"}]}',
+        encoding="utf-8",
+    )
+    provider = TardisInstrumentMetaApiProvider(cache_path=cache, fetcher=_fetcher)
+    provider.get("binance", "B", "2020-01-01")
+    lines = cache.read_bytes().splitlines()
+    assert len(lines) == 3
+    provider.get("binance", "C", "2020-01-01")
+    assert cache.read_bytes().splitlines()[:3] == lines
+
+    reloaded = TardisInstrumentMetaApiProvider(
+        cache_path=cache, fetcher=lambda **_kwargs: []
+    )
+    for symbol, increment in (("A", "1"), ("B", "0.1"), ("C", "0.1")):
+        meta = reloaded.get("binance", symbol, "2020-01-01")
+        assert meta.price_increment == increment
+
+
+def test_call_instruments_fn_reads_signature() -> None:
+    calls = []
+
+    def _list(exchange, *, from_date, to_date, api_key=None):
+        return []
+
+    # inspect.signature sees _list's signature through __wrapped__; the
+    # wrapper records every call, including ones _list would reject.
+    @functools.wraps(_list)
+    def list_instruments(*args, **kwargs):
+        calls.append(sorted(kwargs))
+        return _list(*args, **kwargs)
+
+    assert (
+        _call_instruments_fn(
+            list_instruments,
+            exchange="deribit",
+            date="2020-01-01",
+            symbol="BTC-PERPETUAL",
+            api_key="k",
+        )
+        == []
+    )
+    assert calls == [["api_key", "exchange", "from_date", "to_date"]]
+
+
+def test_static_meta_get_range(tmp_path) -> None:
+    entry = (
+        '{"exchange":"binance","symbol":"%s","date":"%s",'
+        '"price_increment":"%s","amount_increment":"0.001"}'
+    )
+    entries = [
+        entry % ("BTCUSDT", "2020-01-03", "0.03"),
+        entry % ("BTCUSDT", "2020-01-01", "0.01"),
+        entry % ("ETHUSDT", "2020-01-02", "0.1"),
+        entry % ("BTCUSDT", "2020-01-02", "0.02"),
+    ]
+    payload = '{"version":0,"instruments":[%s]}' % ",".join(entries)
+    provider = StaticJsonProvider(_write_meta(tmp_path, payload))
+    out = provider.get_range("binance", "BTCUSDT", "2020-01-02", "2020-01-09")
+    assert [meta.price_increment for meta in out] == ["0.02", "0.03"]
+    assert out[0] is provider.get("binance", "BTCUSDT", "2020-01-02")
+    out = provider.get_range("binance", "BTCUSDT", "2019-01-01", "2020-01-01")
+    assert [meta.date for meta in out] == ["2020-01-01"]
+    assert provider.get_range("binance", "XRPUSDT", "2020-01-01", "2020-12-31") == ()
+    with pytest.raises(SchemaError):
+        provider.get_range("binance", "BTCUSDT", "2020-1-1", "2020-01-02")
@@ -4,7 +4,7 @@ from mm_bt.core import FailurePolicy, QuarantineAction
 from mm_bt.core import OrderingError, QuantizationError, SchemaError
 from mm_bt.core import Quantizer
 from mm_bt.core import Side
-from mm_bt.ingest import iter_l2_batches
+from mm_bt.ingest import iter_l2_batches, iter_l2_batches_arrays
 from mm_bt.ingest import ListQuarantineSink
 from mm_bt.io import L2Row
 
@@ -333,3 +333,93 @@ def test_quarantine_skip_batch() -> None:
     assert len(sink.records) == 1
     assert len(batches) == 1
     assert int(batches[0].ts_recv_ns) == 2000 * 1_000
+
+
+def test_iter_l2_batches_arrays_matches_batches() -> None:
+    q = Quantizer.from_strings("1", "1")
+    rows = [
+        _row(
+            line=2,
+            local_ts=1000,
+            exch_ts=900,
+            is_snapshot=True,
+            side=Side.BID,
+            price="10",
+            amount="1",
+        ),
+        _row(
+            line=3,
+            local_ts=1000,
+            exch_ts=901,
+            is_snapshot=True,
+            side=Side.ASK,
+            price="11",
+            amount="2",
+        ),
+        _row(
+            line=4,
+            local_ts=2000,
+            exch_ts=902,
+            is_snapshot=False,
+            side=Side.BID,
+            price="10",
+            amount="0",
+        ),
+    ]
+    batches = list(
+        iter_l2_batches(rows, q, failure_policy=FailurePolicy.HARD_FAIL)
+    )
+    arrays = list(
+        iter_l2_batches_arrays(rows, q, failure_policy=FailurePolicy.HARD_FAIL)
+    )
+    assert [a.to_batch() for a in arrays] == batches
+    assert list(arrays[0].is_snapshot) == [1, 1]
+    assert list(arrays[1].amount_lots) == [0]
+
+
+def test_out_of_range_values_follow_failure_policy() -> None:
+    q = Quantizer.from_strings("0.01", "1")
+    rows = [
+        _row(
+            line=2,
+            local_ts=1000,
+            exch_ts=900,
+            is_snapshot=True,
+            side=Side.BID,
+            price="100000000000000000000",
+            amount="1",
+        ),
+        _row(
+            line=3,
+            local_ts=1000,
+            exch_ts=901,
+            is_snapshot=True,
+            side=Side.BID,
+            price="10",
+            amount="10000000000000000000",
+        ),
+        _row(
+            line=4,
+            local_ts=1000,
+            exch_ts=902,
+            is_snapshot=True,
+            side=Side.ASK,
+            price="11",
+            amount="2",
+        ),
+    ]
+    with pytest.raises(QuantizationError, match="price_ticks out of int64"):
+        list(iter_l2_batches(rows, q, failure_policy=FailurePolicy.HARD_FAIL))
+    sink = ListQuarantineSink()
+    batches = list(
+        iter_l2_batches_arrays(
+            rows,
+            q,
+            failure_policy=FailurePolicy.QUARANTINE,
+            quarantine_action=QuarantineAction.SKIP_ROW,
+            quarantine_sink=sink,
+        )
+    )
+    assert [r.line_number for r in sink.records] == [2, 3]
+    assert "amount_lots out of int64" in sink.records[1].reason
+    assert [list(b.price_ticks) for b in batches] == [[1100]]
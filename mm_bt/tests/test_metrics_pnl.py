@@ -1,7 +1,10 @@
+from fractions import Fraction
+
 import pytest
 
 from mm_bt.core import SchemaError
 from mm_bt.metrics import returns_from_equity
+from mm_bt.metrics.pnl import _round_half_even
 
 
 def test_returns_from_equity() -> None:
@@ -20,3 +23,20 @@ def test_returns_rounds_half_even() -> None:
     assert returns == (0,)
     returns = returns_from_equity([0, 3], initial_cash=20000)
     assert returns == (2,)
+    returns = returns_from_equity([0, -1, -4, -9], initial_cash=20000)
+    assert returns == (0, -2, -2)
+    with pytest.raises(SchemaError):
+        returns_from_equity([0, 1.5], initial_cash=20000)
+
+
+def test_round_half_even_matches_fraction_rounding() -> None:
+    for denom in range(1, 13):
+        for numer in range(-60, 61):
+            assert _round_half_even(numer, denom) == round(Fraction(numer, denom))
+        equity = list(range(-30, 31, 3))
+        assert returns_from_equity(equity, initial_cash=denom) == tuple(
+            _round_half_even((b - a) * 10_000, denom)
+            for a, b in zip(equity, equity[1:])
+        )
+    with pytest.raises(SchemaError):
+        _round_half_even(1, 0)
@@ -1,5 +1,9 @@
+import math
+import statistics
+
 from mm_bt.experiments import (
     deflated_sharpe_ratio,
+    deflated_sharpe_ratios,
     probabilistic_sharpe_ratio,
     sharpe_ratio,
 )
@@ -27,9 +31,19 @@ def test_dsr_decreases_with_trials() -> None:
         returns, sr_benchmark=0.0, n_trials=100
     )
     assert dsr_large <= dsr_small
+    assert deflated_sharpe_ratios(
+        returns, sr_benchmark=0.0, n_trials=[10, 100]
+    ) == [dsr_small, dsr_large]
 
 
 def test_psr_output_range() -> None:
     returns = [0, -10, 0, 10]
     psr = probabilistic_sharpe_ratio(returns, sr_benchmark=0.0)
     assert 0.0 <= psr <= 1.0
+
+
+def test_sharpe_matches_sample_stdev() -> None:
+    returns = [5, -3, 12, 0, 7, -9, 4]
+    values = [r / 10_000 for r in returns]
+    expected = statistics.mean(values) / statistics.stdev(values)
+    assert math.isclose(sharpe_ratio(returns), expected, rel_tol=1e-12)
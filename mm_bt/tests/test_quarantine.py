@@ -2,6 +2,8 @@ import json
 
 from mm_bt.core import Side
 from mm_bt.ingest import JsonlQuarantineSink, QuarantineRecord
+from mm_bt.ingest.quarantine import _normalize_payload
+from mm_bt.io.tardis_csv import L2Row
 
 
 def test_jsonl_quarantine_sink(tmp_path) -> None:
@@ -18,3 +20,14 @@ def test_jsonl_quarantine_sink(tmp_path) -> None:
     data = json.loads(path.read_text(encoding="utf-8"))
     assert data["reason"] == "bad row"
     assert data["payload"]["side"] == "bid"
+
+
+def test_jsonl_quarantine_sink_named_tuple_payload(tmp_path) -> None:
+    row = L2Row("binance", "BTCUSDT", 1, 2, True, Side.ASK, "1.5", "0", 7, "x.csv")
+    assert _normalize_payload(row) == _normalize_payload(row._asdict())
+    assert _normalize_payload({"rows": (row,)})["rows"][0]["side"] == "ask"
+
+    path = tmp_path / "quarantine.jsonl"
+    with JsonlQuarantineSink(path) as sink:
+        sink.record(QuarantineRecord("bad row", "x.csv", 7, row))
+    assert json.loads(path.read_text(encoding="utf-8"))["payload"]["price"] == "1.5"
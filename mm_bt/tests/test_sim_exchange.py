@@ -2,10 +2,10 @@ import pytest
 
 from mm_bt.core import SchemaError
 from mm_bt.core import Quantizer
-from mm_bt.core import Lots, QuoteAtoms, Side
+from mm_bt.core import Lots, QuoteAtoms, Side, Ticks
 from mm_bt.ingest import compile_l2_csv
 from mm_bt.sim import RunConfig, run_backtest
-from mm_bt.sim import FixedBpsFeeModel
+from mm_bt.sim import FixedBpsFeeModel, Portfolio
 from mm_bt.strategy import MarketOrder
 from mm_bt.strategy import AlternatingMarketOrderStrategy
 from mm_bt.experiments import sharpe_ratio
@@ -65,6 +65,7 @@ def test_run_backtest_dummy_strategy(tmp_path) -> None:
     )
     assert len(run.fills) == 4
     assert len(run.equity_curve) == 4
+    assert [ts for ts, _ in run.equity_curve] == [1000000, 2000000, 3000000, 4000000]
     assert len(run.returns) == 3
     expected_returns = [0, -10, 0]
     assert list(run.returns) == expected_returns
@@ -257,3 +258,108 @@ def test_skip_initial_missing_book(tmp_path) -> None:
         config=config,
     )
     assert len(run.fills) == 2
+
+
+def test_fills_match_fee_model_and_portfolio(tmp_path) -> None:
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "900", "1000", "true", "bid", "97", "5"],
+            ["binance", "BTCUSDT", "905", "1000", "true", "ask", "103", "5"],
+            ["binance", "BTCUSDT", "910", "2000", "false", "bid", "99", "5"],
+            ["binance", "BTCUSDT", "915", "3000", "false", "ask", "101", "5"],
+            ["binance", "BTCUSDT", "920", "4000", "false", "bid", "98", "5"],
+        ],
+    )
+    q = Quantizer.from_strings("1", "1")
+    result = compile_l2_csv(
+        l2_path=path,
+        output_dir=tmp_path / "out",
+        quantizer=q,
+    )
+    seen = []
+
+    class RecordingStrategy(AlternatingMarketOrderStrategy):
+        def on_batch(self, ctx, book):
+            seen.append((int(ctx.cash), int(ctx.position)))
+            return super().on_batch(ctx, book)
+
+    config = RunConfig(
+        initial_cash=QuoteAtoms(1000),
+        initial_position=Lots(0),
+        allow_short=False,
+        allow_margin=False,
+        sr_benchmark=0.0,
+        dsr_trials=10,
+    )
+    fees = FixedBpsFeeModel(30)
+    run = run_backtest(
+        evlog_path=result.evlog_path,
+        index_path=result.index_path,
+        strategy=RecordingStrategy(Lots(3)),
+        fee_model=fees,
+        config=config,
+    )
+    portfolio = Portfolio(cash=QuoteAtoms(1000), position=Lots(0))
+    ledger = [(1000, 0)]
+    for fill in run.fills:
+        assert fill.notional == fill.price_ticks * fill.qty_lots
+        assert fill.fee_atoms == fees.fee_atoms(fill.notional)
+        portfolio.apply_fill(
+            side=fill.side,
+            price_ticks=fill.price_ticks,
+            qty_lots=fill.qty_lots,
+            fee_atoms=fill.fee_atoms,
+            allow_short=False,
+            allow_margin=False,
+        )
+        ledger.append((int(portfolio.cash), int(portfolio.position)))
+    assert [f.price_ticks for f in run.fills] == [103, 99, 101, 99]
+    assert seen == ledger[:-1]
+    assert run.equity_curve[-1][1] == portfolio.equity(Ticks(99))
+
+
+def test_snapshot_reused_while_top_unchanged(tmp_path) -> None:
+    path = _write_l2(
+        tmp_path,
+        [
+            ["binance", "BTCUSDT", "900", "1000", "true", "bid", "10", "5"],
+            ["binance", "BTCUSDT", "905", "1000", "true", "ask", "11", "5"],
+            ["binance", "BTCUSDT", "910", "2000", "false", "bid", "9", "5"],
+            ["binance", "BTCUSDT", "915", "3000", "false", "ask", "12", "5"],
+            ["binance", "BTCUSDT", "920", "4000", "false", "bid", "10", "4"],
+        ],
+    )
+    q = Quantizer.from_strings("1", "1")
+    result = compile_l2_csv(
+        l2_path=path,
+        output_dir=tmp_path / "out",
+        quantizer=q,
+    )
+    seen = []
+
+    class RecordingStrategy:
+        def on_batch(self, ctx, book):
+            seen.append(book)
+            if len(seen) in (1, 4):
+                return (MarketOrder(side=Side.BID, qty_lots=Lots(1)),)
+            return ()
+
+    config = RunConfig(
+        initial_cash=QuoteAtoms(1000),
+        initial_position=Lots(0),
+        allow_short=False,
+        allow_margin=False,
+        sr_benchmark=0.0,
+        dsr_trials=10,
+    )
+    run_backtest(
+        evlog_path=result.evlog_path,
+        index_path=result.index_path,
+        strategy=RecordingStrategy(),
+        fee_model=FixedBpsFeeModel(0),
+        config=config,
+    )
+    assert len(seen) == 4
+    assert seen[0] is seen[1] is seen[2]
+    assert (seen[3].bid_px, seen[3].bid_qty, seen[3].ask_px) == (10, 4, 11)
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from mm_bt.core import SchemaError
@@ -82,3 +84,22 @@ def test_random_strategy_rejects_invalid_inputs() -> None:
             min_qty_lots=Lots(2),
             max_qty_lots=Lots(1),
         )
+
+
+def test_random_strategy_matches_randrange_stream() -> None:
+    for seed, order_pct, max_qty in ((3, 37, 5), (11, 100, 9), (5, 99, 1)):
+        s = RandomMarketOrderStrategy(
+            seed=seed,
+            order_pct=order_pct,
+            min_qty_lots=Lots(1),
+            max_qty_lots=Lots(max_qty),
+        )
+        rng = random.Random(seed)
+        for i in range(500):
+            expected = ()
+            if order_pct == 100 or rng.randrange(100) < order_pct:
+                side = Side.BID if rng.randrange(2) == 0 else Side.ASK
+                qty = 1 if max_qty == 1 else rng.randrange(1, max_qty + 1)
+                expected = ((side, qty),)
+            out = s.on_batch(_ctx(i), _book())
+            assert tuple((o.side, o.qty_lots) for o in out) == expected
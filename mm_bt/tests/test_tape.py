@@ -2,6 +2,7 @@ import json
 
 from mm_bt.core import Lots, QuoteAtoms, Side, Ticks, TsNs
 from mm_bt.sim import TapeWriter
+from mm_bt.sim import tape as tape_mod
 
 
 def test_tape_writer_records(tmp_path) -> None:
@@ -43,3 +44,40 @@ def test_tape_writer_records(tmp_path) -> None:
     assert fill["fill_id"] == 1
     equity = json.loads(lines[3])
     assert equity["type"] == "equity"
+
+
+def test_tape_lines_match_json_encoder(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(tape_mod, "_FLUSH_SIZE", 100)
+    path = tmp_path / "tape.jsonl"
+    with TapeWriter(path) as tape:
+        for i in range(1, 4):
+            tape.record_action(
+                ts_recv_ns=TsNs(1000 * i),
+                action_id=i,
+                side=Side.ASK,
+                qty_lots=Lots(i),
+            )
+            tape.record_fill(
+                ts_recv_ns=TsNs(1000 * i),
+                fill_id=i,
+                action_id=i,
+                side=Side.BID,
+                price_ticks=Ticks(10),
+                qty_lots=Lots(i),
+                notional=QuoteAtoms(10 * i),
+                fee_atoms=QuoteAtoms(0),
+            )
+            tape.record_equity(
+                ts_recv_ns=TsNs(1000 * i),
+                cash=QuoteAtoms(-5 * i),
+                position=Lots(-i),
+                equity=QuoteAtoms(-15 * i),
+            )
+        assert len(tape._buf) < 100
+
+    lines = path.read_bytes().splitlines(keepends=True)
+    assert len(lines) == 9
+    for line in lines:
+        assert line == tape_mod._json_line(json.loads(line))
+    assert json.loads(lines[0])["side"] == "ask"
+    assert json.loads(lines[1])["side"] == "bid"
@@ -1,8 +1,12 @@
+import gzip
+
 import pytest
 
-from mm_bt.core import SchemaError
+from mm_bt.core import HashingReader, SchemaError
 from mm_bt.core import Side
-from mm_bt.io import iter_l2_rows
+from mm_bt.core import hash_file
+from mm_bt.io import L2_HEADER, iter_l2_rows
+from mm_bt.io import tardis_csv
 
 
 def _write_l2(tmp_path, rows) -> str:
@@ -97,3 +101,58 @@ def test_iter_l2_rows_rejects_empty_symbol(tmp_path) -> None:
     )
     with pytest.raises(SchemaError):
         list(iter_l2_rows(path))
+
+
+def test_iter_l2_rows_from_hashing_reader(tmp_path) -> None:
+    path = tmp_path / "l2.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+        f.write(",".join(L2_HEADER) + "\n")
+        f.write("binance,BTCUSDT,1,2,true,bid,10,1\n")
+    with HashingReader(path.open("rb")) as reader:
+        rows = list(iter_l2_rows(path, fileobj=reader))
+        assert not reader.closed
+        reader.drain()
+        assert reader.hexdigest() == hash_file(path)
+    assert [row.price for row in rows] == ["10"]
+
+
+def test_iter_l2_rows_chunks_keep_rows_before_error(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(tardis_csv, "_CHUNK_ROWS", 2)
+    good = ["binance", "BTCUSDT", "100", "200", "TRUE", "Ask", "1.0", "2.0"]
+    path = _write_l2(tmp_path, [good, good, good, good[:4] + ["x"] + good[5:]])
+    rows = iter_l2_rows(path)
+    assert [next(rows).line_number for _ in range(3)] == [2, 3, 4]
+    with pytest.raises(SchemaError, match="is_snapshot invalid"):
+        next(rows)
+
+    path = _write_l2(tmp_path, [good] * 5)
+    rows = list(iter_l2_rows(path))
+    assert [row.line_number for row in rows] == [2, 3, 4, 5, 6]
+    assert {(row.is_snapshot, row.side, row.source) for row in rows} == {
+        (True, Side.ASK, path)
+    }
+
+
+def test_iter_l2_rows_quoted_lines_use_csv_reader(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(tardis_csv, "_CHUNK_ROWS", 2)
+    good = ["binance", "BTCUSDT", "100", "200", "false", "bid", "1.0", "2.0"]
+    quoted = ['"binance"', "BTCUSDT", "101", "201", "false", "ask", '"1.5"', "2.0"]
+    path = _write_l2(tmp_path, [good, good, good, quoted, good])
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(",".join(good) + "\r\n")
+    rows = list(iter_l2_rows(path))
+    assert [row.line_number for row in rows] == [2, 3, 4, 5, 6, 7]
+    assert (rows[3].exchange, rows[3].price, rows[3].side) == (
+        "binance",
+        "1.5",
+        Side.ASK,
+    )
+    assert rows[-1] == rows[0]._replace(line_number=7)
+
+
+def test_iter_l2_rows_interns_repeated_strings(tmp_path) -> None:
+    good = ["binance", "BTCUSDT", "100", "200", "false", "bid", "1.0", "2.0"]
+    rows = list(iter_l2_rows(_write_l2(tmp_path, [good, good])))
+    assert rows[0].exchange is rows[1].exchange
+    assert rows[0].symbol is rows[1].symbol
+    assert rows[0].source is rows[1].source
@@ -2,7 +2,9 @@ import gzip
 
 import pytest
 
+from mm_bt.cli import tardis_download as cli
 from mm_bt.core import SchemaError
+from mm_bt.io import download_many
 from mm_bt.io import tardis_download
 from mm_bt.io.tardis_download import build_download_plan
 from mm_bt.io.tardis_download import canonical_tardis_path, download_tardis_csv_gz
@@ -141,3 +143,105 @@ def test_relocates_flat_download(tmp_path, monkeypatch) -> None:
     assert out == expected
     assert expected.exists()
     assert not flat.exists()
+
+
+def test_cli_concurrent_downloads_report_in_order(
+    tmp_path, monkeypatch, capsys
+) -> None:
+    class _Datasets:
+        def download(self, *, symbols, from_date, **_kwargs) -> None:
+            if symbols[0] == "MISSING":
+                raise Exception("404 Not Found")
+            path = canonical_tardis_path(
+                root=tmp_path,
+                exchange="binance",
+                data_type="incremental_book_L2",
+                date=from_date,
+                symbol=symbols[0],
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+
+    monkeypatch.setattr(tardis_download, "_require_tardis_dev", lambda: _Datasets())
+    argv = ["--out-root", str(tmp_path), "--exchange", "binance"]
+    for symbol in ("AAA", "MISSING", "BBB"):
+        argv += ["--symbol", symbol]
+    argv += [
+        "--date",
+        "2020-01-01",
+        "--on-missing",
+        "skip",
+        "--no-validate-header",
+        "--concurrency",
+        "3",
+    ]
+    assert cli.main(argv) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].endswith("AAA.csv.gz")
+    assert lines[1].startswith("missing binance")
+    assert lines[2].endswith("BBB.csv.gz")
+
+
+def test_download_many_keeps_plan_order(tmp_path, monkeypatch) -> None:
+    class _Datasets:
+        def download(self, *, symbols, from_date, download_dir, **_kwargs) -> None:
+            if symbols[0] == "MISSING":
+                raise Exception("404 Not Found")
+            flat = f"binance_incremental_book_L2_{from_date}_{symbols[0]}.csv.gz"
+            (tmp_path / flat).write_bytes(b"")
+            assert download_dir == str(tmp_path)
+
+    monkeypatch.setattr(tardis_download, "_require_tardis_dev", lambda: _Datasets())
+    plans = [
+        build_download_plan(
+            root=tmp_path,
+            exchange="binance",
+            data_type="incremental_book_L2",
+            date="2020-01-01",
+            symbol=symbol,
+        )
+        for symbol in ("AAA", "MISSING", "BBB")
+    ]
+    out = download_many(plans, validate_header=False, skip_missing=True)
+    assert out == [plans[0].target_path, None, plans[2].target_path]
+    with pytest.raises(tardis_download.DownloadNotFound):
+        download_many(plans, if_exists="skip", validate_header=False, concurrency=1)
+
+
+def test_validate_l2_gz_header_line_endings(tmp_path) -> None:
+    header = "exchange,symbol,timestamp,local_timestamp,is_snapshot,side,price,amount"
+    path = tmp_path / "l2.csv.gz"
+    for text in (header, header + "\r\n", '"exchange"' + header[8:] + "\n"):
+        with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+            f.write(text)
+        validate_l2_gz_header(path)
+    for data in (b"", b"\xff\xfe\n"):
+        with gzip.open(path, "wb") as f:
+            f.write(data)
+        with pytest.raises(SchemaError):
+            validate_l2_gz_header(path)
+    path.write_bytes(b"not gzip")
+    with pytest.raises(SchemaError, match="invalid gzip"):
+        validate_l2_gz_header(path)
+
+
+def test_find_flat_downloads_matches_literally(tmp_path) -> None:
+    names = [
+        "binance_incremental_book_L2_2020-01-01_BTC[X].csv.gz",
+        "binance_incremental_book_L2_2020-01-01_BTC[X]_2.csv.gz",
+        "binance_incremental_book_L2_2020-01-01_BTCX.csv.gz",
+        "binance_incremental_book_L2_2020-01-01_BTC[X].csv",
+    ]
+    (tmp_path / "binance").mkdir()
+    for name in names[:2]:
+        (tmp_path / "binance" / name).write_bytes(b"")
+    for name in names[2:]:
+        (tmp_path / name).write_bytes(b"")
+    out = tardis_download._find_flat_downloads(
+        root=tmp_path,
+        exchange="binance",
+        data_type="incremental_book_L2",
+        date="2020-01-01",
+        symbol="BTC[X]",
+    )
+    assert out == tuple(tmp_path / "binance" / name for name in names[:2])
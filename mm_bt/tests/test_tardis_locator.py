@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -117,3 +118,52 @@ def test_locator_rejects_bad_date(tmp_path) -> None:
             date="20200101",
             symbol_or_group="BTCUSDT",
         )
+
+
+def test_locator_rescans_changed_dir(tmp_path) -> None:
+    root = tmp_path / "data"
+    dir_path = root / "binance" / "incremental_book_L2" / "2020-01-01"
+    dir_path.mkdir(parents=True)
+    p1 = dir_path / "BTCUSDT-1.csv.gz"
+    _touch(p1)
+    kwargs = dict(
+        root=root,
+        exchange="binance",
+        data_type="incremental_book_L2",
+        date="2020-01-01",
+        symbol_or_group="BTCUSDT",
+    )
+    assert locate_tardis_files(**kwargs) == (p1,)
+    assert locate_tardis_files(**kwargs) == (p1,)
+
+    p2 = dir_path / "BTCUSDT-2.csv.gz"
+    _touch(p2)
+    # Pin a distinct mtime so the change is visible on coarse clocks too.
+    st = dir_path.stat()
+    os.utime(dir_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert locate_tardis_files(**kwargs) == (p1, p2)
+
+
+def test_locator_skips_non_files_and_follows_links(tmp_path) -> None:
+    root = tmp_path / "data"
+    base = root / "binance" / "incremental_book_L2"
+    dir_path = base / "2020-01-01"
+    dir_path.mkdir(parents=True)
+    (dir_path / "BTCUSDT-0.csv.gz").mkdir()
+    _touch(dir_path / "BTCUSDT.txt")
+    target = tmp_path / "elsewhere.csv.gz"
+    _touch(target)
+    link = dir_path / "BTCUSDT-1.csv.gz"
+    link.symlink_to(target)
+    kwargs = dict(
+        root=root,
+        exchange="binance",
+        data_type="incremental_book_L2",
+        date="2020-01-01",
+        symbol_or_group="BTCUSDT",
+    )
+    assert locate_tardis_files(**kwargs) == (link,)
+
+    _touch(base / "BTCUSDT")
+    with pytest.raises(SchemaError, match="not a directory"):
+        locate_tardis_files(**kwargs)